@@ -0,0 +1,323 @@
+"""Kasus benchmark: setiap jalur perhitungan aplikasi pada beberapa ukuran masalah.
+
+Setiap kasus adalah fungsi ``siapkan(ukuran)`` yang membangkitkan input
+(tidak ikut diukur) dan mengembalikan fungsi tanpa argumen yang diukur.
+Ukuran profil ``cepat`` dipakai untuk pemeriksaan sehari-hari, ``penuh``
+mencakup seluruh rentang (sampai 10k produk, 1M SKU, 5 tahun, 10M baris).
+"""
+from dataclasses import dataclass
+from typing import Callable
+
+import numpy as np
+
+
+@dataclass
+class Kasus:
+    nama: str
+    siapkan: Callable
+    cepat: list
+    penuh: list
+    satuan: str
+    keterangan: str
+
+
+KASUS = {}
+
+
+def kasus(cepat, penuh, satuan):
+    def daftar(siapkan):
+        KASUS[siapkan.__name__] = Kasus(siapkan.__name__, siapkan, cepat, penuh, satuan,
+                                        (siapkan.__doc__ or "").strip())
+        return siapkan
+    return daftar
+
+
+def _lp_acak(n, m=20, seed=0):
+    rng = np.random.default_rng(seed)
+    keuntungan = rng.uniform(10, 50, n)
+    konsumsi = rng.uniform(0, 5, (m, n)) * (rng.random((m, n)) < 0.5)
+    konsumsi[rng.integers(0, m, n), np.arange(n)] += 1.0  # setiap produk memakai sumber daya
+    kapasitas = konsumsi.sum(axis=1) * rng.uniform(2, 10, m)
+    return keuntungan, konsumsi, kapasitas
+
+
+# --- Optimasi produksi (studi_kasus.py / mtk2.py, tab LP) ---
+
+@kasus(cepat=[2, 100, 1_000], penuh=[2, 10, 100, 1_000, 10_000], satuan="produk")
+def lp_selesaikan(n):
+    """LP produksi, 20 sumber daya."""
+    from mtk import optimasi
+
+    keuntungan, konsumsi, kapasitas = _lp_acak(n)
+    return lambda: optimasi.selesaikan(keuntungan, konsumsi, kapasitas)
+
+
+@kasus(cepat=[2, 100, 1_000], penuh=[2, 10, 100, 1_000, 10_000], satuan="produk")
+def lp_sensitivitas(n):
+    """LP + ranging biaya dan kapasitas, 20 sumber daya."""
+    from mtk import optimasi
+
+    keuntungan, konsumsi, kapasitas = _lp_acak(n)
+    return lambda: optimasi.analisis_sensitivitas(keuntungan, konsumsi, kapasitas)
+
+
+@kasus(cepat=[10, 100], penuh=[10, 100, 1_000, 10_000], satuan="skenario")
+def lp_skenario(k):
+    """Sweep skenario LP, 50 produk x 20 sumber daya, satu proses."""
+    from scipy import sparse
+
+    from mtk import optimasi
+
+    keuntungan, konsumsi, kapasitas = _lp_acak(50)
+    model = optimasi.ModelProduksi(produk=[f"P{j}" for j in range(50)], sumber_daya=[f"R{i}" for i in range(20)],
+                                   keuntungan=keuntungan, kapasitas=kapasitas, A=sparse.csr_matrix(konsumsi))
+    rng = np.random.default_rng(1)
+    C = keuntungan * rng.uniform(0.8, 1.2, (k, 1))
+    B = kapasitas * rng.uniform(0.8, 1.2, (k, 1))
+    return lambda: optimasi.selesaikan_skenario(model, C, B, n_proses=1)
+
+
+@kasus(cepat=[5, 20], penuh=[5, 10, 20, 50, 100], satuan="produk")
+def milp(n):
+    """MILP dengan biaya setup, 10 sumber daya, gap 1%."""
+    from mtk import optimasi_integer
+
+    keuntungan, konsumsi, kapasitas = _lp_acak(n, m=10)
+    biaya_setup = keuntungan * 20
+    return lambda: optimasi_integer.selesaikan_milp(keuntungan, konsumsi, kapasitas, biaya_setup, batas_waktu=60.0)
+
+
+@kasus(cepat=[4, 13], penuh=[4, 13, 26, 52], satuan="periode")
+def perencanaan(T):
+    """Perencanaan multi-periode, 500 SKU x 20 sumber daya."""
+    from mtk import perencanaan
+
+    keuntungan, konsumsi, kapasitas = _lp_acak(500)
+    permintaan = np.random.default_rng(2).uniform(0, 20, (T, 500))
+    return lambda: perencanaan.rencanakan(keuntungan, konsumsi, kapasitas / 10, permintaan, keuntungan / 5)
+
+
+# --- EOQ & simulasi persediaan (tugas_UAS.py) ---
+
+@kasus(cepat=[1, 1_000, 1_000_000], penuh=[1, 10, 100, 1_000, 10_000, 100_000, 1_000_000], satuan="SKU")
+def eoq(n):
+    """EOQ + ROP tervektorisasi."""
+    from mtk import persediaan
+
+    rng = np.random.default_rng(0)
+    D, S, H, LT = rng.uniform(100, 5000, n), rng.uniform(1e4, 1e5, n), rng.uniform(1e3, 5e3, n), rng.uniform(1, 14, n)
+    return lambda: persediaan.hitung_eoq(D, S, H, LT)
+
+
+@kasus(cepat=[90, 365, 1_825], penuh=[90, 180, 365, 730, 1_095, 1_825], satuan="hari")
+def simulasi_persediaan(hari):
+    """Simulasi ROP/EOQ satu SKU dengan jejak harian (studi kasus tugas_UAS.py)."""
+    from mtk import simulasi
+
+    return lambda: simulasi.simulasi_persediaan(1800 / 365, 360, 1800 / 365 * 7, 7, hari=hari)
+
+
+@kasus(cepat=[1, 1_000, 100_000], penuh=[1, 100, 10_000, 100_000, 1_000_000], satuan="SKU")
+def simulasi_persediaan_sku(n):
+    """Simulasi ROP/EOQ 365 hari untuk banyak SKU, tanpa jejak."""
+    from mtk import simulasi
+
+    rng = np.random.default_rng(0)
+    harian, LT = rng.uniform(1, 20, n), rng.integers(1, 15, n)
+    Q = harian * rng.uniform(20, 60, n)
+    return lambda: simulasi.simulasi_persediaan(harian, Q, harian * LT, LT, hari=365, simpan_jejak=False)
+
+
+@kasus(cepat=[100, 1_000], penuh=[100, 1_000, 10_000], satuan="replikasi")
+def monte_carlo(r):
+    """Monte Carlo safety stock, 11 kandidat x 365 hari, satu proses."""
+    from mtk import simulasi
+
+    return lambda: simulasi.simulasi_monte_carlo(1800, 360, 7, np.linspace(0, 35, 11), replikasi=r, n_proses=1)
+
+
+# --- Antrian (tab antrian) ---
+
+@kasus(cepat=[1, 1_000, 1_000_000], penuh=[1, 10, 100, 1_000, 10_000, 100_000, 1_000_000], satuan="konfigurasi")
+def mm1(n):
+    """Metrik M/M/1 tervektorisasi."""
+    from mtk import antrian
+
+    rng = np.random.default_rng(0)
+    mu = rng.uniform(5, 20, n)
+    lam = mu * rng.uniform(0.1, 0.95, n)
+    return lambda: antrian.mm1(lam, mu)
+
+
+@kasus(cepat=[1, 1_000, 100_000], penuh=[1, 100, 10_000, 100_000, 1_000_000], satuan="konfigurasi")
+def mmc(n):
+    """Metrik M/M/c tervektorisasi, c sampai 20."""
+    from mtk import antrian
+
+    rng = np.random.default_rng(0)
+    mu, c = rng.uniform(5, 20, n), rng.integers(1, 21, n)
+    lam = mu * c * rng.uniform(0.1, 0.95, n)
+    return lambda: antrian.mmc(lam, mu, c)
+
+
+@kasus(cepat=[10_000, 100_000], penuh=[10_000, 100_000, 1_000_000], satuan="pelanggan")
+def simulasi_antrian(n):
+    """Simulasi antrian M/M/2 dengan batch means."""
+    from mtk import simulasi_antrian
+
+    return lambda: simulasi_antrian.simulasi_antrian(1 / 8, 1 / 5, n_server=2, n_pelanggan=n)
+
+
+# --- Prediksi downtime (tab downtime) ---
+
+def _data_downtime(n):
+    from mtk import downtime
+
+    return downtime.data_sintetis(seed=0, n=n)
+
+
+@kasus(cepat=[50, 10_000, 1_000_000], penuh=[50, 1_000, 100_000, 1_000_000, 10_000_000], satuan="baris")
+def downtime_latih(n):
+    """Regresi lewat persamaan normal (jalur streaming)."""
+    from mtk import downtime
+
+    df = _data_downtime(n)
+    return lambda: downtime.PersamaanNormal().tambah(df).model()
+
+
+@kasus(cepat=[50, 10_000, 1_000_000], penuh=[50, 1_000, 100_000, 1_000_000, 10_000_000], satuan="baris")
+def downtime_latih_sklearn(n):
+    """Regresi ``LinearRegression`` scikit-learn (data kecil di memori)."""
+    from mtk import downtime
+
+    df = _data_downtime(n)
+    return lambda: downtime.latih_model(df)
+
+
+@kasus(cepat=[50, 10_000, 1_000_000], penuh=[50, 1_000, 100_000, 1_000_000, 10_000_000], satuan="baris")
+def downtime_prediksi(n):
+    """Prediksi downtime untuk n baris."""
+    from mtk import downtime
+
+    model = downtime.PersamaanNormal().tambah(_data_downtime(50)).model()
+    X = _data_downtime(n)[downtime.KOLOM_FITUR].to_numpy(dtype=float)
+    return lambda: model.predict(X)
+
+
+# --- Arsip data historis (mtk/arsip.py) ---
+
+_DIR_SEMENTARA = None
+
+
+def _dir_sementara():
+    # Satu direktori per proses benchmark, dihapus saat proses selesai: arsip
+    # selalu dibangun oleh kode commit yang sedang diukur, tidak pernah dipakai
+    # ulang dari run (atau commit) sebelumnya.
+    global _DIR_SEMENTARA
+    if _DIR_SEMENTARA is None:
+        import tempfile
+
+        _DIR_SEMENTARA = tempfile.TemporaryDirectory(prefix="mtk_benchmark_")
+    return _DIR_SEMENTARA.name
+
+
+def _sumber_permintaan(n_sku, hari=365):
+    import os
+
+    import pandas as pd
+
+    sumber = os.path.join(_dir_sementara(), f"permintaan_{n_sku}_{hari}.parquet")
+    if not os.path.exists(sumber):
+        rng = np.random.default_rng(0)
+        n = n_sku * hari
+        pd.DataFrame({"sku": np.char.add("SKU", rng.integers(0, n_sku, n).astype(str)),
+                      "hari": rng.integers(0, hari, n), "permintaan": rng.poisson(3, n).astype(float)}).to_parquet(sumber)
+    return sumber
+
+
+def _arsip_permintaan(n_sku, hari=365):
+    import os
+
+    from mtk import arsip
+
+    sumber = _sumber_permintaan(n_sku, hari)
+    path = sumber + ".arsip"
+    if not os.path.exists(path):
+        arsip.bangun_permintaan([sumber], path)
+    return arsip.buka(path)
+
+
+@kasus(cepat=[100, 10_000], penuh=[100, 1_000, 10_000, 100_000], satuan="SKU")
+def arsip_bangun(n_sku):
+    """Bangun arsip permintaan dari Parquet (365 baris per SKU)."""
+    import os
+
+    from mtk import arsip
+
+    sumber = _sumber_permintaan(n_sku)
+    return lambda: arsip.bangun_permintaan([sumber], os.path.join(_dir_sementara(), f"bangun_{n_sku}.arsip"))
+
+
+@kasus(cepat=[100, 10_000], penuh=[100, 1_000, 10_000, 100_000], satuan="SKU")
+def arsip_lookup(n_sku):
+    """D dan varian satu SKU dari arsip ter-memory-map (ukuran = jumlah SKU di arsip)."""
+    from mtk import arsip
+
+    data = _arsip_permintaan(n_sku)
+    sku = str(data.kunci[len(data.kunci) // 2])
+    return lambda: arsip.statistik_permintaan(arsip.buka(data.path), sku)
+
+
+@kasus(cepat=[100, 10_000], penuh=[100, 1_000, 10_000, 100_000], satuan="SKU")
+def arsip_semua_sku(n_sku):
+    """D dan varian semua SKU dari ringkasan arsip."""
+    from mtk import arsip
+
+    data = _arsip_permintaan(n_sku)
+    return lambda: arsip.statistik_permintaan(data)
+
+
+# --- Rendering grafik ---
+
+@kasus(cepat=[1], penuh=[1], satuan="grafik")
+def grafik_kurva_biaya(_):
+    """Render PNG kurva total biaya EOQ (tanpa cache)."""
+    from mtk import grafik
+
+    return lambda: grafik.png_kurva_biaya.__wrapped__(1800.0, 90000.0, 2500.0)
+
+
+def _jejak_persediaan(hari):
+    from mtk import simulasi
+
+    ROP = 1800 / 365 * 7
+    hasil = simulasi.simulasi_persediaan(1800 / 365, 360, ROP, 7, hari=hari)
+    return hasil.hari, hasil.level[:, 0], hasil.hari[hasil.dipesan[:, 0]], hasil.hari[hasil.diterima[:, 0]], ROP
+
+
+@kasus(cepat=[90, 1_825], penuh=[90, 365, 1_825, 10_000, 100_000], satuan="hari")
+def grafik_jejak_persediaan(hari):
+    """Render PNG jejak persediaan beserta garis pesanan (tugas_UAS.py), tanpa cache."""
+    from mtk import grafik
+
+    args = _jejak_persediaan(hari)
+    return lambda: grafik._render_jejak_persediaan(*args)
+
+
+@kasus(cepat=[90, 1_825], penuh=[90, 365, 1_825, 10_000, 100_000], satuan="hari")
+def grafik_jejak_persediaan_cache(hari):
+    """PNG jejak persediaan yang sudah ada di cache (hash input + lookup)."""
+    from mtk import grafik
+
+    args = _jejak_persediaan(hari)
+    grafik.png_jejak_persediaan(*args)
+    return lambda: grafik.png_jejak_persediaan(*args)
+
+
+@kasus(cepat=[90, 1_825], penuh=[90, 365, 1_825, 10_000, 100_000], satuan="hari")
+def grafik_jejak_vega(hari):
+    """Data + spesifikasi Vega-Lite jejak persediaan; gambar dirender di browser."""
+    from mtk import grafik
+
+    args = _jejak_persediaan(hari)
+    return lambda: grafik.vega_jejak_persediaan(*args)
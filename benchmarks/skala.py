@@ -0,0 +1,247 @@
+"""Benchmark skala: waktu setiap jalur perhitungan pada beberapa ukuran masalah.
+
+Hasil disimpan sebagai JSON di ``benchmarks/hasil/<commit>.json`` sehingga
+dua commit bisa dibandingkan. Untuk setiap kasus dicetak kurva skala (waktu
+per ukuran) dan eksponen skala, yaitu kemiringan log(waktu) terhadap
+log(ukuran) di antara dua ukuran terbesar (di ukuran kecil overhead tetap
+yang mendominasi): 1 berarti linear, 2 kuadratik.
+
+    python benchmarks/skala.py jalankan                    # profil cepat
+    python benchmarks/skala.py jalankan --profil penuh --kasus "lp_*" eoq
+    python benchmarks/skala.py bandingkan HEAD~1 HEAD      # rasio waktu per kasus & ukuran
+    python benchmarks/skala.py kurva HEAD --grafik skala.png
+"""
+import argparse
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import timeit
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DIR_HASIL = os.path.join(ROOT, "benchmarks", "hasil")
+sys.path.insert(0, ROOT)
+
+from kasus import KASUS  # noqa: E402
+
+# profil -> (jumlah sampel maksimum, anggaran waktu per ukuran dalam detik)
+PROFIL = {"cepat": (5, 0.5), "penuh": (10, 3.0)}
+DURASI_SAMPEL_MINIMUM = 0.01  # fungsi yang sangat cepat diulang dalam satu sampel sampai sepanjang ini
+
+
+def _git(*args):
+    return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True, check=True).stdout.strip()
+
+
+def commit_sekarang():
+    """``(hash pendek, ada perubahan belum di-commit)`` untuk tree saat ini."""
+    kotor = bool(_git("status", "--porcelain", "--untracked-files=no"))
+    return _git("rev-parse", "--short=12", "HEAD"), kotor
+
+
+def path_hasil(acuan):
+    """Path file hasil dari path file, nama commit/ref git, atau hash commit."""
+    if os.path.isfile(acuan):
+        return acuan
+    try:
+        acuan = _git("rev-parse", "--short=12", acuan)
+    except subprocess.CalledProcessError:
+        pass
+    for nama in (acuan, acuan + "-dirty"):
+        path = os.path.join(DIR_HASIL, nama + ".json")
+        if os.path.isfile(path):
+            return path
+    raise FileNotFoundError(f"Hasil benchmark untuk '{acuan}' tidak ditemukan di {DIR_HASIL}.")
+
+
+def ukur(fungsi, maks_sampel, anggaran):
+    """Waktu per panggilan (detik) untuk beberapa sampel; GC dimatikan seperti ``timeit``.
+
+    Panggilan pertama sekaligus menentukan berapa kali fungsi diulang per
+    sampel dan ikut dihitung sebagai sampel.
+    """
+    timer = timeit.Timer(fungsi)
+    ulang = 1
+    while True:
+        durasi = timer.timeit(ulang)
+        if durasi >= DURASI_SAMPEL_MINIMUM or ulang >= 10**6:
+            break
+        ulang *= 10
+    sampel = [durasi / ulang]
+    batas = time.perf_counter() + anggaran
+    while len(sampel) < maks_sampel and time.perf_counter() + durasi < batas:
+        sampel.append(timer.timeit(ulang) / ulang)
+    return sampel
+
+
+def eksponen_skala(ukuran, waktu):
+    """Kemiringan log-log di antara dua ukuran terbesar; ``None`` bila hanya ada satu ukuran."""
+    if len(ukuran) < 2:
+        return None
+    return float(np.log(waktu[-1] / waktu[-2]) / np.log(ukuran[-1] / ukuran[-2]))
+
+
+def _format_waktu(detik):
+    for satuan, faktor in (("s", 1), ("ms", 1e-3), ("µs", 1e-6)):
+        if detik >= faktor:
+            return f"{detik / faktor:.3g} {satuan}"
+    return f"{detik / 1e-9:.3g} ns"
+
+
+def jalankan(nama_kasus, profil):
+    maks_sampel, anggaran = PROFIL[profil]
+    hasil = {}
+    for nama in nama_kasus:
+        k = KASUS[nama]
+        baris = {"satuan": k.satuan, "keterangan": k.keterangan, "ukuran": [], "median": [], "min": [], "sampel": []}
+        for n in getattr(k, profil):
+            sampel = ukur(k.siapkan(n), maks_sampel, anggaran)
+            baris["ukuran"].append(n)
+            baris["median"].append(float(np.median(sampel)))
+            baris["min"].append(min(sampel))
+            baris["sampel"].append(len(sampel))
+            print(f"  {nama:<26}{n:>12,} {k.satuan:<12}{_format_waktu(baris['median'][-1]):>12}", flush=True)
+        hasil[nama] = baris
+    return hasil
+
+
+def simpan(hasil, profil):
+    """Gabungkan dengan hasil sebelumnya untuk commit yang sama lalu simpan; kembalikan path-nya."""
+    commit, kotor = commit_sekarang()
+    os.makedirs(DIR_HASIL, exist_ok=True)
+    path = os.path.join(DIR_HASIL, commit + ("-dirty" if kotor else "") + ".json")
+    data = {"kasus": {}}
+    if os.path.isfile(path):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+    import scipy
+
+    data.update({
+        "commit": commit,
+        "dirty": kotor,
+        "tanggal": datetime.datetime.now().isoformat(timespec="seconds"),
+        "profil": profil,
+        "mesin": {"python": platform.python_version(), "platform": platform.platform(),
+                  "cpu": os.cpu_count(), "numpy": np.__version__, "scipy": scipy.__version__},
+    })
+    data["kasus"].update(hasil)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=1, ensure_ascii=False)
+    return path
+
+
+def muat(acuan):
+    with open(path_hasil(acuan), encoding="utf-8") as f:
+        return json.load(f)
+
+
+def cetak_kurva(data):
+    print(f"commit {data['commit']}{' (dirty)' if data['dirty'] else ''}, profil {data['profil']}, {data['tanggal']}")
+    for nama, k in data["kasus"].items():
+        e = eksponen_skala(k["ukuran"], k["median"])
+        print(f"\n{nama} — {k['keterangan']}  eksponen skala: {'-' if e is None else f'{e:.2f}'}")
+        for n, t in zip(k["ukuran"], k["median"]):
+            print(f"  {n:>12,} {k['satuan']:<12}{_format_waktu(t):>12}{_format_waktu(t / n):>12}/{k['satuan']}")
+
+
+def gambar_kurva(daftar_data, path):
+    """Simpan kurva log-log setiap kasus (satu panel per kasus, satu garis per commit)."""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    nama_kasus = [n for n in KASUS if any(n in d["kasus"] for d in daftar_data)]
+    nama_kasus += sorted({n for d in daftar_data for n in d["kasus"]} - set(nama_kasus))
+    kolom = 4
+    baris = -(-len(nama_kasus) // kolom)
+    fig, axes = plt.subplots(baris, kolom, figsize=(4 * kolom, 3 * baris), squeeze=False)
+    for ax, nama in zip(axes.flat, nama_kasus):
+        for data in daftar_data:
+            k = data["kasus"].get(nama)
+            if k is not None:
+                ax.loglog(k["ukuran"], k["median"], marker="o", label=data["commit"])
+        ax.set_title(nama, fontsize=9)
+        ax.set_xlabel(k["satuan"] if k else "")
+        ax.set_ylabel("detik")
+        ax.grid(True, which="both", linestyle="--", alpha=0.5)
+    for ax in axes.flat[len(nama_kasus):]:
+        ax.set_visible(False)
+    axes.flat[0].legend(fontsize=8)
+    fig.tight_layout()
+    fig.savefig(path, dpi=100)
+    plt.close(fig)
+
+
+def bandingkan(dasar, baru, ambang):
+    """Cetak rasio waktu ``baru / dasar`` per kasus dan ukuran; kembalikan jumlah regresi."""
+    print(f"dasar {dasar['commit']} -> baru {baru['commit']}{' (dirty)' if baru['dirty'] else ''}")
+    print(f"{'kasus':<26}{'ukuran':>12}{'dasar':>12}{'baru':>12}{'rasio':>8}")
+    regresi = 0
+    for nama, k in baru["kasus"].items():
+        lama = dasar["kasus"].get(nama)
+        if lama is None:
+            continue
+        waktu_lama = dict(zip(lama["ukuran"], lama["median"]))
+        for n, t in zip(k["ukuran"], k["median"]):
+            if n not in waktu_lama:
+                continue
+            rasio = t / waktu_lama[n]
+            tanda = ""
+            if rasio > 1 + ambang:
+                tanda, regresi = "  lebih lambat", regresi + 1
+            elif rasio < 1 / (1 + ambang):
+                tanda = "  lebih cepat"
+            print(f"{nama:<26}{n:>12,}{_format_waktu(waktu_lama[n]):>12}{_format_waktu(t):>12}{rasio:>8.2f}{tanda}")
+    return regresi
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p = sub.add_parser("jalankan", help="Jalankan benchmark dan simpan hasilnya untuk commit saat ini.")
+    p.add_argument("--profil", choices=PROFIL, default="cepat")
+    p.add_argument("--kasus", nargs="+", default=["*"], help="Nama atau pola kasus (default: semua).")
+    p.add_argument("--daftar", action="store_true", help="Tampilkan daftar kasus lalu keluar.")
+
+    p = sub.add_parser("bandingkan", help="Bandingkan hasil dua commit (ref git atau path file).")
+    p.add_argument("dasar")
+    p.add_argument("baru", nargs="?", default="HEAD")
+    p.add_argument("--ambang", type=float, default=0.2, help="Selisih relatif yang dianggap berubah (default: 0.2).")
+
+    p = sub.add_parser("kurva", help="Cetak kurva skala; opsional simpan grafiknya.")
+    p.add_argument("hasil", nargs="*", default=["HEAD"], help="Ref git atau path file hasil.")
+    p.add_argument("--grafik", help="Simpan grafik log-log ke file PNG ini.")
+
+    args = parser.parse_args(argv)
+    if args.perintah == "jalankan":
+        if args.daftar:
+            for k in KASUS.values():
+                print(f"{k.nama:<26}{k.keterangan}  [{k.satuan}: {', '.join(f'{n:,}' for n in k.penuh)}]")
+            return
+        nama_kasus = [n for n in KASUS if any(fnmatch.fnmatch(n, pola) for pola in args.kasus)]
+        if not nama_kasus:
+            parser.error(f"Tidak ada kasus yang cocok dengan {args.kasus}.")
+        path = simpan(jalankan(nama_kasus, args.profil), args.profil)
+        print(f"\nHasil disimpan di {os.path.relpath(path, ROOT)}")
+        cetak_kurva(muat(path))
+    elif args.perintah == "bandingkan":
+        if bandingkan(muat(args.dasar), muat(args.baru), args.ambang):
+            sys.exit(1)
+    else:
+        daftar_data = [muat(acuan) for acuan in args.hasil]
+        for data in daftar_data:
+            cetak_kurva(data)
+        if args.grafik:
+            gambar_kurva(daftar_data, args.grafik)
+            print(f"\nGrafik disimpan di {args.grafik}")
+
+
+if __name__ == "__main__":
+    main()
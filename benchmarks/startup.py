@@ -0,0 +1,75 @@
+"""Benchmark waktu mulai: waktu sampai render pertama untuk setiap aplikasi.
+
+Setiap pengukuran dijalankan di proses Python baru (cold start) dengan
+``streamlit.testing.v1.AppTest``, sehingga biaya impor ikut terukur seperti
+pada pod baru. Dicetak juga pustaka berat yang sudah dimuat setelah render
+pertama.
+
+    python benchmarks/startup.py
+    python benchmarks/startup.py --ulang 10 studi_kasus.py
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APLIKASI = ["studi_kasus.py", "mtk2.py", "tugas_UAS.py"]
+MODUL_BERAT = ["pandas", "scipy", "sklearn", "matplotlib", "seaborn", "highspy", "pyarrow"]
+
+_ANAK = """
+import json, sys, time
+mulai = time.perf_counter()
+from streamlit.testing.v1 import AppTest
+at = AppTest.from_file(sys.argv[1], default_timeout=120).run()
+durasi = time.perf_counter() - mulai
+print(json.dumps({
+    "render_pertama": durasi,
+    "error": [e.message for e in at.exception],
+    "modul": [m for m in sys.argv[2:] if m in sys.modules],
+}))
+"""
+
+
+def ukur(app, ulang=5):
+    """Jalankan ``app`` ``ulang`` kali, masing-masing di proses baru."""
+    render, total = [], []
+    for _ in range(ulang):
+        mulai = time.perf_counter()
+        keluaran = subprocess.run([sys.executable, "-c", _ANAK, os.path.join(ROOT, app), *MODUL_BERAT],
+                                  cwd=ROOT, capture_output=True, text=True, check=True)
+        total.append(time.perf_counter() - mulai)
+        hasil = json.loads(keluaran.stdout.strip().splitlines()[-1])
+        if hasil["error"]:
+            raise RuntimeError(f"{app}: {hasil['error']}")
+        render.append(hasil["render_pertama"])
+    return {
+        "app": app,
+        "render_pertama_median": statistics.median(render),
+        "proses_median": statistics.median(total),
+        "modul_berat": hasil["modul"],
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("app", nargs="*", default=APLIKASI)
+    parser.add_argument("--ulang", type=int, default=5, help="Jumlah cold start per aplikasi (default: 5).")
+    parser.add_argument("--json", action="store_true", help="Cetak hasil sebagai JSON.")
+    args = parser.parse_args(argv)
+
+    hasil = [ukur(app, args.ulang) for app in args.app]
+    if args.json:
+        print(json.dumps(hasil, indent=2))
+        return
+    print(f"{'aplikasi':<16}{'render pertama':>16}{'proses':>10}  pustaka berat yang dimuat")
+    for h in hasil:
+        print(f"{h['app']:<16}{h['render_pertama_median']:>15.2f}s{h['proses_median']:>9.2f}s  "
+              f"{', '.join(h['modul_berat']) or '-'}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1 @@
+"""Perhitungan inti untuk aplikasi analisis operasional industri."""
@@ -0,0 +1,197 @@
+"""Model antrian tervektorisasi: M/M/1, M/M/c, M/M/c/K, M/G/1 dan jaringan Jackson.
+
+Semua fungsi menerima skalar atau array (di-broadcast) dan mengembalikan dict
+berisi array metrik, sehingga ribuan konfigurasi dapat dihitung dalam satu
+panggilan. Sistem yang tidak stabil menghasilkan ``inf`` untuk L/Lq/W/Wq;
+λ = 0 adalah sistem kosong (L = Lq = Wq = 0, W = 1/μ). λ negatif atau μ <= 0
+menghasilkan ``ValueError``.
+"""
+import numpy as np
+import pandas as pd
+
+
+def _array(*nilai):
+    return np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in nilai))
+
+
+def mm1(lam, mu):
+    lam, mu = _array(lam, mu)
+    rho = lam / mu
+    stabil = rho < 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        L = np.where(stabil, lam / (mu - lam), np.inf)
+        Lq = np.where(stabil, lam ** 2 / (mu * (mu - lam)), np.inf)
+        W = np.where(stabil, 1 / (mu - lam), np.inf)
+        Wq = np.where(stabil, lam / (mu * (mu - lam)), np.inf)
+    return {"rho": rho, "L": L, "Lq": Lq, "W": W, "Wq": Wq, "stabil": stabil}
+
+
+def _periksa_server(lam, mu, c):
+    # c dipakai sebagai indeks (c - 1); NaN atau c < 1 akan mengambil elemen yang salah.
+    if not (np.isfinite(lam).all() and np.isfinite(mu).all() and np.isfinite(c).all()):
+        raise ValueError("λ, μ dan c harus berupa angka terhingga (tidak boleh kosong/NaN).")
+    if (lam < 0).any() or (mu <= 0).any():
+        raise ValueError("λ tidak boleh negatif dan μ harus lebih besar dari 0.")
+    if (c < 1).any():
+        raise ValueError("Jumlah server (c) minimal 1.")
+
+
+def _erlang_b_semua(a, c_maks):
+    """Erlang B untuk c = 1..c_maks dengan rekursi B(k) = aB(k-1) / (k + aB(k-1)).
+
+    Rekursi ini stabil secara numerik (tidak ada a^c atau c! yang meledak),
+    sehingga aman untuk c ratusan atau ribuan. Hasil berbentuk a.shape + (c_maks,).
+    """
+    B = np.ones_like(a)
+    hasil = np.empty(a.shape + (c_maks,))
+    for k in range(1, c_maks + 1):
+        B = a * B / (k + a * B)
+        hasil[..., k - 1] = B
+    return hasil
+
+
+def erlang_c(lam, mu, c):
+    """Probabilitas pelanggan harus menunggu pada M/M/c (Erlang C)."""
+    lam, mu, c = _array(lam, mu, c)
+    _periksa_server(lam, mu, c)
+    c = c.astype(int)
+    a = lam / mu
+    B_semua = _erlang_b_semua(a, int(c.max()))
+    B = np.take_along_axis(B_semua, (c - 1)[..., None], axis=-1)[..., 0]
+    rho = a / c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(rho < 1, B / (1 - rho * (1 - B)), 1.0)
+
+
+def mmc(lam, mu, c):
+    lam, mu, c = _array(lam, mu, c)
+    _periksa_server(lam, mu, c)
+    rho = lam / (c * mu)
+    stabil = rho < 1
+    Pw = erlang_c(lam, mu, c)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Lq = np.where(stabil, Pw * rho / (1 - rho), np.inf)
+        Wq = np.where(stabil, Pw / (c * mu - lam), np.inf)  # = Lq / λ, tetap terdefinisi untuk λ = 0
+    W = Wq + 1 / mu
+    return {"rho": rho, "Pw": Pw, "L": lam * W, "Lq": Lq, "W": W, "Wq": Wq, "stabil": stabil}
+
+
+def mmck(lam, mu, c, K):
+    """M/M/c/K: c server, kapasitas sistem K (termasuk yang sedang dilayani).
+
+    Distribusi keadaan dihitung di ruang log lalu dinormalisasi dengan
+    logsumexp, sehingga stabil untuk c dan K besar. Selalu stabil.
+    """
+    from scipy.special import gammaln, logsumexp  # hanya dibutuhkan oleh model ini
+
+    lam, mu, c, K = _array(lam, mu, c, K)
+    _periksa_server(lam, mu, c)
+    if not np.isfinite(K).all():
+        raise ValueError("Kapasitas sistem (K) harus berupa angka terhingga.")
+    c, K = c.astype(int), np.maximum(K.astype(int), c.astype(int))
+    n = np.arange(int(K.max()) + 1)
+    with np.errstate(divide="ignore"):
+        log_a = np.log(lam / mu)[..., None]  # -inf untuk λ = 0
+    c_, K_ = c[..., None], K[..., None]
+    # log p_n (belum dinormalisasi): a^n / n! untuk n <= c, a^n / (c! c^(n-c)) untuk n > c.
+    # n log a ditulis 0 untuk n = 0 agar λ = 0 tidak menghasilkan 0 x -inf.
+    n_log_a = np.where(n == 0, 0.0, np.maximum(n, 1) * log_a)
+    log_p = np.where(n <= c_, n_log_a - gammaln(n + 1),
+                     n_log_a - gammaln(c_ + 1) - (n - c_) * np.log(c_))
+    log_p = np.where(n <= K_, log_p, -np.inf)
+    p = np.exp(log_p - logsumexp(log_p, axis=-1, keepdims=True))
+
+    P_blok = np.take_along_axis(p, K[..., None], axis=-1)[..., 0]
+    lam_efektif = lam * (1 - P_blok)
+    L = (p * n).sum(axis=-1)
+    Lq = (p * np.maximum(n - c_, 0)).sum(axis=-1)
+    ada = lam_efektif > 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        W = np.where(ada, L / lam_efektif, 1 / mu)
+        Wq = np.where(ada, Lq / lam_efektif, 0.0)
+    return {
+        "rho": lam_efektif / (c * mu),
+        "P_blok": P_blok,
+        "lam_efektif": lam_efektif,
+        "L": L,
+        "Lq": Lq,
+        "W": W,
+        "Wq": Wq,
+        "stabil": np.ones(L.shape, dtype=bool),
+    }
+
+
+def mg1(lam, mu, std_layanan):
+    """M/G/1 dengan rumus Pollaczek-Khinchine; ``std_layanan`` = simpangan baku waktu layanan."""
+    lam, mu, sd = _array(lam, mu, std_layanan)
+    rho = lam / mu
+    stabil = rho < 1
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Lq = np.where(stabil, (lam ** 2 * sd ** 2 + rho ** 2) / (2 * (1 - rho)), np.inf)
+        Wq = np.where(stabil, lam * (sd ** 2 + 1 / mu ** 2) / (2 * (1 - rho)), np.inf)  # = Lq / λ
+    W = Wq + 1 / mu
+    return {"rho": rho, "L": lam * W, "Lq": Lq, "W": W, "Wq": Wq, "stabil": stabil}
+
+
+def jaringan_jackson(gamma, mu, c, P):
+    """Jaringan Jackson terbuka: setiap node M/M/c.
+
+    ``gamma``: laju kedatangan dari luar per node, ``P[i, j]``: probabilitas
+    pelanggan dari node i berpindah ke node j. Laju total tiap node diperoleh
+    dari λ = γ + Pᵀλ. Mengembalikan ``(per_node, total)``.
+
+    Input yang tidak lengkap (NaN), ``mu <= 0``, ``c`` bukan bilangan bulat >= 1
+    atau ``P`` yang ukurannya tidak n x n menghasilkan ``ValueError``.
+    """
+    gamma, mu, c = (np.asarray(v, dtype=float) for v in (gamma, mu, c))
+    P = np.asarray(P, dtype=float)
+    n = len(gamma)
+    if n == 0:
+        raise ValueError("Jaringan harus memiliki minimal satu node.")
+    if mu.shape != (n,) or c.shape != (n,):
+        raise ValueError("gamma, mu dan c harus memiliki satu nilai per node.")
+    if not (np.isfinite(gamma).all() and np.isfinite(mu).all() and np.isfinite(c).all()):
+        raise ValueError("Parameter node belum lengkap: gamma, mu dan c setiap node harus diisi.")
+    if (gamma < 0).any() or (mu <= 0).any():
+        raise ValueError("gamma tidak boleh negatif dan mu harus lebih besar dari 0.")
+    if (c < 1).any() or (c != np.round(c)).any():
+        raise ValueError("Jumlah server (c) setiap node harus bilangan bulat minimal 1.")
+    if P.shape != (n, n):
+        raise ValueError(f"Matriks routing harus berukuran {n} x {n} (sesuai jumlah node), bukan {P.shape}.")
+    if not np.isfinite(P).all() or (P < 0).any() or (P.sum(axis=1) > 1 + 1e-9).any():
+        raise ValueError("Matriks routing harus berisi probabilitas 0..1 dengan jumlah per baris paling banyak 1.")
+    if gamma.sum() <= 0:
+        raise ValueError("Minimal satu node harus menerima kedatangan dari luar (gamma > 0).")
+    lam = np.linalg.solve(np.eye(len(gamma)) - P.T, gamma)
+    per_node = pd.DataFrame({"lam": lam, **mmc(lam, mu, c)})
+    L_total = per_node["L"].sum()
+    total = {"L": L_total, "W": L_total / gamma.sum(), "stabil": bool(per_node["stabil"].all())}
+    return per_node, total
+
+
+def cari_server_termurah(lam, mu, target_Wq, biaya_per_server, c_maks=None):
+    """Jumlah server M/M/c paling sedikit (= termurah) yang memenuhi Wq <= target.
+
+    ``lam``/``mu`` boleh array; untuk setiap konfigurasi semua c = 1..c_maks
+    dievaluasi sekaligus. Konfigurasi yang tidak terpenuhi sampai c_maks
+    mendapat c = 0 dan biaya NaN.
+    """
+    lam, mu, target = _array(lam, mu, target_Wq)
+    a = lam / mu
+    if c_maks is None:
+        c_maks = int(np.ceil(a.max() + 4 * np.sqrt(a.max()) + 5))
+    c = np.arange(1, c_maks + 1)
+    B = _erlang_b_semua(a, c_maks)
+    rho = a[..., None] / c
+    with np.errstate(divide="ignore", invalid="ignore"):
+        Pw = B / (1 - rho * (1 - B))
+        Wq = np.where(rho < 1, Pw / (c * mu[..., None] - lam[..., None]), np.inf)
+    memenuhi = Wq <= target[..., None]
+    ada = memenuhi.any(axis=-1)
+    idx = memenuhi.argmax(axis=-1)
+    c_opt = np.where(ada, idx + 1, 0)
+    return {
+        "c": c_opt,
+        "Wq": np.where(ada, np.take_along_axis(Wq, idx[..., None], axis=-1)[..., 0], np.nan),
+        "biaya": np.where(ada, c_opt * biaya_per_server, np.nan),
+    }
@@ -0,0 +1,392 @@
+"""Arsip kolumnar ter-memory-map untuk data historis permintaan dan downtime.
+
+Satu arsip adalah direktori berisi satu file ``.npy`` per kolom dengan baris
+yang sudah dikelompokkan per kunci (SKU atau mesin), daftar kunci terurut
+``kunci.npy`` dan indeks ``awal.npy``: baris kunci ke-i adalah irisan
+``[awal[i], awal[i + 1])``. Semua file dibuka dengan ``np.load(mmap_mode="r")``
+sehingga tidak ada yang dibaca sebelum dipakai, dan setiap proses (worker
+Streamlit, ``ProcessPoolExecutor``, server batch) yang membuka arsip yang sama
+berbagi halaman page cache OS yang sama tanpa salinan.
+
+Ringkasan per kunci (jumlah, jumlah kuadrat, rentang hari, XᵀX dan Xᵀy)
+dihitung saat arsip dibangun, sehingga D, varian permintaan atau model
+downtime per mesin diambil tanpa menyentuh baris mentahnya.
+
+Arsip dibangun dari file CSV/Parquet dalam dua lintasan per chunk: lintasan
+pertama menghitung jumlah baris per kunci, lintasan kedua menulis setiap baris
+langsung ke posisinya di file tujuan. Ringkasan yang butuh semua baris satu
+kunci sekaligus (varian dari total harian, karena satu hari bisa tersebar di
+beberapa baris dan beberapa chunk) dihitung sesudahnya per blok kunci dari file
+yang sudah terurut. Memori terbatas pada ukuran chunk dan jumlah kunci, berapa
+pun jumlah barisnya.
+"""
+import datetime
+import json
+import os
+import shutil
+import uuid
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from . import downtime
+from .persediaan import HARI_PER_TAHUN
+
+VERSI_FORMAT = 2  # 2: jumlah_kuadrat dari total harian, bukan per baris
+FILE_META = "meta.json"
+KOLOM_PERMINTAAN = ("sku", "hari", "permintaan")  # atau "tanggal" sebagai ganti "hari"
+KOLOM_DOWNTIME = ("mesin", *downtime.KOLOM_FITUR, downtime.KOLOM_TARGET)
+
+
+class Arsip:
+    """Arsip yang sudah dibangun, dibuka read-only lewat memory map.
+
+    Kolom dan ringkasan baru di-memory-map saat pertama kali diminta.
+    :meth:`baris` mengembalikan irisan memmap (tanpa salinan).
+    """
+
+    def __init__(self, path):
+        self.path = os.fspath(path)
+        try:
+            with open(os.path.join(self.path, FILE_META), encoding="utf-8") as f:
+                self.meta = json.load(f)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"'{self.path}' bukan direktori arsip (tidak ada {FILE_META}).") from None
+        if self.meta.get("format") != VERSI_FORMAT:
+            raise ValueError(f"Format arsip {self.meta.get('format')} tidak didukung (diharapkan {VERSI_FORMAT}).")
+        self.jenis = self.meta["jenis"]
+        self.kunci = self._muat("kunci")
+        self.awal = self._muat("awal")
+        self._cache = {}
+
+    def _muat(self, nama):
+        return np.load(os.path.join(self.path, nama + ".npy"), mmap_mode="r")
+
+    @property
+    def versi(self):
+        """Id acak yang baru setiap kali arsip dibangun ulang; cocok sebagai kunci cache."""
+        return self.meta["id"]
+
+    def __len__(self):
+        return self.meta["jumlah_baris"]
+
+    def __contains__(self, kunci):
+        try:
+            self.indeks(kunci)
+        except KeyError:
+            return False
+        return True
+
+    def kolom(self, nama):
+        """Seluruh kolom sebagai memmap read-only."""
+        if nama not in self.meta["kolom"]:
+            raise KeyError(f"Kolom '{nama}' tidak ada di arsip; tersedia: {', '.join(self.meta['kolom'])}")
+        if nama not in self._cache:
+            self._cache[nama] = self._muat(nama)
+        return self._cache[nama]
+
+    def ringkasan(self, nama):
+        """Ringkasan per kunci (satu nilai per kunci, urutan sama dengan :attr:`kunci`)."""
+        if nama not in self.meta["ringkasan"]:
+            raise KeyError(f"Ringkasan '{nama}' tidak ada di arsip; tersedia: {', '.join(self.meta['ringkasan'])}")
+        kunci_cache = "ringkasan_" + nama
+        if kunci_cache not in self._cache:
+            self._cache[kunci_cache] = self._muat(kunci_cache)
+        return self._cache[kunci_cache]
+
+    def indeks(self, kunci):
+        """Posisi kunci di :attr:`kunci` (binary search di memmap)."""
+        kunci = str(kunci)
+        i = int(np.searchsorted(self.kunci, kunci))
+        if i == len(self.kunci) or self.kunci[i] != kunci:
+            raise KeyError(f"{self.meta['kolom_kunci']} '{kunci}' tidak ada di arsip.")
+        return i
+
+    def baris(self, kunci, kolom=None):
+        """Dict kolom -> irisan memmap untuk semua baris satu kunci."""
+        i = self.indeks(kunci)
+        a, b = int(self.awal[i]), int(self.awal[i + 1])
+        return {nama: self.kolom(nama)[a:b] for nama in (kolom or self.meta["kolom"])}
+
+
+@lru_cache(maxsize=8)
+def _buka(path, versi):
+    return Arsip(path)
+
+
+def buka(path):
+    """Buka arsip; dalam satu proses arsip yang sama (dan belum dibangun ulang) dipakai ulang."""
+    path = os.path.abspath(path)
+    try:
+        versi = os.stat(os.path.join(path, FILE_META)).st_mtime_ns
+    except FileNotFoundError:
+        raise FileNotFoundError(f"'{path}' bukan direktori arsip (tidak ada {FILE_META}).") from None
+    return _buka(path, versi)
+
+
+# --- Membangun arsip ---
+
+def _kolom_file(sumber):
+    if str(sumber).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        return pq.ParquetFile(sumber).schema_arrow.names
+    return list(pd.read_csv(sumber, nrows=0).columns)
+
+
+def _baca_chunk(sumber, kolom, ukuran_chunk):
+    if str(sumber).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(sumber).iter_batches(batch_size=ukuran_chunk, columns=kolom):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(sumber, usecols=kolom, chunksize=ukuran_chunk)
+
+
+def _bangun(daftar_sumber, tujuan, jenis, kolom_kunci, kolom_wajib, siapkan, ringkas, ukuran_chunk,
+            ringkas_blok=None):
+    """Bangun arsip dua lintasan.
+
+    ``siapkan(chunk)`` mengembalikan dict kolom -> array (baris tidak valid
+    sudah dibuang); ``ringkas(data)`` mengembalikan dict nama -> (cara, array)
+    dengan cara ``"jumlah"``, ``"min"`` atau ``"maks"`` per kunci.
+    ``ringkas_blok(data, kode, k)`` (opsional) menerima semua baris dari ``k``
+    kunci berurutan (``kode`` = indeks kunci lokal per baris) dan mengembalikan
+    dict nama -> array berpanjang ``k``.
+    """
+    daftar_sumber = [os.fspath(s) for s in daftar_sumber]
+    kolom_sumber = {}
+    for s in daftar_sumber:
+        ada = _kolom_file(s)
+        hilang = [k for k in kolom_wajib if not (k in ada if isinstance(k, str) else any(a in ada for a in k))]
+        if hilang:
+            raise ValueError(f"Kolom wajib tidak ditemukan di {s}: "
+                             + ", ".join(k if isinstance(k, str) else " atau ".join(k) for k in hilang))
+        kolom_sumber[s] = [a for k in kolom_wajib for a in ([k] if isinstance(k, str) else k) if a in ada]
+
+    def semua_chunk():
+        for s in daftar_sumber:
+            for chunk in _baca_chunk(s, kolom_sumber[s], ukuran_chunk):
+                data = siapkan(chunk)
+                kunci = data.pop(kolom_kunci)
+                yield (kunci if pd.api.types.is_string_dtype(kunci) else kunci.astype(str)), data
+
+    # Lintasan 1: jumlah baris per kunci dan tipe tiap kolom.
+    hitung = pd.Series(dtype=np.int64)
+    tipe = None
+    for kunci, data in semua_chunk():
+        hitung = hitung.add(kunci.value_counts(), fill_value=0)
+        tipe = tipe or {nama: nilai.dtype for nama, nilai in data.items()}
+    if tipe is None:
+        raise ValueError("Sumber data kosong.")
+    hitung = hitung.sort_index()
+    nama_kunci = hitung.index.to_numpy(dtype=str)
+    awal = np.concatenate([[0], np.cumsum(hitung.to_numpy(dtype=np.int64))])
+    K, N = len(nama_kunci), int(awal[-1])
+
+    sementara = tujuan + ".baru"
+    shutil.rmtree(sementara, ignore_errors=True)
+    os.makedirs(sementara)
+    np.save(os.path.join(sementara, "kunci.npy"), nama_kunci)
+    np.save(os.path.join(sementara, "awal.npy"), awal)
+
+    # Lintasan 2: tulis setiap baris ke posisinya; urutan asli dalam satu kunci dipertahankan.
+    keluaran = {nama: np.lib.format.open_memmap(os.path.join(sementara, nama + ".npy"), mode="w+", dtype=dt, shape=(N,))
+                for nama, dt in tipe.items()}
+    indeks_kunci = pd.Index(nama_kunci)  # hash, jauh lebih cepat daripada searchsorted string
+    posisi = awal[:-1].copy()
+    ringkasan = {}
+    awal_ringkasan = {"jumlah": 0.0, "min": np.inf, "maks": -np.inf}
+    for kunci, data in semua_chunk():
+        kode = indeks_kunci.get_indexer(kunci)
+        urut = np.argsort(kode, kind="stable")
+        kode_urut = kode[urut]
+        per_kunci = np.bincount(kode, minlength=K)
+        mulai_grup = np.concatenate([[0], np.cumsum(per_kunci)[:-1]])
+        target = posisi[kode_urut] + (np.arange(len(kode)) - mulai_grup[kode_urut])
+        for nama, nilai in data.items():
+            keluaran[nama][target] = nilai[urut]
+        posisi += per_kunci
+        for nama, (cara, nilai) in ringkas(data).items():
+            if nama not in ringkasan:
+                ringkasan[nama] = np.full(K, awal_ringkasan[cara])
+            if cara == "jumlah":
+                ringkasan[nama] += np.bincount(kode, weights=nilai, minlength=K)
+            else:
+                grup = pd.Series(nilai).groupby(kode).agg("min" if cara == "min" else "max")
+                fungsi = np.minimum if cara == "min" else np.maximum
+                ringkasan[nama][grup.index] = fungsi(ringkasan[nama][grup.index], grup.to_numpy())
+    for memmap in keluaran.values():
+        memmap.flush()
+    if ringkas_blok is not None:
+        # Blok kunci berurutan berisi sekitar ukuran_chunk baris (minimal satu kunci utuh).
+        k0 = 0
+        while k0 < K:
+            k1 = min(K, max(k0 + 1, int(np.searchsorted(awal, awal[k0] + ukuran_chunk, side="right")) - 1))
+            a, b = awal[k0], awal[k1]
+            kode = np.repeat(np.arange(k1 - k0), np.diff(awal[k0:k1 + 1]))
+            for nama, nilai in ringkas_blok({n: np.asarray(m[a:b]) for n, m in keluaran.items()}, kode, k1 - k0).items():
+                ringkasan.setdefault(nama, np.zeros(K))[k0:k1] = nilai
+            k0 = k1
+    del keluaran
+    for nama, nilai in ringkasan.items():
+        np.save(os.path.join(sementara, f"ringkasan_{nama}.npy"), nilai)
+
+    meta = {
+        "format": VERSI_FORMAT,
+        "jenis": jenis,
+        "id": uuid.uuid4().hex,
+        "dibuat": datetime.datetime.now().isoformat(timespec="seconds"),
+        "sumber": [os.path.abspath(s) for s in daftar_sumber],
+        "kolom_kunci": kolom_kunci,
+        "kolom": {nama: np.dtype(dt).str for nama, dt in tipe.items()},
+        "ringkasan": list(ringkasan),
+        "jumlah_baris": N,
+        "jumlah_kunci": K,
+    }
+    with open(os.path.join(sementara, FILE_META), "w", encoding="utf-8") as f:
+        json.dump(meta, f, indent=1, ensure_ascii=False)
+
+    # Ganti arsip lama sekaligus. Proses yang masih me-memory-map file lama
+    # tetap membaca isi lama sampai membuka ulang (lihat :func:`buka`).
+    lama = tujuan + ".lama"
+    if os.path.exists(tujuan):
+        shutil.rmtree(lama, ignore_errors=True)
+        os.replace(tujuan, lama)
+    os.replace(sementara, tujuan)
+    shutil.rmtree(lama, ignore_errors=True)
+    return Arsip(tujuan)
+
+
+def _siapkan_permintaan(chunk):
+    if "hari" in chunk.columns:
+        hari = pd.to_numeric(chunk["hari"], errors="coerce")
+    else:
+        # Tanggal disimpan sebagai nomor hari sejak 1970-01-01.
+        hari = (pd.to_datetime(chunk["tanggal"], errors="coerce") - pd.Timestamp("1970-01-01")).dt.days
+    permintaan = pd.to_numeric(chunk["permintaan"], errors="coerce").to_numpy(dtype=float)
+    hari = np.asarray(hari, dtype=float)
+    valid = ~(np.isnan(hari) | np.isnan(permintaan) | chunk["sku"].isna().to_numpy())
+    return {"sku": chunk["sku"][valid], "hari": hari[valid].astype(np.int32),
+            "permintaan": permintaan[valid]}
+
+
+def _ringkas_permintaan(data):
+    return {"jumlah": ("jumlah", data["permintaan"]),
+            "hari_awal": ("min", data["hari"]), "hari_akhir": ("maks", data["hari"])}
+
+
+def _ringkas_permintaan_harian(data, kode, k):
+    # Satu hari bisa punya beberapa baris (mis. baris transaksi), jadi dijumlahkan
+    # dulu per (SKU, hari) sebelum dikuadratkan: varian harian butuh Σ(total hari)².
+    harian = pd.Series(data["permintaan"]).groupby([kode, data["hari"]], sort=False).sum()
+    kuadrat = (harian ** 2).groupby(level=0).sum()
+    jumlah_kuadrat = np.zeros(k)
+    jumlah_kuadrat[kuadrat.index.to_numpy()] = kuadrat.to_numpy()
+    return {"jumlah_kuadrat": jumlah_kuadrat}
+
+
+def bangun_permintaan(daftar_sumber, tujuan, ukuran_chunk=1_000_000):
+    """Bangun arsip permintaan harian dari CSV/Parquet.
+
+    Kolom: ``sku``, ``hari`` (nomor hari) atau ``tanggal``, dan ``permintaan``.
+    Beberapa baris untuk SKU dan hari yang sama dijumlahkan sebagai permintaan
+    hari itu; hari tanpa baris untuk suatu SKU dianggap permintaannya nol.
+    """
+    return _bangun(daftar_sumber, os.fspath(tujuan), "permintaan", "sku",
+                   ["sku", ("hari", "tanggal"), "permintaan"], _siapkan_permintaan, _ringkas_permintaan, ukuran_chunk,
+                   ringkas_blok=_ringkas_permintaan_harian)
+
+
+# Pasangan (p, q) segitiga atas XᵀX dengan kolom intersep di indeks 0.
+_PASANGAN_XTX = [(p, q) for p in range(len(downtime.KOLOM_FITUR) + 1) for q in range(p, len(downtime.KOLOM_FITUR) + 1)]
+
+
+def _siapkan_downtime(chunk):
+    chunk = chunk.dropna()
+    data = {"mesin": chunk["mesin"]}
+    for k in (*downtime.KOLOM_FITUR, downtime.KOLOM_TARGET):
+        data[k] = chunk[k].to_numpy(dtype=float)
+    return data
+
+
+def _ringkas_downtime(data):
+    X = [np.ones(len(data[downtime.KOLOM_TARGET]))] + [data[k] for k in downtime.KOLOM_FITUR]
+    y = data[downtime.KOLOM_TARGET]
+    ringkasan = {f"xtx_{p}{q}": ("jumlah", X[p] * X[q]) for p, q in _PASANGAN_XTX}
+    ringkasan.update({f"xty_{p}": ("jumlah", X[p] * y) for p in range(len(X))})
+    return ringkasan
+
+
+def bangun_downtime(daftar_sumber, tujuan, ukuran_chunk=1_000_000):
+    """Bangun arsip log downtime dari CSV/Parquet; kolom ``mesin``, fitur dan target."""
+    return _bangun(daftar_sumber, os.fspath(tujuan), "downtime", "mesin", list(KOLOM_DOWNTIME),
+                   _siapkan_downtime, _ringkas_downtime, ukuran_chunk)
+
+
+# --- Pencarian untuk model ---
+
+def _periksa_jenis(arsip, jenis):
+    if arsip.jenis != jenis:
+        raise ValueError(f"Arsip '{arsip.path}' berisi data {arsip.jenis}, bukan {jenis}.")
+
+
+def statistik_permintaan(arsip, sku=None, hari_per_tahun=HARI_PER_TAHUN):
+    """D, rata-rata dan varian permintaan harian per SKU dari ringkasan arsip.
+
+    Periode setiap SKU adalah dari hari pertama sampai hari terakhir SKU itu
+    muncul; hari tanpa baris dihitung sebagai permintaan nol. ``sku`` satu
+    kunci menghasilkan dict skalar; list kunci atau ``None`` (semua SKU)
+    menghasilkan DataFrame.
+    """
+    _periksa_jenis(arsip, "permintaan")
+    if sku is None:
+        i, nama = slice(None), np.asarray(arsip.kunci)
+    elif np.ndim(sku) == 0:
+        i = arsip.indeks(sku)
+    else:
+        i, nama = [arsip.indeks(k) for k in sku], [str(k) for k in sku]
+    jumlah = np.asarray(arsip.ringkasan("jumlah")[i])
+    jumlah_kuadrat = np.asarray(arsip.ringkasan("jumlah_kuadrat")[i])
+    n_hari = np.asarray(arsip.ringkasan("hari_akhir")[i] - arsip.ringkasan("hari_awal")[i] + 1)
+    rata = jumlah / n_hari
+    with np.errstate(divide="ignore", invalid="ignore"):
+        varian = np.where(n_hari > 1, np.maximum(jumlah_kuadrat - n_hari * rata**2, 0) / (n_hari - 1), 0.0)
+    hasil = {"n_hari": n_hari.astype(np.int64), "rata_harian": rata, "varian_harian": varian,
+             "std_harian": np.sqrt(varian), "D": rata * hari_per_tahun}
+    if np.ndim(sku) == 0 and sku is not None:
+        return {"sku": str(sku), **{k: v.item() for k, v in hasil.items()}}
+    return pd.DataFrame({"sku": nama, **hasil})
+
+
+def akumulator_downtime(arsip, mesin=None):
+    """:class:`downtime.PersamaanNormal` untuk satu mesin, beberapa mesin, atau semua (``None``).
+
+    Hanya membaca ringkasan XᵀX/Xᵀy per mesin, bukan baris log.
+    """
+    _periksa_jenis(arsip, "downtime")
+    if mesin is None:
+        i = slice(None)
+    elif isinstance(mesin, (list, tuple)):
+        i = [arsip.indeks(m) for m in mesin]
+    else:
+        i = [arsip.indeks(mesin)]
+    hasil = downtime.PersamaanNormal()
+    for p, q in _PASANGAN_XTX:
+        hasil.xtx[p, q] = hasil.xtx[q, p] = np.asarray(arsip.ringkasan(f"xtx_{p}{q}")[i]).sum()
+    for p in range(len(hasil.xty)):
+        hasil.xty[p] = np.asarray(arsip.ringkasan(f"xty_{p}")[i]).sum()
+    hasil.n = int(round(hasil.xtx[0, 0]))
+    return hasil
+
+
+def data_downtime(arsip, mesin=None, n_maks=None):
+    """Baris latih satu mesin (atau semua) sebagai DataFrame; ``n_maks`` mengambil sampel berjarak rata."""
+    _periksa_jenis(arsip, "downtime")
+    kolom = [*downtime.KOLOM_FITUR, downtime.KOLOM_TARGET]
+    baris = {k: arsip.kolom(k) for k in kolom} if mesin is None else arsip.baris(mesin, kolom)
+    n = len(baris[downtime.KOLOM_TARGET])
+    langkah = max(1, -(-n // n_maks)) if n_maks else 1
+    return pd.DataFrame({k: np.asarray(v[::langkah]) for k, v in baris.items()})
@@ -0,0 +1,176 @@
+"""Menjalankan job perhitungan tanpa Streamlit (dipakai oleh CLI dan server HTTP).
+
+Satu job adalah dict dengan kunci ``jenis`` dan parameter perhitungannya, misalnya
+``{"jenis": "eoq", "D": 1800, "S": 90000, "H": 2500, "LT": 7}``. Parameter
+numerik boleh berupa list sehingga satu job dapat menghitung banyak item.
+Job ``eoq`` dan ``downtime`` juga bisa mengambil datanya dari arsip historis
+(``"arsip": path`` beserta ``"sku"`` atau ``"mesin"``, lihat :mod:`mtk.arsip`).
+Tabel (CSV) berisi kolom ``jenis`` dan kolom parameter; baris dengan jenis
+(dan arsip) yang sama dihitung bersama dalam satu panggilan tervektorisasi.
+Hasil tak hingga atau NaN (misalnya antrian yang tidak stabil) menjadi ``null``
+agar keluaran tetap JSON yang valid.
+"""
+import math
+import time
+
+import numpy as np
+import pandas as pd
+
+from . import antrian, arsip, downtime, optimasi, optimasi_integer, persediaan
+
+
+def _dari_arsip(fungsi, p, kunci):
+    # Dari tabel, "arsip" berupa kolom; semua baris harus memakai arsip yang sama.
+    path = np.unique(np.asarray(p["arsip"], dtype=str))
+    if len(path) != 1:
+        raise ValueError("Satu job hanya boleh memakai satu arsip.")
+    try:
+        return fungsi(arsip.buka(path[0]), kunci)
+    except KeyError as e:  # SKU/mesin tidak ada: kesalahan data, bukan parameter yang hilang
+        raise ValueError(e.args[0]) from None
+
+
+def _eoq(p):
+    if "arsip" not in p:
+        return persediaan.hitung_eoq(p["D"], p["S"], p["H"], p.get("LT", 0.0), p.get("safety_stock", 0.0))
+    # D diambil dari ringkasan arsip permintaan per SKU, tanpa membaca data harian.
+    statistik = _dari_arsip(arsip.statistik_permintaan, p, p["sku"])
+    D, std_harian = np.asarray(statistik["D"]), np.asarray(statistik["std_harian"])
+    hasil = persediaan.hitung_eoq(D, p["S"], p["H"], p.get("LT", 0.0), p.get("safety_stock", 0.0))
+    return {"D": D, "std_harian": std_harian, **hasil}
+
+
+def _lp(p):
+    return optimasi.selesaikan(p["keuntungan"], p["konsumsi"], p["kapasitas"])
+
+
+def _lp_sensitivitas(p):
+    return optimasi.analisis_sensitivitas(p["keuntungan"], p["konsumsi"], p["kapasitas"])
+
+
+def _milp(p):
+    hasil = optimasi_integer.selesaikan_milp(p["keuntungan"], p["konsumsi"], p["kapasitas"], p.get("biaya_setup"),
+                                             p.get("lot_minimum"), batas_waktu=p.get("batas_waktu", 10.0),
+                                             gap_relatif=p.get("gap_relatif", 0.01))
+    hasil.pop("riwayat")
+    return hasil
+
+
+def _mm1(p):
+    return antrian.mm1(p["lam"], p["mu"])
+
+
+def _mmc(p):
+    return antrian.mmc(p["lam"], p["mu"], p["c"])
+
+
+def _mmck(p):
+    return antrian.mmck(p["lam"], p["mu"], p["c"], p["K"])
+
+
+def _mg1(p):
+    return antrian.mg1(p["lam"], p["mu"], p["std_layanan"])
+
+
+def _downtime(p):
+    # Data latih: baris {jam_operasional, umur_mesin, downtime}, path file log, atau
+    # arsip (ringkasan XᵀX/Xᵀy per mesin; "mesin" opsional, default semua mesin).
+    if "arsip" in p:
+        model = _dari_arsip(arsip.akumulator_downtime, p, p.get("mesin")).model()
+    elif "path" in p:
+        _, model = downtime.latih_streaming([p["path"]] if isinstance(p["path"], str) else p["path"])
+    else:
+        model = downtime.PersamaanNormal().tambah(pd.DataFrame(p["data"])).model()
+    return {"prediksi": model.predict(np.atleast_2d(p["prediksi"])), "coef": model.coef_, "intercept": model.intercept_}
+
+
+JENIS = {
+    "eoq": _eoq,
+    "lp": _lp,
+    "lp_sensitivitas": _lp_sensitivitas,
+    "milp": _milp,
+    "mm1": _mm1,
+    "mmc": _mmc,
+    "mmck": _mmck,
+    "mg1": _mg1,
+    "downtime": _downtime,
+}
+# Jenis yang parameternya skalar per baris sehingga bisa dipakai dari tabel CSV.
+JENIS_TABEL = ("eoq", "mm1", "mmc", "mmck", "mg1")
+
+
+# Kesalahan karena isi input (bukan bug): dilaporkan sebagai hasil error, batch jalan terus.
+_KESALAHAN_INPUT = (ValueError, TypeError, OSError, np.linalg.LinAlgError)
+
+
+def _ke_json(nilai):
+    # JSON tidak punya Infinity/NaN: nilai tak hingga ditulis sebagai null.
+    if isinstance(nilai, dict):
+        return {k: _ke_json(v) for k, v in nilai.items()}
+    if isinstance(nilai, (list, tuple)):
+        return [_ke_json(v) for v in nilai]
+    if isinstance(nilai, np.ndarray):
+        if nilai.dtype.kind in "fc":
+            tak_hingga = ~np.isfinite(nilai)
+            if tak_hingga.any():
+                nilai = nilai.astype(object)
+                nilai[tak_hingga] = None
+        return nilai.tolist()
+    if isinstance(nilai, np.generic):
+        nilai = nilai.item()
+    if isinstance(nilai, float) and not math.isfinite(nilai):
+        return None
+    return nilai
+
+
+def jalankan(job):
+    """Jalankan satu job dan kembalikan hasil yang bisa diserialisasi ke JSON.
+
+    Kesalahan input tidak menghentikan batch; hasilnya berupa ``{"error": ...}``.
+    """
+    try:
+        fungsi = JENIS[job["jenis"]]
+        return _ke_json(fungsi(job))
+    except KeyError as e:
+        return {"error": f"Parameter atau jenis job tidak dikenal: {e}"}
+    except _KESALAHAN_INPUT as e:
+        return {"error": str(e)}
+
+
+def jalankan_semua(daftar_job):
+    """Jalankan list job; kembalikan ``(hasil, statistik)``."""
+    mulai = time.perf_counter()
+    hasil = [jalankan(job) for job in daftar_job]
+    return hasil, _statistik(len(hasil), time.perf_counter() - mulai)
+
+
+def jalankan_tabel(df):
+    """Jalankan job dari tabel; kolom hasil ditambahkan di samping kolom input."""
+    if "jenis" not in df.columns:
+        raise ValueError("Tabel job harus memiliki kolom 'jenis'.")
+    mulai = time.perf_counter()
+    bagian = []
+    # Baris dengan arsip berbeda (atau tanpa arsip) dihitung terpisah: hanya baris
+    # yang mengisi kolom "arsip" yang mengambil datanya dari arsip.
+    kolom_grup = ["jenis"] + (["arsip"] if "arsip" in df.columns else [])
+    for kunci, grup in df.groupby(kolom_grup, sort=False, dropna=False):
+        jenis = kunci[0]
+        if jenis not in JENIS_TABEL:
+            bagian.append(grup.assign(error=f"Jenis '{jenis}' tidak didukung untuk input tabel."))
+            continue
+        parameter = {k: grup[k].to_numpy() for k in grup.columns if not (k == "arsip" and pd.isna(kunci[1]))}
+        try:
+            hasil = JENIS[jenis](parameter)
+        except KeyError as e:
+            bagian.append(grup.assign(error=f"Kolom parameter tidak ditemukan: {e}"))
+            continue
+        except _KESALAHAN_INPUT as e:  # sama seperti jalankan: satu grup gagal, grup lain tetap dihitung
+            bagian.append(grup.assign(error=str(e)))
+            continue
+        bagian.append(grup.assign(**{k: np.broadcast_to(v, len(grup)) for k, v in hasil.items()}))
+    tabel = pd.concat(bagian).loc[df.index]
+    return tabel, _statistik(len(df), time.perf_counter() - mulai)
+
+
+def _statistik(n, durasi):
+    return {"jumlah_job": n, "durasi_detik": durasi, "job_per_detik": n / durasi if durasi > 0 else None}
@@ -0,0 +1,150 @@
+"""Cache hasil lintas sesi untuk perhitungan deterministik (LP, EOQ, antrian).
+
+Kunci dibentuk dari nama perhitungan dan input yang dinormalisasi: angka
+menjadi float (30 dan 30.0 sama), list/tuple/array menjadi daftar float, dan
+array/matriks besar diwakili hash isinya. Dua tingkat penyimpanan:
+
+1. LRU di memori proses, dibatasi total ukuran, dipakai bersama oleh semua
+   sesi. Yang disimpan adalah hasil yang sudah di-pickle dan setiap hit
+   mendapat salinan baru, sehingga sesi yang mengubah hasilnya (misalnya
+   menambah kolom DataFrame) tidak merusak hasil untuk sesi lain.
+2. Opsional: SQLite di disk sehingga hasil bertahan setelah restart.
+"""
+import dataclasses
+import hashlib
+import json
+import pickle
+import sqlite3
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from . import diagnostik
+
+# Naikkan bila rumus perhitungan berubah agar hasil lama di disk tidak dipakai.
+VERSI_CACHE = 2
+
+
+def _hash_array(a):
+    a = np.ascontiguousarray(a, dtype=float) + 0.0  # -0.0 -> 0.0
+    return {"shape": list(a.shape), "sha256": hashlib.sha256(a.tobytes()).hexdigest()}
+
+
+def normalisasi(nilai):
+    """Ubah input menjadi struktur JSON yang sama untuk input yang setara."""
+    if nilai is None or isinstance(nilai, (bool, str)):
+        return nilai
+    if isinstance(nilai, (int, float, np.number)):
+        return float(nilai) + 0.0
+    if isinstance(nilai, dict):
+        return {str(k): normalisasi(v) for k, v in sorted(nilai.items())}
+    if isinstance(nilai, (list, tuple)):
+        return [normalisasi(v) for v in nilai]
+    if isinstance(nilai, np.ndarray):
+        return normalisasi(nilai.tolist()) if nilai.size <= 64 else _hash_array(nilai)
+    if hasattr(nilai, "tocsr"):  # matriks scipy.sparse
+        A = nilai.tocsr(copy=True)
+        A.sum_duplicates()
+        A.sort_indices()
+        return {"sparse": list(A.shape), "indptr": _hash_array(A.indptr),
+                "indices": _hash_array(A.indices), "data": _hash_array(A.data)}
+    if hasattr(nilai, "columns") and hasattr(nilai, "index"):  # pandas DataFrame
+        import pandas as pd
+
+        hash_baris = pd.util.hash_pandas_object(nilai).to_numpy()
+        return {"kolom": [str(k) for k in nilai.columns], "sha256": hashlib.sha256(hash_baris.tobytes()).hexdigest()}
+    if dataclasses.is_dataclass(nilai):
+        return {f.name: normalisasi(getattr(nilai, f.name)) for f in dataclasses.fields(nilai)}
+    raise TypeError(f"Input bertipe {type(nilai).__name__} tidak bisa dijadikan kunci cache.")
+
+
+def buat_kunci(nama, *args, **kwargs):
+    isi = json.dumps([VERSI_CACHE, nama, normalisasi(list(args)), normalisasi(kwargs)], separators=(",", ":"))
+    return hashlib.sha256(isi.encode()).hexdigest()
+
+
+class CacheHasil:
+    """LRU thread-safe di memori dengan tingkat SQLite opsional (``path_db``).
+
+    Miss dicatat di diagnostik sebagai tahap ``"<tahap> <nama>"``, misalnya
+    ``"hitung eoq"`` atau ``"render png_batang"`` untuk cache grafik.
+    """
+
+    def __init__(self, maks_byte=64 * 2**20, path_db=None, tahap="hitung"):
+        self.maks_byte = maks_byte
+        self.path_db = path_db
+        self.tahap = tahap
+        self._lock = threading.Lock()
+        self._lru = OrderedDict()  # kunci -> hasil yang di-pickle (bytes)
+        self._ukuran = 0
+        self._hit_memori = self._hit_disk = self._miss = 0
+        self._db = None
+        if path_db:
+            self._db = sqlite3.connect(path_db, check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS hasil (kunci TEXT PRIMARY KEY, nilai BLOB)")
+            self._db.commit()
+
+    def ambil_atau_hitung(self, nama, fungsi, *args, **kwargs):
+        """Kembalikan ``(hasil, dari_cache)``; ``fungsi(*args, **kwargs)`` hanya dipanggil bila belum ada."""
+        kunci = buat_kunci(nama, *args, **kwargs)
+        with self._lock:
+            data = self._lru.get(kunci)
+            if data is not None:
+                self._lru.move_to_end(kunci)
+                self._hit_memori += 1
+            elif self._db is not None:
+                baris = self._db.execute("SELECT nilai FROM hasil WHERE kunci = ?", (kunci,)).fetchone()
+                if baris is not None:
+                    data = baris[0]
+                    self._hit_disk += 1
+                    self._simpan_memori(kunci, data)
+            if data is None:
+                self._miss += 1
+        if data is not None:
+            return pickle.loads(data), True
+
+        # Dihitung di luar lock agar sesi lain tidak menunggu perhitungan ini.
+        with diagnostik.tahap(f"{self.tahap} {nama}"):
+            hasil = fungsi(*args, **kwargs)
+        data = pickle.dumps(hasil, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._simpan_memori(kunci, data)
+            if self._db is not None:
+                self._db.execute("INSERT OR REPLACE INTO hasil VALUES (?, ?)", (kunci, data))
+                self._db.commit()
+        return hasil, False
+
+    def _simpan_memori(self, kunci, data):
+        if len(data) > self.maks_byte:
+            return  # terlalu besar untuk memori; tetap tersedia di disk bila ada
+        if kunci in self._lru:
+            self._ukuran -= len(self._lru.pop(kunci))
+        self._lru[kunci] = data
+        self._ukuran += len(data)
+        while self._ukuran > self.maks_byte:
+            self._ukuran -= len(self._lru.popitem(last=False)[1])
+
+    def statistik(self):
+        with self._lock:
+            n_disk = self._db.execute("SELECT COUNT(*) FROM hasil").fetchone()[0] if self._db is not None else None
+            total = self._hit_memori + self._hit_disk + self._miss
+            return {
+                "hit_memori": self._hit_memori,
+                "hit_disk": self._hit_disk,
+                "miss": self._miss,
+                "rasio_hit": (self._hit_memori + self._hit_disk) / total if total else 0.0,
+                "entri_memori": len(self._lru),
+                "byte_memori": self._ukuran,
+                "entri_disk": n_disk,
+            }
+
+    def kosongkan(self):
+        """Hapus semua entri (memori dan disk) dan reset penghitung."""
+        with self._lock:
+            self._lru.clear()
+            self._ukuran = 0
+            self._hit_memori = self._hit_disk = self._miss = 0
+            if self._db is not None:
+                self._db.execute("DELETE FROM hasil")
+                self._db.commit()
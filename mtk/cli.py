@@ -0,0 +1,87 @@
+"""CLI batch: ``python -m mtk jalankan jobs.json``, ``python -m mtk server`` atau
+``python -m mtk arsip permintaan data/*.csv -o arsip/permintaan``.
+
+Input ``.json`` (satu job atau list job), ``.jsonl`` (satu job per baris) atau
+``.csv`` (kolom ``jenis`` + parameter). Hasil ditulis ke stdout atau ``-o``;
+ringkasan throughput dicetak ke stderr.
+"""
+import argparse
+import json
+import sys
+
+import pandas as pd
+
+from . import batch
+
+
+def _baca_job(path):
+    with open(path, encoding="utf-8") as f:
+        if path.endswith(".jsonl"):
+            return [json.loads(baris) for baris in f if baris.strip()]
+        job = json.load(f)
+    return job if isinstance(job, list) else [job]
+
+
+def perintah_jalankan(args):
+    if args.input.endswith(".csv"):
+        tabel, statistik = batch.jalankan_tabel(pd.read_csv(args.input))
+        tabel.to_csv(args.output or sys.stdout, index=False)
+    else:
+        hasil, statistik = batch.jalankan_semua(_baca_job(args.input))
+        keluaran = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+        try:
+            for h in hasil:
+                keluaran.write(json.dumps(h, allow_nan=False) + "\n")
+        finally:
+            if args.output:
+                keluaran.close()
+    laju = statistik["job_per_detik"]
+    print(f"{statistik['jumlah_job']:,} job dalam {statistik['durasi_detik']:.3f} detik"
+          + (f" ({laju:,.0f} job/detik)" if laju is not None else ""), file=sys.stderr)
+
+
+def perintah_arsip(args):
+    import time
+
+    from . import arsip
+
+    bangun = arsip.bangun_permintaan if args.jenis == "permintaan" else arsip.bangun_downtime
+    mulai = time.perf_counter()
+    hasil = bangun(args.sumber, args.output, ukuran_chunk=args.ukuran_chunk)
+    print(f"{len(hasil):,} baris, {hasil.meta['jumlah_kunci']:,} {hasil.meta['kolom_kunci']} "
+          f"ditulis ke {args.output} dalam {time.perf_counter() - mulai:.1f} detik", file=sys.stderr)
+
+
+def perintah_server(args):
+    from .server import jalankan_server
+
+    jalankan_server(args.host, args.port)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m mtk", description="Perhitungan operasional industri tanpa UI.")
+    sub = parser.add_subparsers(dest="perintah", required=True)
+
+    p = sub.add_parser("jalankan", help="Jalankan job dari file JSON, JSONL atau CSV.")
+    p.add_argument("input")
+    p.add_argument("-o", "--output", help="File hasil (default: stdout).")
+    p.set_defaults(fungsi=perintah_jalankan)
+
+    p = sub.add_parser("arsip", help="Bangun arsip kolumnar ter-memory-map dari file CSV/Parquet historis.")
+    p.add_argument("jenis", choices=["permintaan", "downtime"])
+    p.add_argument("sumber", nargs="+")
+    p.add_argument("-o", "--output", required=True, help="Direktori arsip (diganti bila sudah ada).")
+    p.add_argument("--ukuran-chunk", type=int, default=1_000_000)
+    p.set_defaults(fungsi=perintah_arsip)
+
+    p = sub.add_parser("server", help="Jalankan endpoint HTTP lokal untuk job.")
+    p.add_argument("--host", default="127.0.0.1")
+    p.add_argument("--port", type=int, default=8600)
+    p.set_defaults(fungsi=perintah_server)
+
+    args = parser.parse_args(argv)
+    args.fungsi(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,193 @@
+"""Pengukuran opt-in per rerun: waktu tiap tahap, memori puncak dan profil.
+
+Kode aplikasi menandai tahap dengan ``with diagnostik.tahap("hitung"):``.
+Bila tidak ada :class:`Pencatat` yang aktif, ``tahap`` hanya mengembalikan
+context manager kosong yang sama (satu lookup ``ContextVar``), sehingga
+instrumentasi boleh dibiarkan di jalur panas.
+
+Pencatat aktif disimpan per konteks (thread skrip Streamlit per sesi),
+sehingga sesi lain tidak ikut tercatat. Pengukuran memori memakai
+``tracemalloc`` yang berlaku untuk seluruh proses dan memperlambat eksekusi;
+hasilnya paling akurat bila hanya satu sesi yang diukur.
+"""
+import contextlib
+import contextvars
+import datetime
+import importlib.util
+import io
+import json
+import logging
+import time
+import tracemalloc
+
+_log = logging.getLogger(__name__)
+_pencatat = contextvars.ContextVar("pencatat_diagnostik", default=None)
+_KOSONG = contextlib.nullcontext()
+
+
+def aktif():
+    """Pencatat yang sedang aktif di konteks ini, atau ``None``."""
+    return _pencatat.get()
+
+
+def tahap(nama):
+    """Catat durasi blok ``with`` sebagai satu tahap; tanpa efek bila pencatat tidak aktif."""
+    pencatat = _pencatat.get()
+    return _KOSONG if pencatat is None else pencatat.tahap(nama)
+
+
+def selesai():
+    """Hentikan pencatat yang aktif (bila ada) dan kembalikan pencatat itu."""
+    pencatat = _pencatat.get()
+    return pencatat.selesai() if pencatat is not None else None
+
+
+def profiler_tersedia():
+    """Profiler yang bisa dipakai: cProfile selalu ada, pyinstrument bila terpasang."""
+    return ["cProfile"] + (["pyinstrument"] if importlib.util.find_spec("pyinstrument") else [])
+
+
+class Pencatat:
+    """Catatan satu rerun (atau satu rerun fragment).
+
+    ``ukur_memori`` menambahkan memori puncak (byte, relatif terhadap awal
+    tahap) per tahap. ``profiler`` (``"cProfile"`` atau ``"pyinstrument"``)
+    merekam profil seluruh rerun ke ``laporan_profil``. Saat selesai, ringkasan
+    ditulis sebagai satu baris JSON ke logger ``mtk.diagnostik`` dan, bila
+    ``path_log`` diisi, ditambahkan ke file JSON Lines tersebut.
+    """
+
+    def __init__(self, nama="rerun", ukur_memori=False, profiler=None, path_log=None):
+        self.nama = nama
+        self.ukur_memori = ukur_memori
+        self.profiler = profiler
+        self.path_log = path_log
+        self.waktu = None
+        self.durasi = None
+        self.memori_puncak = None
+        self.laporan_profil = None
+        self.tahap_selesai = []
+        self._tumpukan = []
+        self._akar = {"puncak_anak": 0}
+        self._profiler = None
+        self._tracemalloc_sendiri = False
+        self._mulai = None
+
+    def mulai(self):
+        lama = _pencatat.get()
+        if lama is not None and lama is not self:
+            lama.selesai()  # tertinggal dari rerun yang berhenti karena exception
+        self.waktu = datetime.datetime.now().isoformat(timespec="seconds")
+        if self.ukur_memori:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._tracemalloc_sendiri = True
+            self._akar["memori_awal"] = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+        if self.profiler:
+            self._profiler = _mulai_profiler(self.profiler)
+        _pencatat.set(self)
+        self._mulai = time.perf_counter()
+        return self
+
+    def selesai(self):
+        if self.durasi is not None:
+            return self
+        self.durasi = time.perf_counter() - self._mulai
+        if _pencatat.get() is self:
+            _pencatat.set(None)
+        if self._profiler is not None:
+            self.laporan_profil = _laporan_profiler(self._profiler)
+            self._profiler = None
+        if self.ukur_memori:
+            puncak = max(tracemalloc.get_traced_memory()[1], self._akar["puncak_anak"])
+            self.memori_puncak = max(puncak - self._akar["memori_awal"], 0)
+            if self._tracemalloc_sendiri:
+                tracemalloc.stop()
+        data = json.dumps(self.ke_dict(laporan_profil=False), ensure_ascii=False)
+        _log.info(data)
+        if self.path_log:
+            with open(self.path_log, "a", encoding="utf-8") as f:
+                f.write(data + "\n")
+        return self
+
+    __enter__ = mulai
+
+    def __exit__(self, *exc):
+        self.selesai()
+
+    @contextlib.contextmanager
+    def tahap(self, nama):
+        induk = self._tumpukan[-1] if self._tumpukan else self._akar
+        masuk = {"puncak_anak": 0}
+        if self.ukur_memori:
+            # Puncak induk sejauh ini disimpan sebelum di-reset untuk tahap ini.
+            saat_ini, puncak = tracemalloc.get_traced_memory()
+            induk["puncak_anak"] = max(induk["puncak_anak"], puncak)
+            masuk["memori_awal"] = saat_ini
+            tracemalloc.reset_peak()
+        indeks = len(self.tahap_selesai)
+        self.tahap_selesai.append(None)  # urutan baris mengikuti waktu mulai
+        self._tumpukan.append(masuk)
+        mulai = time.perf_counter()
+        try:
+            yield
+        finally:
+            durasi = time.perf_counter() - mulai
+            self._tumpukan.pop()
+            baris = {"tahap": nama, "kedalaman": len(self._tumpukan), "mulai_detik": mulai - self._mulai,
+                     "durasi_detik": durasi}
+            if self.ukur_memori:
+                puncak = max(tracemalloc.get_traced_memory()[1], masuk["puncak_anak"])
+                baris["memori_puncak_byte"] = max(puncak - masuk["memori_awal"], 0)
+                induk["puncak_anak"] = max(induk["puncak_anak"], puncak)
+            self.tahap_selesai[indeks] = baris
+
+    def ke_dict(self, laporan_profil=True):
+        """Ringkasan yang bisa diserialisasi ke JSON.
+
+        ``di_luar_tahap_detik`` adalah waktu rerun yang tidak masuk tahap mana
+        pun: pemanggilan widget Streamlit dan kode skrip lain.
+        """
+        tahap = [b for b in self.tahap_selesai if b is not None]
+        data = {
+            "nama": self.nama,
+            "waktu": self.waktu,
+            "durasi_detik": self.durasi,
+            "di_luar_tahap_detik": None if self.durasi is None else
+            self.durasi - sum(b["durasi_detik"] for b in tahap if b["kedalaman"] == 0),
+            "memori_puncak_byte": self.memori_puncak,
+            "profiler": self.profiler,
+            "tahap": tahap,
+        }
+        if laporan_profil:
+            data["laporan_profil"] = self.laporan_profil
+        return data
+
+
+def _mulai_profiler(jenis):
+    if jenis == "pyinstrument":
+        from pyinstrument import Profiler
+
+        profiler = Profiler()
+        profiler.start()
+        return profiler
+    if jenis != "cProfile":
+        raise ValueError(f"Profiler '{jenis}' tidak dikenal; pilih salah satu dari {profiler_tersedia()}.")
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+    return profiler
+
+
+def _laporan_profiler(profiler, baris=40):
+    if hasattr(profiler, "output_text"):  # pyinstrument
+        profiler.stop()
+        return profiler.output_text(unicode=True, color=False)
+    import pstats
+
+    profiler.disable()
+    keluaran = io.StringIO()
+    pstats.Stats(profiler, stream=keluaran).strip_dirs().sort_stats("cumulative").print_stats(baris)
+    return keluaran.getvalue()
@@ -0,0 +1,149 @@
+"""Data historis dan model regresi untuk prediksi downtime mesin.
+
+Untuk log telemetri yang terlalu besar untuk dimuat ke memori, regresi dilatih
+secara bertahap: file dibaca per chunk dan setiap chunk hanya menambah matriks
+persamaan normal XᵀX dan Xᵀy. Akumulator dari file atau proses berbeda dapat
+dijumlahkan lalu diselesaikan sekali.
+"""
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+KOLOM_FITUR = ["jam_operasional", "umur_mesin"]
+KOLOM_TARGET = "downtime"
+VERSI_SINTETIS = 1  # naikkan bila cara pembuatan data sintetis berubah
+
+
+def data_sintetis(seed=0, n=50):
+    """Data historis contoh: downtime = 0.1 * jam + 0.5 * umur + noise."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        "jam_operasional": rng.integers(20, 100, n),
+        "umur_mesin": rng.integers(1, 20, n),
+    })
+    df[KOLOM_TARGET] = 0.1 * df["jam_operasional"] + 0.5 * df["umur_mesin"] + rng.normal(0, 2, n)
+    return df
+
+
+def baca_data(sumber, nama_file=""):
+    """Baca data historis downtime dari CSV atau Parquet."""
+    if str(nama_file or sumber).endswith(".parquet"):
+        df = pd.read_parquet(sumber)
+    else:
+        df = pd.read_csv(sumber)
+    hilang = [k for k in KOLOM_FITUR + [KOLOM_TARGET] if k not in df.columns]
+    if hilang:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(hilang)}")
+    return df[KOLOM_FITUR + [KOLOM_TARGET]].dropna()
+
+
+def versi_data(isi):
+    """Kunci versi data dari isi file (bytes); berubah hanya bila isinya berubah."""
+    return hashlib.sha256(isi).hexdigest()[:16]
+
+
+def latih_model(df):
+    from sklearn.linear_model import LinearRegression  # hanya dimuat bila model dilatih
+
+    model = LinearRegression()
+    model.fit(df[KOLOM_FITUR].to_numpy(dtype=float), df[KOLOM_TARGET].to_numpy(dtype=float))
+    return model
+
+
+class ModelLinear:
+    """Model linear hasil persamaan normal; antarmukanya sama dengan LinearRegression."""
+
+    def __init__(self, coef, intercept):
+        self.coef_ = np.asarray(coef, dtype=float)
+        self.intercept_ = float(intercept)
+
+    def predict(self, X):
+        return np.asarray(X, dtype=float) @ self.coef_ + self.intercept_
+
+
+class PersamaanNormal:
+    """Akumulator XᵀX dan Xᵀy (dengan kolom intersep) untuk regresi bertahap."""
+
+    def __init__(self, n_fitur=len(KOLOM_FITUR)):
+        self.xtx = np.zeros((n_fitur + 1, n_fitur + 1))
+        self.xty = np.zeros(n_fitur + 1)
+        self.n = 0
+
+    def tambah(self, df):
+        X = np.column_stack([np.ones(len(df)), df[KOLOM_FITUR].to_numpy(dtype=float)])
+        y = df[KOLOM_TARGET].to_numpy(dtype=float)
+        self.xtx += X.T @ X
+        self.xty += X.T @ y
+        self.n += len(df)
+        return self
+
+    def gabung(self, lain):
+        hasil = PersamaanNormal(len(self.xty) - 1)
+        hasil.xtx = self.xtx + lain.xtx
+        hasil.xty = self.xty + lain.xty
+        hasil.n = self.n + lain.n
+        return hasil
+
+    __add__ = gabung
+
+    def model(self):
+        if self.n == 0:
+            raise ValueError("Belum ada data untuk melatih model.")
+        beta = np.linalg.lstsq(self.xtx, self.xty, rcond=None)[0]
+        return ModelLinear(beta[1:], beta[0])
+
+    def simpan(self, path):
+        np.savez(path, xtx=self.xtx, xty=self.xty, n=self.n)
+
+    @classmethod
+    def muat(cls, path):
+        data = np.load(path)
+        hasil = cls(len(data["xty"]) - 1)
+        hasil.xtx, hasil.xty, hasil.n = data["xtx"], data["xty"], int(data["n"])
+        return hasil
+
+
+def baca_chunk(sumber, ukuran_chunk=1_000_000):
+    """Generator chunk DataFrame (hanya kolom fitur dan target) dari CSV/Parquet."""
+    kolom = KOLOM_FITUR + [KOLOM_TARGET]
+    if str(sumber).endswith(".parquet"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(sumber).iter_batches(batch_size=ukuran_chunk, columns=kolom):
+            yield batch.to_pandas().dropna()
+    else:
+        for chunk in pd.read_csv(sumber, usecols=kolom, chunksize=ukuran_chunk):
+            yield chunk.dropna()
+
+
+def latih_file(sumber, ukuran_chunk=1_000_000):
+    """Akumulasi persamaan normal dari satu file tanpa memuat seluruh isinya."""
+    akumulator = PersamaanNormal()
+    for chunk in baca_chunk(sumber, ukuran_chunk):
+        akumulator.tambah(chunk)
+    return akumulator
+
+
+def latih_streaming(daftar_sumber, ukuran_chunk=1_000_000, n_proses=None):
+    """Latih model dari beberapa file log; tiap file diproses paralel lalu digabung.
+
+    Mengembalikan ``(akumulator, model)``.
+    """
+    daftar_sumber = list(daftar_sumber)
+    n_proses = max(1, min(n_proses or os.cpu_count() or 1, len(daftar_sumber)))
+    if n_proses == 1:
+        bagian = [latih_file(s, ukuran_chunk) for s in daftar_sumber]
+    else:
+        with ProcessPoolExecutor(n_proses) as pool:
+            bagian = list(pool.map(latih_file, daftar_sumber, [ukuran_chunk] * len(daftar_sumber)))
+    akumulator = sum(bagian[1:], bagian[0])
+    return akumulator, akumulator.model()
+
+
+def versi_file(daftar_sumber):
+    """Kunci versi dari ukuran dan waktu modifikasi file, tanpa membaca isinya."""
+    info = [(str(s), os.path.getsize(s), os.path.getmtime(s)) for s in daftar_sumber]
+    return hashlib.sha256(repr(info).encode()).hexdigest()[:16]
@@ -0,0 +1,204 @@
+"""Pembuatan grafik yang biayanya tidak bergantung pada besarnya input.
+
+Kurva total biaya EOQ diambil sampelnya dengan jumlah titik tetap (log-spaced
+di sekitar EOQ), bukan satu titik per unit Q. Gambar PNG yang sudah dirender
+disimpan dalam cache LRU berdasarkan (D, S, H).
+
+Grafik lain juga digambar pada ``matplotlib.figure.Figure`` langsung (bukan
+lewat pyplot) sehingga tidak tertinggal di registry figure global, lalu PNG-nya
+di-cache bersama untuk semua sesi dengan kunci hash input grafik. Rerun dengan
+input yang sama tidak merender ulang. Untuk deret panjang seperti jejak
+persediaan bertahun-tahun tersedia versi Vega-Lite yang dirender di browser.
+matplotlib baru diimpor saat grafik pertama dirender, bukan saat modul diimpor.
+"""
+import io
+from functools import lru_cache
+
+import numpy as np
+
+from . import diagnostik
+from .cache import CacheHasil
+
+N_TITIK_KURVA = 401  # ganjil agar titik tengah tepat di EOQ
+DPI_APLIKASI = 200  # sama dengan st.pyplot agar tampilan tidak berubah
+
+# PNG hasil render dibagi oleh semua sesi di proses ini; hit cukup satu hash input.
+# Miss tercatat sebagai tahap "render png_*", terpisah dari "hitung ..." milik model.
+_CACHE_PNG = CacheHasil(maks_byte=32 * 2**20, tahap="render")
+
+
+def kurva_biaya(D, S, H, n_titik=N_TITIK_KURVA, rentang=(0.5, 2.0)):
+    """Titik (Q, TC) dari ``rentang[0]`` x EOQ sampai ``rentang[1]`` x EOQ."""
+    EOQ = np.sqrt(2 * D * S / H)
+    Q = np.geomspace(rentang[0] * EOQ, rentang[1] * EOQ, n_titik)
+    TC = (D / Q) * S + (Q / 2) * H
+    return Q, TC
+
+
+def _png(fig, dpi=None):
+    with diagnostik.tahap("encode gambar"):
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", bbox_inches="tight", dpi=dpi or "figure")
+        return buf.getvalue()
+
+
+@lru_cache(maxsize=256)
+def png_kurva_biaya(D, S, H):
+    """PNG grafik total biaya vs jumlah pemesanan, di-cache per (D, S, H)."""
+    EOQ = np.sqrt(2 * D * S / H)
+    Q, TC = kurva_biaya(D, S, H)
+
+    with diagnostik.tahap("bangun grafik"):
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(8, 5))
+        ax = fig.subplots()
+        ax.plot(Q, TC, label="Total Biaya", color='blue')
+        ax.axvline(EOQ, color='red', linestyle='--', label=f"EOQ ≈ {EOQ:.0f}")
+        ax.set_xlabel("Jumlah Pemesanan (Q)")
+        ax.set_ylabel("Total Biaya (Rp)")
+        ax.set_title("Grafik Total Biaya vs Jumlah Pemesanan")
+        ax.legend()
+        ax.grid(True, linestyle='--', alpha=0.7)
+    return _png(fig)
+
+
+def _render_batang(kategori, nilai, judul, label_x, label_y, warna, palet):
+    with diagnostik.tahap("bangun grafik"):
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+        ax = fig.subplots()
+        if palet is not None:
+            import matplotlib
+
+            warna = matplotlib.colormaps[palet].colors[:len(kategori)]
+        ax.bar(kategori, nilai, color=warna)
+        if judul:
+            ax.set_title(judul)
+        if label_x:
+            ax.set_xlabel(label_x)
+        if label_y:
+            ax.set_ylabel(label_y)
+    return _png(fig, DPI_APLIKASI)
+
+
+def png_batang(kategori, nilai, judul=None, label_x=None, label_y=None, warna=None, palet=None):
+    """PNG grafik batang, di-cache per input.
+
+    ``warna`` satu warna atau satu warna per batang; ``palet`` nama colormap
+    kualitatif matplotlib (misalnya ``"Set2"``) sebagai gantinya.
+    """
+    png, _ = _CACHE_PNG.ambil_atau_hitung("png_batang", _render_batang, [str(k) for k in kategori],
+                                          np.asarray(nilai, dtype=float), judul, label_x, label_y, warna, palet)
+    return png
+
+
+def _render_sebar_downtime(jam, downtime, jam_prediksi, prediksi, judul):
+    with diagnostik.tahap("bangun grafik"):
+        from matplotlib.figure import Figure
+
+        fig = Figure()
+        ax = fig.subplots()
+        ax.scatter(jam, downtime, label="Data Historis", alpha=0.6)
+        ax.scatter(jam_prediksi, prediksi, color="red", label="Prediksi Anda", s=100)
+        ax.set_xlabel("Jam Operasional per Minggu")
+        ax.set_ylabel("Downtime (jam)")
+        if judul:
+            ax.set_title(judul)
+        ax.legend()
+    return _png(fig, DPI_APLIKASI)
+
+
+def png_sebar_downtime(jam, downtime, jam_prediksi, prediksi, judul=None):
+    """PNG data historis downtime beserta titik prediksi, di-cache per input."""
+    png, _ = _CACHE_PNG.ambil_atau_hitung("png_sebar_downtime", _render_sebar_downtime,
+                                          np.asarray(jam, dtype=float), np.asarray(downtime, dtype=float),
+                                          float(jam_prediksi), float(prediksi), judul)
+    return png
+
+
+def _render_jejak_persediaan(hari, level, hari_pesan, hari_terima, ROP):
+    with diagnostik.tahap("bangun grafik"):
+        from matplotlib.figure import Figure
+
+        fig = Figure(figsize=(10, 6))
+        ax = fig.subplots()
+        ax.plot(hari, level, label="Tingkat Persediaan", color='green')
+        ax.axhline(ROP, color='purple', linestyle=':', label=f"ROP = {ROP:.0f}")
+        ax.axhline(0, color='black', linestyle='-', linewidth=0.8)  # garis persediaan nol
+        # Satu koleksi garis per jenis (bukan satu axvline per pesanan) sehingga
+        # biaya render hampir tidak bertambah dengan jumlah pesanan.
+        for posisi, warna, label in ((hari_pesan, 'blue', "Pemesanan Ditempatkan"),
+                                     (hari_terima, 'orange', "Pemesanan Diterima")):
+            if len(posisi):
+                ax.vlines(posisi, 0, 1, transform=ax.get_xaxis_transform(), colors=warna, linestyles='--',
+                          alpha=0.6, label=label)
+        ax.set_xlabel("Hari")
+        ax.set_ylabel("Tingkat Persediaan (Unit)")
+        ax.set_title("Simulasi Tingkat Persediaan dengan EOQ dan ROP")
+        ax.legend()
+        ax.grid(True, linestyle='--', alpha=0.7)
+    return _png(fig)
+
+
+def png_jejak_persediaan(hari, level, hari_pesan, hari_terima, ROP):
+    """PNG jejak persediaan harian dengan garis ROP dan hari pesanan, di-cache per input."""
+    png, _ = _CACHE_PNG.ambil_atau_hitung("png_jejak_persediaan", _render_jejak_persediaan,
+                                          np.asarray(hari, dtype=float), np.asarray(level, dtype=float),
+                                          np.asarray(hari_pesan, dtype=float), np.asarray(hari_terima, dtype=float),
+                                          float(ROP))
+    return png
+
+
+def vega_jejak_persediaan(hari, level, hari_pesan, hari_terima, ROP):
+    """Versi Vega-Lite dari :func:`png_jejak_persediaan`: ``(data, spesifikasi)``.
+
+    Untuk ``st.vega_lite_chart(data, spesifikasi)``. Server hanya mengirim data
+    deret (Arrow) dan spesifikasi kecil; grafik digambar di browser dan bisa
+    di-zoom atau digeser tanpa rerun. Spesifikasi ditulis langsung sebagai dict
+    karena membangunnya lewat Altair (dengan validasi skema) memakan puluhan
+    milidetik per rerun.
+    """
+    import pandas as pd
+
+    with diagnostik.tahap("bangun grafik"):
+        data = pd.DataFrame({"hari": hari, "persediaan": level})
+        label_rop = f"ROP = {ROP:.0f}"
+        jenis = [label_rop, "Pemesanan Ditempatkan", "Pemesanan Diterima"]
+        warna = {"field": "jenis", "type": "nominal", "title": None,
+                 "scale": {"domain": jenis, "range": ["purple", "blue", "orange"]}}
+        pesanan = ([{"hari": h, "jenis": jenis[1]} for h in np.asarray(hari_pesan, dtype=float).tolist()]
+                   + [{"hari": h, "jenis": jenis[2]} for h in np.asarray(hari_terima, dtype=float).tolist()])
+        spesifikasi = {
+            "title": "Simulasi Tingkat Persediaan dengan EOQ dan ROP",
+            "height": 400,
+            "layer": [
+                {
+                    "mark": {"type": "line", "color": "green"},
+                    "encoding": {
+                        "x": {"field": "hari", "type": "quantitative", "title": "Hari"},
+                        "y": {"field": "persediaan", "type": "quantitative", "title": "Tingkat Persediaan (Unit)"},
+                        "tooltip": [{"field": "hari", "type": "quantitative"},
+                                    {"field": "persediaan", "type": "quantitative", "format": ".1f"}],
+                    },
+                    "params": [{"name": "zoom", "select": "interval", "bind": "scales", "encodings": ["x"]}],
+                },
+                {
+                    "data": {"values": [{"nilai": float(ROP), "jenis": label_rop}]},
+                    "mark": {"type": "rule", "strokeDash": [2, 2]},
+                    "encoding": {"y": {"field": "nilai", "type": "quantitative"}, "color": warna},
+                },
+                {
+                    "data": {"values": [{"nilai": 0.0}]},
+                    "mark": {"type": "rule", "color": "black", "strokeWidth": 0.8},
+                    "encoding": {"y": {"field": "nilai", "type": "quantitative"}},
+                },
+                {
+                    "data": {"values": pesanan},
+                    "mark": {"type": "rule", "strokeDash": [4, 4], "opacity": 0.6},
+                    "encoding": {"x": {"field": "hari", "type": "quantitative"}, "color": warna},
+                },
+            ],
+        }
+        return data, spesifikasi
@@ -0,0 +1,356 @@
+"""Optimasi produksi (LP) untuk N produk x M sumber daya dan banyak skenario.
+
+Struktur model (matriks konsumsi A dalam format CSR) dibangun sekali dari tabel,
+lalu dipakai ulang untuk setiap skenario; yang berubah per skenario hanya
+vektor keuntungan dan kapasitas.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.optimize import linprog
+
+
+@dataclass
+class ModelProduksi:
+    produk: list
+    sumber_daya: list
+    keuntungan: np.ndarray  # (n,) keuntungan per unit
+    kapasitas: np.ndarray  # (m,) kapasitas maksimum
+    A: sparse.csr_matrix  # (m, n) konsumsi sumber daya per unit produk
+
+
+def selesaikan(keuntungan, konsumsi, kapasitas):
+    """Satu LP: maksimalkan keuntungan·x dengan konsumsi·x <= kapasitas, x >= 0.
+
+    ``konsumsi`` berukuran (m sumber daya, n produk).
+    """
+    result = linprog(-np.asarray(keuntungan, dtype=float), A_ub=konsumsi, b_ub=kapasitas,
+                     bounds=(0, None), method="highs")
+    return {
+        "sukses": bool(result.success),
+        "x": result.x if result.success else None,
+        "keuntungan_total": -result.fun if result.success else float("nan"),
+        # Dual dari HiGHS (tanda dibalik karena yang diminimalkan adalah -keuntungan):
+        # harga bayangan = tambahan keuntungan per unit kapasitas, biaya tereduksi <= 0
+        # = penurunan keuntungan per unit produk yang dipaksa diproduksi.
+        "harga_bayangan": -result.ineqlin.marginals + 0.0 if result.success else None,
+        "biaya_tereduksi": -result.lower.marginals + 0.0 if result.success else None,
+        "slack": result.slack if result.success else None,
+        "pesan": result.message,
+    }
+
+
+def analisis_sensitivitas(keuntungan, konsumsi, kapasitas):
+    """Hasil :func:`selesaikan` ditambah rentang (ranging) dari basis optimal.
+
+    ``rentang_keuntungan`` (n, 2): batas keuntungan per unit tiap produk agar
+    rencana produksi tetap optimal. ``rentang_kapasitas`` (m, 2): batas kapasitas
+    tiap sumber daya agar harga bayangannya tetap berlaku. Rentang dihitung oleh
+    HiGHS lewat highspy; tanpa highspy nilainya NaN.
+    """
+    keuntungan = np.asarray(keuntungan, dtype=float)
+    kapasitas = np.asarray(kapasitas, dtype=float)
+    hasil = selesaikan(keuntungan, konsumsi, kapasitas)
+    hasil["rentang_keuntungan"] = np.full((len(keuntungan), 2), np.nan)
+    hasil["rentang_kapasitas"] = np.full((len(kapasitas), 2), np.nan)
+    highspy = _highspy()
+    if not hasil["sukses"] or highspy is None:
+        return hasil
+
+    n, m = len(keuntungan), len(kapasitas)
+    h = _model_highs(sparse.csr_matrix(konsumsi, dtype=float))
+    h.changeColsCost(n, np.arange(n, dtype=np.int32), -keuntungan)
+    h.changeRowsBounds(m, np.arange(m, dtype=np.int32), np.full(m, -highspy.kHighsInf), kapasitas)
+    h.run()
+    status, rentang = h.getRanging()
+    if status != highspy.HighsStatus.kOk:
+        return hasil
+
+    def nilai(v, k):
+        v = np.asarray(v[:k], dtype=float)
+        return np.where(np.abs(v) >= highspy.kHighsInf, np.copysign(np.inf, v), v)
+
+    # Rentang biaya untuk -keuntungan [dn, up] menjadi rentang keuntungan [-up, -dn].
+    hasil["rentang_keuntungan"] = np.column_stack([-nilai(rentang.col_cost_up.value_, n),
+                                                   -nilai(rentang.col_cost_dn.value_, n)])
+    hasil["rentang_kapasitas"] = np.column_stack([nilai(rentang.row_bound_dn.value_, m),
+                                                  nilai(rentang.row_bound_up.value_, m)])
+    # Untuk sumber daya yang tidak terikat (baris basis), HiGHS tidak memberi rentang
+    # kapasitasnya: harga bayangan 0 berlaku selama kapasitas >= pemakaiannya.
+    longgar = np.array([s == highspy.HighsBasisStatus.kBasic for s in h.getBasis().row_status])
+    pemakaian = np.asarray(h.getSolution().row_value, dtype=float)
+    hasil["rentang_kapasitas"][longgar] = np.column_stack([pemakaian[longgar], np.full(longgar.sum(), np.inf)])
+    return hasil
+
+
+def _pemecah_kapasitas(keuntungan, konsumsi, kapasitas, indeks):
+    """Fungsi ``t -> (keuntungan optimal, harga bayangan sumber daya indeks)``.
+
+    Dengan highspy satu objek Highs dipakai ulang sehingga setiap solve mulai
+    dari basis solve sebelumnya (warm start); tanpa highspy memakai linprog.
+    """
+    kapasitas = np.array(kapasitas, dtype=float)
+    highspy = _highspy()
+    if highspy is None:
+        def pecahkan(t):
+            kapasitas[indeks] = t
+            hasil = selesaikan(keuntungan, konsumsi, kapasitas)
+            if not hasil["sukses"]:
+                raise ValueError(f"LP tidak dapat diselesaikan pada kapasitas {t:g}: {hasil['pesan']}")
+            return hasil["keuntungan_total"], hasil["harga_bayangan"][indeks]
+        return pecahkan
+
+    keuntungan = np.asarray(keuntungan, dtype=float)
+    n, m = len(keuntungan), len(kapasitas)
+    h = _model_highs(sparse.csr_matrix(konsumsi, dtype=float))
+    h.changeColsCost(n, np.arange(n, dtype=np.int32), -keuntungan)
+    h.changeRowsBounds(m, np.arange(m, dtype=np.int32), np.full(m, -highspy.kHighsInf), kapasitas)
+
+    def pecahkan(t):
+        h.changeRowBounds(indeks, -highspy.kHighsInf, t)
+        h.run()
+        if h.getModelStatus() != highspy.HighsModelStatus.kOptimal:
+            raise ValueError(f"LP tidak dapat diselesaikan pada kapasitas {t:g}: {h.getModelStatus()}")
+        return -h.getInfo().objective_function_value + 0.0, -h.getSolution().row_dual[indeks] + 0.0
+    return pecahkan
+
+
+def parametrik_kapasitas(keuntungan, konsumsi, kapasitas, indeks, batas_bawah=0.0, batas_atas=None, tol=1e-9):
+    """Keuntungan optimal sebagai fungsi kapasitas sumber daya ``indeks``.
+
+    Fungsinya linear sepotong-sepotong dan cekung, dengan kemiringan = harga
+    bayangan. Titik patah dicari dari perpotongan garis singgung (harga
+    bayangan) di kedua ujung interval, sehingga jumlah solve sebanding dengan
+    jumlah titik patah, bukan dengan resolusi grid. Tanpa ``batas_atas``,
+    kapasitas digandakan sampai harga bayangannya nol (paling jauh 2048 x
+    kapasitas saat ini).
+
+    Mengembalikan ``(titik, statistik)``: ``titik`` berisi kolom ``kapasitas``,
+    ``keuntungan_total`` dan ``harga_bayangan`` (kemiringan segmen sesudah titik).
+    """
+    pecahkan = _pemecah_kapasitas(keuntungan, konsumsi, kapasitas, indeks)
+    jumlah_solve = 0
+
+    def evaluasi(t):
+        nonlocal jumlah_solve
+        jumlah_solve += 1
+        z, y = pecahkan(t)
+        return t, z, y
+
+    mulai = time.perf_counter()
+    kiri = evaluasi(float(batas_bawah))
+    if batas_atas is None:
+        batas_atas = max(2.0 * float(np.asarray(kapasitas, dtype=float)[indeks]), float(batas_bawah) + 1.0)
+        kanan = evaluasi(batas_atas)
+        for _ in range(10):
+            if kanan[2] <= tol:
+                break
+            kanan = evaluasi(2.0 * kanan[0])
+    else:
+        kanan = evaluasi(float(batas_atas))
+
+    titik = [kiri]
+    tumpukan = [(kiri, kanan)]
+    while tumpukan:
+        (ta, za, ya), (tb, zb, yb) = tumpukan.pop()
+        if ya - yb <= tol * (1 + abs(ya)):
+            continue  # kemiringan sama: satu segmen linear
+        # Perpotongan garis singgung di kedua ujung.
+        t = (zb - za + ya * ta - yb * tb) / (ya - yb)
+        if not ta + tol < t < tb - tol:
+            continue
+        tengah = evaluasi(t)
+        # Titik tengah bisa saja titik patah walaupun intervalnya masih dibelah
+        # (solver memberi sembarang subgradien di titik patah), jadi selalu
+        # disimpan; titik yang segaris dibuang di akhir.
+        titik.append(tengah)
+        # Fungsi cekung selalu di bawah garis singgung; bila nilainya tepat di
+        # garis itu, t adalah satu-satunya titik patah di antara kedua ujung.
+        if tengah[1] < za + ya * (t - ta) - tol * (1 + abs(tengah[1])):
+            tumpukan += [(tengah, (tb, zb, yb)), ((ta, za, ya), tengah)]
+    titik.append(kanan)
+    durasi = time.perf_counter() - mulai
+
+    titik.sort()
+    t = np.array([p[0] for p in titik])
+    z = np.array([p[1] for p in titik])
+    # Buang titik yang terletak pada tali busur kedua tetangganya.
+    tali = z[:-2] + (z[2:] - z[:-2]) * (t[1:-1] - t[:-2]) / (t[2:] - t[:-2])
+    patah = np.abs(z[1:-1] - tali) > tol * (1 + np.abs(z[1:-1]))
+    simpan = np.concatenate([[True], patah, [True]])
+    t, z = t[simpan], z[simpan]
+    kemiringan = np.append(np.diff(z) / np.diff(t), kanan[2])
+    tabel = pd.DataFrame({"kapasitas": t, "keuntungan_total": z, "harga_bayangan": kemiringan})
+    return tabel, {"jumlah_solve": jumlah_solve, "jumlah_titik_patah": len(tabel) - 2, "durasi_detik": durasi}
+
+
+def model_dari_tabel(df_produk, df_kapasitas):
+    """Bangun model dari tabel produk dan tabel kapasitas.
+
+    ``df_produk``: kolom ``produk``, ``keuntungan`` dan satu kolom konsumsi per
+    sumber daya. ``df_kapasitas``: kolom ``sumber_daya`` dan ``kapasitas``.
+    """
+    for kolom in ("produk", "keuntungan"):
+        if kolom not in df_produk.columns:
+            raise ValueError(f"Tabel produk harus memiliki kolom '{kolom}'.")
+    for kolom in ("sumber_daya", "kapasitas"):
+        if kolom not in df_kapasitas.columns:
+            raise ValueError(f"Tabel kapasitas harus memiliki kolom '{kolom}'.")
+
+    sumber_daya = [str(r) for r in df_kapasitas["sumber_daya"]]
+    hilang = [r for r in sumber_daya if r not in df_produk.columns]
+    if hilang:
+        raise ValueError(f"Kolom konsumsi tidak ditemukan di tabel produk: {', '.join(hilang)}")
+
+    konsumsi = df_produk[sumber_daya].to_numpy(dtype=float)
+    return ModelProduksi(
+        produk=[str(p) for p in df_produk["produk"]],
+        sumber_daya=sumber_daya,
+        keuntungan=df_produk["keuntungan"].to_numpy(dtype=float),
+        kapasitas=df_kapasitas["kapasitas"].to_numpy(dtype=float),
+        A=sparse.csr_matrix(np.nan_to_num(konsumsi).T),
+    )
+
+
+def buat_skenario(model, skala_keuntungan, skala_kapasitas):
+    """Sweep harga x kapasitas: setiap kombinasi skala menjadi satu skenario.
+
+    Mengembalikan ``(meta, C, B)`` dengan ``C`` berukuran (k, n) dan ``B`` (k, m).
+    """
+    sk, sb = np.meshgrid(np.asarray(skala_keuntungan, dtype=float),
+                         np.asarray(skala_kapasitas, dtype=float), indexing="ij")
+    sk, sb = sk.ravel(), sb.ravel()
+    meta = pd.DataFrame({"skala_keuntungan": sk, "skala_kapasitas": sb})
+    C = sk[:, None] * model.keuntungan[None, :]
+    B = sb[:, None] * model.kapasitas[None, :]
+    return meta, C, B
+
+
+@lru_cache(maxsize=None)
+def _highspy():
+    """Modul highspy, dimuat saat skenario pertama diselesaikan; ``None`` bila tidak terpasang."""
+    try:
+        import highspy
+    except ImportError:  # tanpa highspy: pakai linprog, tanpa warm start
+        return None
+    return highspy
+
+
+# ---- worker ----
+# Setiap proses menyimpan model sendiri sehingga matriks A hanya dikirim sekali
+# per proses, bukan sekali per skenario.
+_worker = {}
+
+
+def _init_worker(A):
+    _worker.clear()
+    _worker["A"] = A
+    if _highspy() is not None:
+        _worker["highs"] = _model_highs(A)
+
+
+def _model_highs(A):
+    highspy = _highspy()
+    m, n = A.shape
+    h = highspy.Highs()
+    h.setOptionValue("output_flag", False)
+    lp = highspy.HighsLp()
+    lp.num_col_ = n
+    lp.num_row_ = m
+    lp.col_cost_ = np.zeros(n)
+    lp.col_lower_ = np.zeros(n)
+    lp.col_upper_ = np.full(n, highspy.kHighsInf)
+    lp.row_lower_ = np.full(m, -highspy.kHighsInf)
+    lp.row_upper_ = np.zeros(m)
+    lp.a_matrix_.format_ = highspy.MatrixFormat.kRowwise
+    lp.a_matrix_.num_col_ = n
+    lp.a_matrix_.num_row_ = m
+    lp.a_matrix_.start_ = A.indptr
+    lp.a_matrix_.index_ = A.indices
+    lp.a_matrix_.value_ = A.data
+    h.passModel(lp)
+    return h
+
+
+def _selesaikan_blok(C, B):
+    A = _worker["A"]
+    m, n = A.shape
+    X = np.full((len(C), n), np.nan)
+    nilai = np.full(len(C), np.nan)
+    sukses = np.zeros(len(C), dtype=bool)
+
+    h = _worker.get("highs")
+    if h is not None:
+        highspy = _highspy()
+        idx_kolom = np.arange(n, dtype=np.int32)
+        idx_baris = np.arange(m, dtype=np.int32)
+        batas_bawah = np.full(m, -highspy.kHighsInf)
+        for i in range(len(C)):
+            # Basis dari skenario sebelumnya tetap tersimpan di objek Highs,
+            # jadi solve berikutnya mulai dari basis itu (warm start).
+            h.changeColsCost(n, idx_kolom, -C[i])
+            h.changeRowsBounds(m, idx_baris, batas_bawah, B[i])
+            h.run()
+            if h.getModelStatus() == highspy.HighsModelStatus.kOptimal:
+                X[i] = h.getSolution().col_value
+                nilai[i] = -h.getInfo().objective_function_value
+                sukses[i] = True
+    else:
+        for i in range(len(C)):
+            result = linprog(-C[i], A_ub=A, b_ub=B[i], bounds=(0, None), method="highs")
+            if result.success:
+                X[i] = result.x
+                nilai[i] = -result.fun
+                sukses[i] = True
+    return X, nilai, sukses
+
+
+def _selesaikan_blok_worker(args):
+    return _selesaikan_blok(*args)
+
+
+def selesaikan_skenario(model, C, B, meta=None, n_proses=None, ukuran_blok=64):
+    """Selesaikan semua skenario dan kembalikan ``(hasil, statistik)``.
+
+    ``hasil`` adalah satu DataFrame (satu baris per skenario) berisi status,
+    keuntungan total dan jumlah produksi tiap produk. ``statistik`` memuat
+    jumlah solve, waktu total dan solve per detik.
+    """
+    C = np.atleast_2d(np.asarray(C, dtype=float))
+    B = np.atleast_2d(np.asarray(B, dtype=float))
+    k = len(C)
+    n_proses = n_proses or os.cpu_count() or 1
+    n_proses = max(1, min(n_proses, -(-k // ukuran_blok)))
+
+    mulai = time.perf_counter()
+    if n_proses == 1:
+        _init_worker(model.A)
+        X, nilai, sukses = _selesaikan_blok(C, B)
+    else:
+        blok = [(C[i:i + ukuran_blok], B[i:i + ukuran_blok]) for i in range(0, k, ukuran_blok)]
+        with ProcessPoolExecutor(n_proses, initializer=_init_worker, initargs=(model.A,)) as pool:
+            bagian = list(pool.map(_selesaikan_blok_worker, blok))
+        X = np.concatenate([b[0] for b in bagian])
+        nilai = np.concatenate([b[1] for b in bagian])
+        sukses = np.concatenate([b[2] for b in bagian])
+    durasi = time.perf_counter() - mulai
+
+    hasil = pd.concat([
+        meta.reset_index(drop=True) if meta is not None else pd.DataFrame({"skenario": np.arange(k)}),
+        pd.DataFrame({"optimal": sukses, "keuntungan_total": nilai}),
+        pd.DataFrame(X, columns=model.produk),
+    ], axis=1)
+    statistik = {
+        "jumlah_solve": k,
+        "jumlah_proses": n_proses,
+        "warm_start": _highspy() is not None,
+        "durasi_detik": durasi,
+        "solve_per_detik": k / durasi if durasi > 0 else float("inf"),
+    }
+    return hasil, statistik
@@ -0,0 +1,190 @@
+"""Perencanaan produksi integer (MILP): jumlah unit bulat, biaya setup dan lot minimum.
+
+Model: maksimalkan Σ keuntungan_j·x_j - Σ biaya_setup_j·y_j dengan
+konsumsi·x <= kapasitas, x_j <= U_j·y_j dan x_j >= lot_minimum_j·y_j, x_j
+bulat dan y_j biner (produk j diproduksi atau tidak). U_j adalah jumlah
+maksimum yang bisa dibuat dari kapasitas yang ada.
+
+Pencarian berjalan di thread latar belakang. Dengan highspy, setiap solusi
+incumbent yang membaik beserta batas atas dan gap MIP dicatat lewat callback
+sehingga UI bisa menampilkan kemajuan dan menghentikan pencarian kapan saja.
+Tanpa highspy dipakai ``scipy.optimize.milp`` dan hanya hasil akhir yang
+tersedia.
+"""
+import threading
+import time
+
+import numpy as np
+from scipy import sparse
+from scipy.optimize import Bounds, LinearConstraint, milp
+
+from .optimasi import _highspy, _model_highs
+
+
+def susun_model(keuntungan, konsumsi, kapasitas, biaya_setup=None, lot_minimum=None, integer=True):
+    """Susun MILP dalam bentuk minimasi: ``(c, A, b, batas_atas, integralitas)``.
+
+    Variabel ``[x_1..x_n, y_1..y_n]``; variabel y hanya ditambahkan bila ada
+    biaya setup atau lot minimum. Semua kendala berbentuk ``A·v <= b``.
+    """
+    c = np.asarray(keuntungan, dtype=float)
+    A = sparse.csr_matrix(konsumsi, dtype=float)
+    b = np.asarray(kapasitas, dtype=float)
+    n = len(c)
+    f = np.zeros(n) if biaya_setup is None else np.nan_to_num(np.asarray(biaya_setup, dtype=float))
+    L = np.zeros(n) if lot_minimum is None else np.nan_to_num(np.asarray(lot_minimum, dtype=float))
+
+    if (b < 0).any():
+        raise ValueError(f"Kapasitas sumber daya ke-{', '.join(map(str, np.flatnonzero(b < 0) + 1))} negatif.")
+
+    # Batas atas tiap produk dari kapasitas: min_i b_i / A_ij untuk A_ij > 0
+    # (sumber daya berkapasitas 0 memberi U_j = 0, bukan tak terbatas).
+    koo = A.tocoo()
+    dipakai = koo.data > 0
+    U = np.full(n, np.inf)
+    np.minimum.at(U, koo.col[dipakai], b[koo.row[dipakai]] / koo.data[dipakai])
+    tak_terbatas = np.isinf(U) & (c > 0)
+    if tak_terbatas.any():
+        raise ValueError(f"Produk ke-{', '.join(map(str, np.flatnonzero(tak_terbatas) + 1))} tidak memakai "
+                         "sumber daya apa pun sehingga produksinya tidak terbatas.")
+    U = np.where(np.isinf(U), 0.0, U)
+    if integer:
+        U = np.floor(U + 1e-9)
+
+    integralitas = np.full(n, 1 if integer else 0)
+    if not (f.any() or L.any()):
+        return -c, A, b, U, integralitas
+
+    I = sparse.identity(n, format="csr")
+    dengan_lot = np.flatnonzero(L > 0)
+    A_total = sparse.vstack([
+        sparse.hstack([A, sparse.csr_matrix((len(b), n))]),
+        sparse.hstack([I, -sparse.diags(U)]),  # x_j <= U_j·y_j
+        sparse.hstack([-I[dengan_lot], sparse.diags(L, format="csr")[dengan_lot]]),  # x_j >= L_j·y_j
+    ], format="csr")
+    b_total = np.concatenate([b, np.zeros(n + len(dengan_lot))])
+    return (np.concatenate([-c, f]), A_total, b_total, np.concatenate([U, np.ones(n)]),
+            np.concatenate([integralitas, np.ones(n, dtype=int)]))
+
+
+class PencarianMILP:
+    """Satu pencarian MILP di thread latar belakang.
+
+    ``status()`` bisa dipanggil kapan saja (thread-safe) untuk membaca riwayat
+    incumbent, gap dan hasil akhir; ``hentikan()`` meminta solver berhenti dan
+    mengembalikan incumbent terbaik sejauh ini.
+    """
+
+    def __init__(self, keuntungan, konsumsi, kapasitas, biaya_setup=None, lot_minimum=None, integer=True,
+                 batas_waktu=10.0, gap_relatif=0.01):
+        self.n = len(keuntungan)
+        self.model = susun_model(keuntungan, konsumsi, kapasitas, biaya_setup, lot_minimum, integer)
+        self.batas_waktu = batas_waktu
+        self.gap_relatif = gap_relatif
+        self._lock = threading.Lock()
+        self._berhenti = threading.Event()
+        self._riwayat = []
+        self._hasil = None
+        self._mulai = self._durasi = None
+        self._thread = threading.Thread(target=self._jalankan, daemon=True)
+
+    def mulai(self):
+        self._mulai = time.perf_counter()
+        self._thread.start()
+        return self
+
+    def tunggu(self, timeout=None):
+        self._thread.join(timeout)
+        return self.status()
+
+    def hentikan(self):
+        self._berhenti.set()
+
+    @property
+    def berjalan(self):
+        return self._thread.is_alive()
+
+    def status(self):
+        with self._lock:
+            return {
+                "berjalan": self.berjalan,
+                "waktu": self._durasi if self._durasi is not None else time.perf_counter() - self._mulai,
+                "riwayat": list(self._riwayat),
+                "hasil": self._hasil,
+            }
+
+    def _catat(self, keuntungan, batas_atas, gap):
+        with self._lock:
+            self._riwayat.append({"waktu": time.perf_counter() - self._mulai, "keuntungan": keuntungan,
+                                  "batas_atas": batas_atas, "gap": gap})
+
+    def _jalankan(self):
+        try:
+            hasil = self._jalankan_highs() if _highspy() is not None else self._jalankan_scipy()
+        except Exception as e:  # dilaporkan lewat status(), bukan hilang di thread
+            hasil = {"sukses": False, "pesan": str(e)}
+        with self._lock:
+            self._hasil = hasil
+            self._durasi = time.perf_counter() - self._mulai
+
+    def _hasil_akhir(self, v, nilai, gap, pesan):
+        if v is None:
+            return {"sukses": False, "pesan": pesan}
+        x = np.round(v[:self.n], 9) + 0.0  # -0.0 dari solver ditampilkan sebagai "-0"
+        return {
+            "sukses": True,
+            "x": x,
+            "diproduksi": x > 0,
+            "keuntungan_total": -nilai + 0.0,
+            "gap": gap,
+            "pesan": pesan,
+        }
+
+    def _jalankan_highs(self):
+        highspy = _highspy()
+        c, A, b, batas_atas, integralitas = self.model
+        k, m = len(c), len(b)
+        h = _model_highs(A)
+        h.setOptionValue("time_limit", float(self.batas_waktu))
+        h.setOptionValue("mip_rel_gap", float(self.gap_relatif))
+        h.changeColsCost(k, np.arange(k, dtype=np.int32), c)
+        h.changeColsBounds(k, np.arange(k, dtype=np.int32), np.zeros(k), batas_atas)
+        h.changeRowsBounds(m, np.arange(m, dtype=np.int32), np.full(m, -highspy.kHighsInf), b)
+        jenis = [highspy.HighsVarType.kInteger if i else highspy.HighsVarType.kContinuous for i in integralitas]
+        h.changeColsIntegrality(k, np.arange(k, dtype=np.int32), np.array(jenis))
+
+        def incumbent(e):
+            # Solver meminimalkan -keuntungan: primal bound = incumbent, dual bound = batas atas.
+            self._catat(-e.data_out.mip_primal_bound + 0.0, -e.data_out.mip_dual_bound + 0.0, e.data_out.mip_gap)
+
+        def interupsi(e):
+            if self._berhenti.is_set():
+                e.data_in.user_interrupt = True
+
+        h.cbMipImprovingSolution.subscribe(incumbent)
+        h.cbMipInterrupt.subscribe(interupsi)
+        h.run()
+
+        info = h.getInfo()
+        ada_solusi = info.primal_solution_status == highspy.SolutionStatus.kSolutionStatusFeasible
+        pesan = h.modelStatusToString(h.getModelStatus())
+        v = np.asarray(h.getSolution().col_value) if ada_solusi else None
+        return self._hasil_akhir(v, info.objective_function_value, info.mip_gap, pesan)
+
+    def _jalankan_scipy(self):
+        c, A, b, batas_atas, integralitas = self.model
+        result = milp(c, constraints=LinearConstraint(A, -np.inf, b), bounds=Bounds(0, batas_atas),
+                      integrality=integralitas,
+                      options={"time_limit": float(self.batas_waktu), "mip_rel_gap": float(self.gap_relatif)})
+        if result.x is not None:
+            self._catat(-result.fun + 0.0, -result.mip_dual_bound + 0.0, result.mip_gap)
+        gap = result.mip_gap if result.x is not None else float("nan")
+        return self._hasil_akhir(result.x, result.fun, gap, result.message)
+
+
+def selesaikan_milp(keuntungan, konsumsi, kapasitas, biaya_setup=None, lot_minimum=None, integer=True,
+                    batas_waktu=10.0, gap_relatif=0.01):
+    """Versi blocking dari :class:`PencarianMILP`: kembalikan hasil akhir beserta riwayat incumbent."""
+    status = PencarianMILP(keuntungan, konsumsi, kapasitas, biaya_setup, lot_minimum, integer,
+                           batas_waktu, gap_relatif).mulai().tunggu()
+    return {**status["hasil"], "riwayat": status["riwayat"], "durasi_detik": status["waktu"]}
@@ -0,0 +1,86 @@
+"""EOQ dan ROP tervektorisasi untuk seluruh katalog item.
+
+Katalog dibaca per chunk (CSV atau Parquet) sehingga memori tetap terbatas
+berapa pun jumlah barisnya; setiap chunk dihitung dalam satu operasi NumPy.
+"""
+import numpy as np
+
+HARI_PER_TAHUN = 365  # Asumsi 365 hari dalam setahun, sama dengan tugas_UAS.py
+KOLOM_WAJIB = ("D", "S", "H")
+KOLOM_HASIL = ("EOQ", "frekuensi", "biaya_pesan", "biaya_simpan", "total_biaya", "ROP")
+
+
+def hitung_eoq(D, S, H, LT=0.0, safety_stock=0.0):
+    """EOQ, frekuensi pesan, biaya pesan/simpan, total biaya dan ROP.
+
+    Semua argumen boleh skalar atau array dengan panjang sama. Baris dengan
+    D, S atau H tidak positif menghasilkan NaN.
+    """
+    D, S, H = (np.asarray(v, dtype=float) for v in (D, S, H))
+    valid = (D > 0) & (S > 0) & (H > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        eoq = np.where(valid, np.sqrt(2 * D * S / H), np.nan)
+        frek = D / eoq
+    biaya_pesan = S * frek
+    biaya_simpan = eoq / 2 * H
+    rop = D / HARI_PER_TAHUN * np.asarray(LT, dtype=float) + np.asarray(safety_stock, dtype=float)
+    return {
+        "EOQ": eoq,
+        "frekuensi": frek,
+        "biaya_pesan": biaya_pesan,
+        "biaya_simpan": biaya_simpan,
+        "total_biaya": biaya_pesan + biaya_simpan,
+        "ROP": np.where(valid, rop, np.nan),
+    }
+
+
+def hitung_katalog(df):
+    """Tambahkan kolom hasil EOQ/ROP ke DataFrame katalog."""
+    hilang = [k for k in KOLOM_WAJIB if k not in df.columns]
+    if hilang:
+        raise ValueError(f"Kolom wajib tidak ditemukan: {', '.join(hilang)}")
+    hasil = hitung_eoq(
+        df["D"].to_numpy(), df["S"].to_numpy(), df["H"].to_numpy(),
+        df["LT"].to_numpy() if "LT" in df.columns else 0.0,
+        df["safety_stock"].to_numpy() if "safety_stock" in df.columns else 0.0,
+    )
+    return df.assign(**hasil)
+
+
+def baca_katalog(sumber, format="csv", ukuran_chunk=100_000):
+    """Generator chunk DataFrame dari file CSV atau Parquet."""
+    if format == "parquet":
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(sumber).iter_batches(batch_size=ukuran_chunk):
+            yield batch.to_pandas()
+    else:
+        import pandas as pd  # hanya untuk katalog; hitung_eoq cukup NumPy
+
+        yield from pd.read_csv(sumber, chunksize=ukuran_chunk)
+
+
+def proses_katalog(sumber, tujuan, format="csv", format_tujuan=None, ukuran_chunk=100_000):
+    """Hitung EOQ/ROP untuk seluruh katalog dan tulis hasilnya per chunk.
+
+    Mengembalikan jumlah baris yang diproses.
+    """
+    format_tujuan = format_tujuan or format
+    jumlah = 0
+    penulis = None
+    for i, chunk in enumerate(baca_katalog(sumber, format, ukuran_chunk)):
+        hasil = hitung_katalog(chunk)
+        if format_tujuan == "parquet":
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            tabel = pa.Table.from_pandas(hasil, preserve_index=False)
+            if penulis is None:
+                penulis = pq.ParquetWriter(tujuan, tabel.schema)
+            penulis.write_table(tabel.cast(penulis.schema))
+        else:
+            hasil.to_csv(tujuan, index=False, header=(i == 0), mode="w" if i == 0 else "a")
+        jumlah += len(hasil)
+    if penulis is not None:
+        penulis.close()
+    return jumlah
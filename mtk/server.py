@@ -0,0 +1,68 @@
+"""Endpoint HTTP lokal yang ringan untuk job batch (tanpa dependensi web framework).
+
+``POST /jobs`` menerima JSON (satu job atau list job) atau CSV
+(``Content-Type: text/csv``) dan mengembalikan hasil dalam format yang sama.
+``GET /health`` untuk pemeriksaan hidup.
+"""
+import io
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+
+from . import batch
+
+
+def _json(isi):
+    # allow_nan=False: Infinity/NaN bukan JSON yang valid (batch sudah menggantinya dengan null).
+    return json.dumps(isi, allow_nan=False)
+
+
+class PenanganJob(BaseHTTPRequestHandler):
+    def _kirim(self, status, isi, tipe="application/json"):
+        data = isi.encode() if isinstance(isi, str) else isi
+        self.send_response(status)
+        self.send_header("Content-Type", tipe)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self):
+        if self.path == "/health":
+            self._kirim(200, _json({"status": "ok"}))
+        else:
+            self._kirim(404, _json({"error": "Tidak ditemukan"}))
+
+    def do_POST(self):
+        if self.path != "/jobs":
+            self._kirim(404, _json({"error": "Tidak ditemukan"}))
+            return
+        isi = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        try:
+            if self.headers.get("Content-Type", "").startswith("text/csv"):
+                tabel, statistik = batch.jalankan_tabel(pd.read_csv(io.BytesIO(isi)))
+                self._kirim(200, tabel.to_csv(index=False), "text/csv")
+                return
+            job = json.loads(isi)
+        except (ValueError, pd.errors.ParserError) as e:
+            self._kirim(400, _json({"error": str(e)}))
+            return
+        if isinstance(job, list):
+            hasil, statistik = batch.jalankan_semua(job)
+            self._kirim(200, _json({"hasil": hasil, "statistik": statistik}))
+        else:
+            self._kirim(200, _json(batch.jalankan(job)))
+
+    def log_message(self, format, *args):
+        pass  # tanpa log per request agar throughput tidak dibatasi stderr
+
+
+def jalankan_server(host="127.0.0.1", port=8600):
+    server = ThreadingHTTPServer((host, port), PenanganJob)
+    print(f"Melayani job di http://{host}:{port}/jobs")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
@@ -0,0 +1,196 @@
+"""Simulasi tingkat persediaan harian untuk banyak SKU sekaligus.
+
+Setiap hari seluruh SKU dimajukan bersama sebagai array NumPy. Pesanan yang
+sedang dikirim disimpan dalam ring buffer berukuran (lead time maksimum + 1, SKU)
+yang diindeks dengan hari kedatangan, sehingga penerimaan pesanan cukup membaca
+satu baris buffer per hari tanpa memindai daftar pesanan.
+
+Mode Monte Carlo memakai permintaan harian dan lead time acak; replikasi
+dijalankan sebagai satu sumbu array dan dibagi ke beberapa proses.
+"""
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+import pandas as pd
+
+from .persediaan import HARI_PER_TAHUN
+
+
+@dataclass
+class HasilSimulasi:
+    hari: np.ndarray  # (T + 1,)
+    ringkasan: pd.DataFrame  # satu baris per SKU
+    level: np.ndarray = None  # (T + 1, k) tingkat persediaan (tidak di bawah nol)
+    dipesan: np.ndarray = None  # (T + 1, k) True pada hari pesanan ditempatkan
+    diterima: np.ndarray = None  # (T + 1, k) True pada hari pesanan diterima
+
+
+def _hari_tiba(lead_time):
+    # Pesanan yang ditempatkan hari d tiba pada hari pertama >= d + LT,
+    # paling cepat hari berikutnya (penerimaan dicek sebelum pemesanan).
+    return np.maximum(np.ceil(lead_time), 1).astype(np.int64)
+
+
+def simulasi_persediaan(permintaan_harian, EOQ, ROP, LT, safety_stock=0.0, hari=90, simpan_jejak=True):
+    """Simulasikan kebijakan (ROP, EOQ) untuk k SKU selama ``hari`` hari.
+
+    Semua parameter per SKU boleh skalar atau array panjang k. Persediaan awal
+    adalah EOQ + safety stock; pesanan baru hanya ditempatkan bila persediaan
+    <= ROP dan tidak ada pesanan lain yang masih dalam perjalanan.
+    Dengan ``simpan_jejak=False`` hanya ringkasan per SKU yang disimpan.
+    """
+    d, Q, rop, lt, ss = np.broadcast_arrays(*(np.atleast_1d(np.asarray(v, dtype=float))
+                                               for v in (permintaan_harian, EOQ, ROP, LT, safety_stock)))
+    k = d.shape[0]
+    jeda = _hari_tiba(lt)
+    R = int(jeda.max()) + 1
+    kolom = np.arange(k)
+
+    pipeline = np.zeros((R, k))  # baris (hari % R) = jumlah yang tiba pada hari itu
+    dalam_perjalanan = np.zeros(k)
+    persediaan = Q + ss
+    total_persediaan = np.maximum(persediaan, 0)
+    hari_kehabisan = np.zeros(k, dtype=np.int64)
+    jumlah_pesanan = np.zeros(k, dtype=np.int64)
+
+    if simpan_jejak:
+        level = np.empty((hari + 1, k))
+        dipesan = np.zeros((hari + 1, k), dtype=bool)
+        diterima = np.zeros((hari + 1, k), dtype=bool)
+        level[0] = total_persediaan
+
+    for t in range(1, hari + 1):
+        persediaan -= d
+
+        slot = t % R
+        masuk = pipeline[slot]
+        persediaan += masuk
+        dalam_perjalanan -= masuk
+        if simpan_jejak:
+            diterima[t] = masuk > 0
+        pipeline[slot] = 0
+
+        pesan = (persediaan <= rop) & (dalam_perjalanan <= 0)
+        if pesan.any():
+            idx = kolom[pesan]
+            pipeline[(t + jeda[idx]) % R, idx] += Q[idx]
+            dalam_perjalanan[idx] += Q[idx]
+            jumlah_pesanan[idx] += 1
+            if simpan_jejak:
+                dipesan[t] = pesan
+
+        tercatat = np.maximum(persediaan, 0)  # Inventory cannot go below zero
+        total_persediaan += tercatat
+        hari_kehabisan += persediaan <= 0
+        if simpan_jejak:
+            level[t] = tercatat
+
+    ringkasan = pd.DataFrame({
+        "rata_rata_persediaan": total_persediaan / (hari + 1),
+        "hari_kehabisan": hari_kehabisan,
+        "jumlah_pesanan": jumlah_pesanan,
+    })
+    hasil = HasilSimulasi(hari=np.arange(hari + 1), ringkasan=ringkasan)
+    if simpan_jejak:
+        hasil.level, hasil.dipesan, hasil.diterima = level, dipesan, diterima
+    return hasil
+
+
+def _blok_monte_carlo(args):
+    (seed, replikasi, hari, rata_harian, std_harian, lt_rata, lt_std, lt_maks, EOQ, ROP, ss) = args
+    rng = np.random.default_rng(seed)
+    n = len(ROP)
+    R = lt_maks + 1
+    bentuk = (n, replikasi)
+    rop = ROP[:, None]
+    baris = np.repeat(np.arange(n), replikasi)
+    kolom_rep = np.tile(np.arange(replikasi), n)
+
+    pipeline = np.zeros((R,) + bentuk)
+    dalam_perjalanan = np.zeros(bentuk)
+    persediaan = np.broadcast_to(EOQ + ss[:, None], bentuk).copy()
+    habis_siklus = np.zeros(bentuk, dtype=bool)
+
+    terlayani = np.zeros(n)
+    total_permintaan = 0.0
+    total_persediaan = np.zeros(n)
+    siklus = np.zeros(n)
+    siklus_habis = np.zeros(n)
+
+    for t in range(1, hari + 1):
+        # Angka acak yang sama dipakai semua kandidat ROP (common random numbers)
+        # sehingga perbedaan antar kandidat tidak tertutup noise.
+        permintaan = np.maximum(rng.normal(rata_harian, std_harian, replikasi), 0)
+        jeda = np.clip(np.rint(rng.normal(lt_rata, lt_std, replikasi)), 1, lt_maks).astype(np.int64)
+
+        terlayani += np.minimum(permintaan, np.maximum(persediaan, 0)).sum(axis=1)
+        total_permintaan += permintaan.sum()
+        persediaan -= permintaan
+        habis_siklus |= persediaan <= 0
+
+        slot = t % R
+        masuk = pipeline[slot]
+        tiba = masuk > 0
+        persediaan += masuk
+        dalam_perjalanan -= masuk
+        siklus += tiba.sum(axis=1)
+        siklus_habis += (tiba & habis_siklus).sum(axis=1)
+        habis_siklus &= ~tiba
+        pipeline[slot] = 0
+
+        pesan = ((persediaan <= rop) & (dalam_perjalanan <= 0)).ravel()
+        if pesan.any():
+            i, j = baris[pesan], kolom_rep[pesan]
+            pipeline[(t + jeda[j]) % R, i, j] = EOQ
+            dalam_perjalanan[i, j] = EOQ
+
+        total_persediaan += np.maximum(persediaan, 0).sum(axis=1)
+
+    return terlayani, total_permintaan * np.ones(n), total_persediaan, siklus, siklus_habis
+
+
+def simulasi_monte_carlo(D, EOQ, LT, daftar_safety_stock, cv_permintaan=0.3, std_lead_time=1.0,
+                         replikasi=1000, hari=365, n_proses=None, seed=0, ukuran_blok=250):
+    """Evaluasi beberapa kandidat safety stock dengan permintaan & lead time acak.
+
+    Permintaan harian ~ Normal(D/365, cv * D/365) dipotong di nol, lead time
+    ~ Normal(LT, std_lead_time) dibulatkan ke hari (minimal 1). Replikasi dibagi
+    menjadi blok berukuran ``ukuran_blok``; setiap blok mendapat seed turunan
+    dari ``seed`` sehingga hasilnya sama berapa pun jumlah proses yang dipakai.
+
+    Mengembalikan ``(hasil, statistik)``: satu baris per kandidat berisi ROP,
+    fill rate, probabilitas kehabisan per siklus pesanan dan rata-rata persediaan.
+    """
+    ss = np.atleast_1d(np.asarray(daftar_safety_stock, dtype=float))
+    rata_harian = D / HARI_PER_TAHUN
+    ROP = rata_harian * LT + ss
+    lt_maks = max(1, int(np.ceil(LT + 4 * std_lead_time)))
+
+    ukuran = [min(ukuran_blok, replikasi - i) for i in range(0, replikasi, ukuran_blok)]
+    seeds = np.random.SeedSequence(seed).spawn(len(ukuran))
+    tugas = [(s, r, hari, rata_harian, cv_permintaan * rata_harian, LT, std_lead_time, lt_maks, EOQ, ROP, ss)
+             for s, r in zip(seeds, ukuran)]
+    n_proses = max(1, min(n_proses or os.cpu_count() or 1, len(tugas)))
+
+    mulai = time.perf_counter()
+    if n_proses == 1:
+        bagian = [_blok_monte_carlo(t) for t in tugas]
+    else:
+        with ProcessPoolExecutor(n_proses) as pool:
+            bagian = list(pool.map(_blok_monte_carlo, tugas))
+    durasi = time.perf_counter() - mulai
+
+    terlayani, permintaan, persediaan, siklus, siklus_habis = (sum(b[i] for b in bagian) for i in range(5))
+    with np.errstate(invalid="ignore", divide="ignore"):
+        hasil = pd.DataFrame({
+            "safety_stock": ss,
+            "ROP": ROP,
+            "fill_rate": terlayani / permintaan,
+            "prob_kehabisan": siklus_habis / siklus,
+            "rata_rata_persediaan": persediaan / (replikasi * hari),
+        })
+    statistik = {"replikasi": replikasi, "jumlah_proses": n_proses, "durasi_detik": durasi}
+    return hasil, statistik
@@ -0,0 +1,790 @@
+"""Komponen Streamlit bersama untuk ``studi_kasus.py`` dan ``mtk2.py``.
+
+Berisi cache lintas sesi, keempat tab (masing-masing fragment yang hanya
+dijalankan saat tab itu aktif), panel admin cache dan panel diagnostik (juga
+dipakai ``tugas_UAS.py``). Skrip aplikasi hanya menentukan judul serta bagian
+yang berbeda lewat :class:`Tampilan`: grafik tambahan dan teks.
+
+pandas, scipy, sklearn, matplotlib dan modul mtk lainnya diimpor di dalam tiap
+tool tepat sebelum dipakai, agar halaman pertama tampil tanpa menunggu semua
+pustaka berat dimuat. Impor berikutnya hanya pencarian di sys.modules.
+"""
+import os
+import tempfile
+from contextlib import contextmanager, nullcontext
+from dataclasses import dataclass
+from functools import partial, wraps
+
+import numpy as np
+import streamlit as st
+
+from . import diagnostik
+
+
+@dataclass(frozen=True)
+class Tampilan:
+    """Bagian yang berbeda antar aplikasi; grafik tambahan berupa fungsi yang menggambar sendiri."""
+    grafik_produksi: object = None  # f(df) setelah tabel hasil LP 2 produk
+    grafik_biaya_eoq: object = None  # f(biaya_pesan, biaya_simpan) setelah hasil EOQ satu item
+    grafik_antrian: object = None  # f(L, Lq, W, Wq) setelah hasil M/M/1
+    pesan_tidak_stabil: str = "❌ Sistem tidak stabil. Rata-rata kedatangan harus lebih kecil dari rata-rata pelayanan."
+    judul_grafik_downtime: str = None
+
+
+# Cache hasil LP, EOQ dan M/M/1 dipakai bersama oleh semua sesi di proses ini.
+# Set MTK_CACHE_DB=path.sqlite agar hasil juga disimpan di disk dan bertahan
+# setelah restart.
+@st.cache_resource
+def cache_hasil():
+    from . import cache
+
+    return cache.CacheHasil(path_db=os.environ.get("MTK_CACHE_DB"))
+
+
+# Model downtime di-cache lintas rerun dan lintas sesi: dataset hanya dibuat ulang
+# dan model hanya dilatih ulang bila seed atau versi data (isi file) berubah.
+@st.cache_resource(max_entries=8, show_spinner="Melatih model downtime...")
+def model_downtime(seed, versi_data, _file=None, nama_file=""):
+    from . import downtime
+
+    if _file is None:
+        df = downtime.data_sintetis(seed)
+    else:
+        df = downtime.baca_data(_file, nama_file)
+    return df, downtime.latih_model(df)
+
+
+# Log telemetri besar dibaca per chunk; hanya akumulator XᵀX/Xᵀy dan sampel kecil
+# untuk grafik yang disimpan di memori.
+@st.cache_resource(max_entries=4, show_spinner="Melatih model dari log telemetri...")
+def model_downtime_streaming(daftar_log, versi_data):
+    from . import downtime
+
+    akumulator, model = downtime.latih_streaming(daftar_log)
+    sampel = next(downtime.baca_chunk(daftar_log[0], ukuran_chunk=500))
+    return sampel, model, akumulator.n
+
+
+# Hanya tab yang aktif yang dijalankan. Widget di tab lain tidak dirender sehingga
+# Streamlit akan membuang nilainya; salin ulang nilainya agar input tetap ada saat
+# pengguna kembali ke tab tersebut. Tombol dan file upload tidak bisa diisi ulang.
+def pertahankan_input(prefix):
+    for kunci, nilai in list(st.session_state.items()):
+        if kunci.startswith(prefix) and not any(k in kunci for k in ("_btn_", "_file_", "_dl_")):
+            st.session_state[kunci] = nilai
+
+
+# Diagnostik opt-in (panel di sidebar): satu pencatat per rerun halaman, atau per
+# rerun fragment bila hanya satu tab yang dijalankan ulang. Ringkasannya disimpan
+# di session_state agar bisa ditampilkan dan diunduh. Bila dimatikan, setiap
+# diagnostik.tahap(...) hanya mengembalikan context manager kosong.
+@contextmanager
+def pencatat_rerun(nama):
+    pencatat = diagnostik.Pencatat(nama, ukur_memori=st.session_state.get("diag_memori", False),
+                                   profiler=st.session_state.pop("diag_profil_berikutnya", None),
+                                   path_log=os.environ.get("MTK_DIAGNOSTIK_LOG"))
+    try:
+        with pencatat:
+            yield pencatat
+    finally:
+        simpan_riwayat(pencatat)
+
+
+def simpan_riwayat(pencatat):
+    """Simpan ringkasan pencatat ke riwayat sesi (20 rerun terakhir) untuk panel diagnostik."""
+    riwayat = st.session_state.setdefault("diag_riwayat", [])
+    riwayat.append(pencatat.ke_dict())
+    del riwayat[:-20]
+
+
+def dicatat(tab):
+    @wraps(tab)
+    def bungkus(*args, **kwargs):
+        if diagnostik.aktif() is None and st.session_state.get("diag_aktif", False):
+            with pencatat_rerun(tab.__name__):
+                return tab(*args, **kwargs)
+        with diagnostik.tahap(tab.__name__):
+            return tab(*args, **kwargs)
+    return bungkus
+
+
+# Tabel sensitivitas dari satu solve: harga bayangan, biaya tereduksi dan rentang
+# yang masih mempertahankan basis optimal.
+def tampilkan_sensitivitas(hasil, produk, sumber_daya, kapasitas):
+    import pandas as pd
+
+    st.subheader("Analisis Sensitivitas")
+    st.markdown("*Produk* (rencana produksi tetap optimal selama keuntungan per unit di dalam rentang)")
+    st.dataframe(pd.DataFrame({
+        "produk": produk,
+        "jumlah_produksi": hasil["x"],
+        "biaya_tereduksi": hasil["biaya_tereduksi"],
+        "keuntungan_min": hasil["rentang_keuntungan"][:, 0],
+        "keuntungan_maks": hasil["rentang_keuntungan"][:, 1],
+    }), hide_index=True)
+    st.markdown("*Sumber daya* (harga bayangan = tambahan keuntungan per unit kapasitas, berlaku di dalam rentang)")
+    st.dataframe(pd.DataFrame({
+        "sumber_daya": sumber_daya,
+        "kapasitas": kapasitas,
+        "sisa": hasil["slack"],
+        "harga_bayangan": hasil["harga_bayangan"],
+        "kapasitas_min": hasil["rentang_kapasitas"][:, 0],
+        "kapasitas_maks": hasil["rentang_kapasitas"][:, 1],
+    }), hide_index=True)
+    if np.isnan(hasil["rentang_kapasitas"]).all():
+        st.caption("Rentang tidak tersedia: pasang paket `highspy` untuk ranging dari HiGHS.")
+
+
+# Keuntungan optimal vs kapasitas satu sumber daya; solve hanya di titik patah.
+def tampilkan_parametrik(keuntungan, konsumsi, kapasitas, indeks, nama):
+    from . import optimasi
+
+    try:
+        (titik, statistik), _ = cache_hasil().ambil_atau_hitung("lp_parametrik", optimasi.parametrik_kapasitas,
+                                                                keuntungan, konsumsi, kapasitas, indeks)
+    except ValueError as e:
+        st.error(f"❌ {e}")
+        return
+    st.line_chart(titik, x="kapasitas", y="keuntungan_total")
+    st.dataframe(titik, hide_index=True)
+    st.caption(f"Keuntungan optimal vs kapasitas {nama}: {statistik['jumlah_titik_patah']} titik patah "
+               f"dari {statistik['jumlah_solve']} solve. Di antara titik, keuntungan naik linear "
+               f"sebesar harga bayangan per unit kapasitas.")
+
+
+# Kemajuan pencarian MILP yang berjalan di thread latar belakang. Selama solver
+# berjalan, hanya fragment ini yang dijalankan ulang setiap 0,5 detik sehingga
+# input lain tetap bisa dipakai.
+def panel_milp():
+    import pandas as pd
+
+    pencarian = st.session_state.get("milp_pencarian")
+    if pencarian is None:
+        return
+    status = pencarian.status()
+    riwayat = pd.DataFrame(status["riwayat"], columns=["waktu", "keuntungan", "batas_atas", "gap"])
+    if status["berjalan"]:
+        if len(riwayat):
+            terbaik = f"incumbent Rp {riwayat['keuntungan'].iloc[-1]:,.2f}, gap {riwayat['gap'].iloc[-1]:.2%}"
+        else:
+            terbaik = "belum ada solusi layak"
+        st.info(f"⏳ Mencari solusi integer... {status['waktu']:.1f} detik, {terbaik}.")
+        if st.button("⏹️ Hentikan dan pakai solusi terbaik", key="lp_btn_milp_hentikan"):
+            pencarian.hentikan()
+    elif status["hasil"]["sukses"]:
+        hasil = status["hasil"]
+        st.success(f"✅ {hasil['pesan']} setelah {status['waktu']:.2f} detik. "
+                   f"Total keuntungan: Rp {hasil['keuntungan_total']:,.2f} (gap {hasil['gap']:.2%}).")
+        st.dataframe(pd.DataFrame({"produk": st.session_state["milp_produk"], "jumlah_produksi": hasil["x"],
+                                   "diproduksi": hasil["diproduksi"]}), hide_index=True)
+    else:
+        st.error(f"❌ Tidak ditemukan solusi integer: {status['hasil']['pesan']}")
+
+    if len(riwayat):
+        st.line_chart(riwayat.replace([np.inf, -np.inf], np.nan), x="waktu", y=["keuntungan", "batas_atas"])
+    if not status["berjalan"] and st.session_state.get("milp_memantau"):
+        st.session_state["milp_memantau"] = False
+        st.rerun()  # jalankan ulang halaman sekali agar polling berhenti
+
+
+# ================== TAB 1: Optimasi Produksi ==================
+@st.fragment
+@dicatat
+def tab_optimasi(tampilan):
+    st.header("🔧 Optimasi Produksi - Linear Programming")
+
+    st.markdown("Masukkan data produksi di bawah ini:")
+
+    mode_lp = st.radio("Mode", ["Manual (2 produk)", "Tabel N produk & skenario", "Integer (MILP)",
+                                "Multi-periode + persediaan"], horizontal=True, key="lp_mode")
+
+    if mode_lp == "Manual (2 produk)":
+        profit_A = st.number_input("Keuntungan per unit Produk A", min_value=0.0, value=30.0, key="lp_profit_A")
+        profit_B = st.number_input("Keuntungan per unit Produk B", min_value=0.0, value=20.0, key="lp_profit_B")
+
+        st.subheader("Batasan Sumber Daya")
+        resource_1 = st.number_input("Jumlah maksimum Sumber Daya 1", min_value=1.0, value=100.0, key="lp_resource_1")
+        resource_2 = st.number_input("Jumlah maksimum Sumber Daya 2", min_value=1.0, value=80.0, key="lp_resource_2")
+
+        st.markdown("*Konsumsi per Unit Produk*")
+        cons_A_r1 = st.number_input("Produk A - konsumsi Sumber Daya 1", min_value=0.0, value=2.0, key="lp_cons_A_r1")
+        cons_B_r1 = st.number_input("Produk B - konsumsi Sumber Daya 1", min_value=0.0, value=1.0, key="lp_cons_B_r1")
+        cons_A_r2 = st.number_input("Produk A - konsumsi Sumber Daya 2", min_value=0.0, value=1.0, key="lp_cons_A_r2")
+        cons_B_r2 = st.number_input("Produk B - konsumsi Sumber Daya 2", min_value=0.0, value=1.0, key="lp_cons_B_r2")
+
+        if st.button("🔍 Hitung Optimasi", key="lp_btn_optimasi"):
+            from . import optimasi
+
+            hasil, _ = cache_hasil().ambil_atau_hitung("lp_sensitivitas", optimasi.analisis_sensitivitas,
+                                                       [profit_A, profit_B],
+                                                       [[cons_A_r1, cons_B_r1], [cons_A_r2, cons_B_r2]],
+                                                       [resource_1, resource_2])
+
+            if hasil["sukses"]:
+                produk_A, produk_B = hasil["x"]
+                keuntungan = hasil["keuntungan_total"]
+
+                st.success("✅ Optimasi berhasil ditemukan:")
+                st.write(f"Produksi Produk A: *{produk_A:.2f} unit*")
+                st.write(f"Produksi Produk B: *{produk_B:.2f} unit*")
+                st.write(f"Total Keuntungan Maksimum: *Rp {keuntungan:,.2f}*")
+
+                import pandas as pd
+
+                df = pd.DataFrame({
+                    "Produk": ["A", "B"],
+                    "Jumlah Produksi": [produk_A, produk_B],
+                    "Keuntungan per Unit": [profit_A, profit_B],
+                    "Total Keuntungan": [produk_A * profit_A, produk_B * profit_B]
+                })
+                st.dataframe(df)
+                if tampilan.grafik_produksi is not None:
+                    tampilan.grafik_produksi(df)
+
+                tampilkan_sensitivitas(hasil, ["A", "B"], ["Sumber Daya 1", "Sumber Daya 2"], [resource_1, resource_2])
+            else:
+                st.error("❌ Tidak ditemukan solusi optimal. Periksa parameter dan batasan.")
+
+        st.subheader("Analisis Parametrik Kapasitas")
+        sumber_parametrik = st.selectbox("Sumber daya yang divariasikan", ["Sumber Daya 1", "Sumber Daya 2"],
+                                         key="lp_parametrik_sumber")
+        if st.button("📈 Telusuri Keuntungan vs Kapasitas", key="lp_btn_parametrik"):
+            tampilkan_parametrik([profit_A, profit_B], [[cons_A_r1, cons_B_r1], [cons_A_r2, cons_B_r2]],
+                                 [resource_1, resource_2], ["Sumber Daya 1", "Sumber Daya 2"].index(sumber_parametrik),
+                                 sumber_parametrik)
+    elif mode_lp == "Tabel N produk & skenario":
+        st.markdown("Unggah tabel produk (kolom `produk`, `keuntungan`, dan satu kolom konsumsi per sumber daya) "
+                    "serta tabel kapasitas (kolom `sumber_daya`, `kapasitas`).")
+        file_produk = st.file_uploader("Tabel produk (CSV)", type="csv", key="lp_file_produk")
+        file_kapasitas = st.file_uploader("Tabel kapasitas (CSV)", type="csv", key="lp_file_kapasitas")
+
+        model = None
+        if file_produk is not None and file_kapasitas is not None:
+            import pandas as pd
+            from . import optimasi
+
+            try:
+                with diagnostik.tahap("baca input"):
+                    model = optimasi.model_dari_tabel(pd.read_csv(file_produk), pd.read_csv(file_kapasitas))
+            except ValueError as e:
+                st.error(f"❌ {e}")
+
+        st.subheader("Skenario (Sweep Harga & Kapasitas)")
+        col1, col2 = st.columns(2)
+        with col1:
+            sk_min = st.number_input("Skala keuntungan minimum", min_value=0.0, value=0.8, key="lp_skmin")
+            sk_max = st.number_input("Skala keuntungan maksimum", min_value=0.0, value=1.2, key="lp_skmax")
+            sk_n = st.number_input("Jumlah titik skala keuntungan", 1, 1000, 10, key="lp_skn")
+        with col2:
+            sb_min = st.number_input("Skala kapasitas minimum", min_value=0.0, value=0.8, key="lp_sbmin")
+            sb_max = st.number_input("Skala kapasitas maksimum", min_value=0.0, value=1.2, key="lp_sbmax")
+            sb_n = st.number_input("Jumlah titik skala kapasitas", 1, 1000, 10, key="lp_sbn")
+        n_cpu = os.cpu_count() or 1
+        n_proses = st.number_input("Jumlah proses paralel", 1, n_cpu, n_cpu, key="lp_n_proses")
+
+        if st.button("🔍 Hitung Semua Skenario", key="lp_btn_skenario"):
+            if model is None:
+                st.error("❌ Unggah tabel produk dan tabel kapasitas yang valid terlebih dahulu.")
+            else:
+                meta, C, B = optimasi.buat_skenario(model, np.linspace(sk_min, sk_max, int(sk_n)),
+                                                    np.linspace(sb_min, sb_max, int(sb_n)))
+                # Jumlah proses tidak memengaruhi hasil, jadi tidak masuk kunci cache.
+                (hasil, statistik), dari_cache = cache_hasil().ambil_atau_hitung(
+                    "lp_skenario", partial(optimasi.selesaikan_skenario, n_proses=int(n_proses)), model, C, B, meta)
+
+                if dari_cache:
+                    st.success(f"✅ {statistik['jumlah_solve']} skenario diambil dari cache.")
+                else:
+                    st.success(f"✅ {statistik['jumlah_solve']} skenario selesai dalam "
+                               f"{statistik['durasi_detik']:.2f} detik "
+                               f"({statistik['solve_per_detik']:,.0f} solve/detik).")
+                st.dataframe(hasil)
+                st.download_button("⬇️ Unduh Hasil (CSV)", hasil.to_csv(index=False),
+                                   file_name="hasil_skenario.csv", mime="text/csv", key="lp_dl_skenario")
+
+        if model is not None:
+            st.subheader("Sensitivitas & Parametrik Model Dasar")
+            sumber_parametrik = st.selectbox("Sumber daya yang divariasikan", model.sumber_daya,
+                                             key="lp_tabel_parametrik_sumber")
+            if st.button("🔍 Analisis Sensitivitas", key="lp_btn_tabel_sensitivitas"):
+                hasil, _ = cache_hasil().ambil_atau_hitung("lp_sensitivitas", optimasi.analisis_sensitivitas,
+                                                           model.keuntungan, model.A, model.kapasitas)
+                if hasil["sukses"]:
+                    st.write(f"Total Keuntungan Maksimum: *Rp {hasil['keuntungan_total']:,.2f}*")
+                    tampilkan_sensitivitas(hasil, model.produk, model.sumber_daya, model.kapasitas)
+                    tampilkan_parametrik(model.keuntungan, model.A, model.kapasitas,
+                                         model.sumber_daya.index(sumber_parametrik), sumber_parametrik)
+                else:
+                    st.error("❌ Tidak ditemukan solusi optimal. Periksa parameter dan batasan.")
+    elif mode_lp == "Integer (MILP)":
+        import pandas as pd
+
+        st.markdown("Jumlah produksi berupa unit utuh. Biaya setup hanya dikenakan bila produk diproduksi; "
+                    "lot minimum berarti produk tidak dibuat sama sekali atau minimal sebanyak lot tersebut.")
+        df_produk = st.data_editor(pd.DataFrame({
+            "produk": ["A", "B"],
+            "keuntungan": [30.0, 20.0],
+            "biaya_setup": [0.0, 0.0],
+            "lot_minimum": [0.0, 0.0],
+            "Sumber Daya 1": [2.0, 1.0],
+            "Sumber Daya 2": [1.0, 1.0],
+        }), num_rows="dynamic", key="lp_milp_produk")
+        df_kapasitas = st.data_editor(pd.DataFrame({"sumber_daya": ["Sumber Daya 1", "Sumber Daya 2"],
+                                                    "kapasitas": [100.0, 80.0]}),
+                                      num_rows="dynamic", key="lp_milp_kapasitas")
+        col1, col2 = st.columns(2)
+        with col1:
+            batas_waktu = st.number_input("Batas waktu (detik)", min_value=0.1, value=10.0, key="lp_milp_waktu")
+        with col2:
+            gap_maks = st.number_input("Gap MIP yang diterima (%)", min_value=0.0, max_value=100.0, value=1.0,
+                                       key="lp_milp_gap")
+
+        pencarian = st.session_state.get("milp_pencarian")
+        sedang_berjalan = pencarian is not None and pencarian.berjalan
+        if st.button("▶️ Mulai Optimasi Integer", key="lp_btn_milp", disabled=sedang_berjalan):
+            from . import optimasi, optimasi_integer
+
+            try:
+                model = optimasi.model_dari_tabel(df_produk, df_kapasitas)
+                pencarian = optimasi_integer.PencarianMILP(
+                    model.keuntungan, model.A, model.kapasitas,
+                    biaya_setup=df_produk["biaya_setup"].to_numpy(dtype=float),
+                    lot_minimum=df_produk["lot_minimum"].to_numpy(dtype=float),
+                    batas_waktu=batas_waktu, gap_relatif=gap_maks / 100).mulai()
+            except ValueError as e:
+                st.error(f"❌ {e}")
+            else:
+                st.session_state["milp_pencarian"] = pencarian
+                st.session_state["milp_produk"] = model.produk
+                sedang_berjalan = True
+        st.session_state["milp_memantau"] = sedang_berjalan
+        st.fragment(panel_milp, run_every=0.5 if sedang_berjalan else None)()
+
+    else:
+        import pandas as pd
+
+        st.markdown("Rencana produksi per periode: persediaan dibawa ke periode berikutnya dengan biaya simpan "
+                    "`H / periode per tahun`, memakai H yang sama dengan tab EOQ.")
+        df_produk = st.data_editor(pd.DataFrame({
+            "produk": ["A", "B"],
+            "keuntungan": [30.0, 20.0],
+            "H": [st.session_state.get("eoq_H", 1000.0)] * 2,
+            "permintaan_per_periode": [25.0, 40.0],
+            "persediaan_awal": [0.0, 0.0],
+            "stok_minimum": [0.0, 0.0],
+            "Sumber Daya 1": [2.0, 1.0],
+            "Sumber Daya 2": [1.0, 1.0],
+        }), num_rows="dynamic", key="lp_mp_produk")
+        df_kapasitas = st.data_editor(pd.DataFrame({"sumber_daya": ["Sumber Daya 1", "Sumber Daya 2"],
+                                                    "kapasitas": [100.0, 80.0]}),
+                                      num_rows="dynamic", key="lp_mp_kapasitas")
+        col1, col2 = st.columns(2)
+        with col1:
+            n_periode = st.number_input("Jumlah periode", 1, 520, 12, key="lp_mp_periode")
+        with col2:
+            periode_per_tahun = st.number_input("Periode per tahun", 1, 365, 52, key="lp_mp_per_tahun")
+        file_permintaan = st.file_uploader("Permintaan per periode (CSV opsional: satu baris per periode, satu kolom per produk)",
+                                           type="csv", key="lp_file_permintaan")
+
+        if st.button("📅 Susun Rencana", key="lp_btn_rencana"):
+            from . import optimasi, perencanaan
+
+            try:
+                with diagnostik.tahap("baca input"):
+                    model = optimasi.model_dari_tabel(df_produk, df_kapasitas)
+                    if file_permintaan is not None:
+                        permintaan = pd.read_csv(file_permintaan)[model.produk].to_numpy(dtype=float)
+                    else:
+                        permintaan = np.tile(df_produk["permintaan_per_periode"].to_numpy(dtype=float), (int(n_periode), 1))
+            except (KeyError, ValueError) as e:
+                st.error(f"❌ {e}")
+            else:
+                (rencana, pemakaian, statistik), dari_cache = cache_hasil().ambil_atau_hitung(
+                    "perencanaan", perencanaan.rencanakan, model.keuntungan, model.A, model.kapasitas, permintaan,
+                    df_produk["H"].to_numpy(dtype=float), periode_per_tahun=int(periode_per_tahun),
+                    persediaan_awal=df_produk["persediaan_awal"].fillna(0).to_numpy(dtype=float),
+                    stok_minimum=df_produk["stok_minimum"].fillna(0).to_numpy(dtype=float),
+                    produk=model.produk, sumber_daya=model.sumber_daya)
+                st.caption(f"Model {statistik['jumlah_variabel']:,} variabel x {statistik['jumlah_kendala']:,} kendala "
+                           f"({statistik['jumlah_nonzero']:,} nonzero): dibangun dalam "
+                           f"{statistik['waktu_bangun_detik']:.3f} detik, diselesaikan dalam "
+                           f"{statistik['waktu_solve_detik']:.3f} detik" + (" (hasil dari cache)." if dari_cache else "."))
+                if rencana is None:
+                    st.error(f"❌ Tidak ditemukan rencana layak: {statistik['pesan']}")
+                else:
+                    st.success(f"✅ Total keuntungan setelah biaya simpan: Rp {statistik['keuntungan_total']:,.2f}")
+                    total = rencana.groupby("periode")[["produksi", "penjualan", "persediaan_akhir"]].sum()
+                    st.line_chart(total)
+                    st.dataframe(rencana, hide_index=True)
+                    st.dataframe(pemakaian, hide_index=True)
+                    st.download_button("⬇️ Unduh Rencana (CSV)", rencana.to_csv(index=False),
+                                       file_name="rencana_produksi.csv", mime="text/csv", key="lp_dl_rencana")
+
+# ================== TAB 2: EOQ ==================
+@st.fragment
+@dicatat
+def tab_eoq(tampilan):
+    st.header("📦 Model Persediaan Tahunan - EOQ")
+
+    mode_eoq = st.radio("Mode", ["Satu item", "Katalog (unggah file)", "Arsip data historis"], horizontal=True, key="eoq_mode")
+
+    if mode_eoq != "Katalog (unggah file)":
+        if mode_eoq == "Satu item":
+            D = st.number_input("Permintaan tahunan (unit/tahun)", min_value=1.0, value=1000.0, key="eoq_D")
+        else:
+            # Arsip di-memory-map: lookup satu SKU hanya membaca ringkasannya, bukan
+            # data harian, dan semua proses berbagi halaman file yang sama.
+            from . import arsip
+
+            D = None
+            path_arsip = st.text_input("Path arsip permintaan di server (dibangun dengan `python -m mtk arsip permintaan`)",
+                                       key="eoq_arsip_path")
+            sku = st.text_input("SKU", key="eoq_arsip_sku").strip()
+            if not (path_arsip and sku):
+                st.info("Masukkan path arsip dan SKU untuk mengambil permintaan historisnya.")
+            else:
+                try:
+                    with diagnostik.tahap("baca arsip"):
+                        statistik = arsip.statistik_permintaan(arsip.buka(path_arsip), sku)
+                except KeyError as e:
+                    st.error(f"❌ {e.args[0]}")
+                except (OSError, ValueError) as e:
+                    st.error(f"❌ {e}")
+                else:
+                    D = statistik["D"]
+                    st.write(f"Permintaan tahunan (D): *{D:,.2f} unit/tahun*")
+                    st.caption(f"Dari {statistik['n_hari']:,} hari data: rata-rata {statistik['rata_harian']:.2f} unit/hari, "
+                               f"simpangan baku {statistik['std_harian']:.2f} unit/hari.")
+        S = st.number_input("Biaya pemesanan per kali (Rp)", min_value=0.0, value=50000.0, key="eoq_S")
+        H = st.number_input("Biaya penyimpanan per unit per tahun (Rp)", min_value=0.0, value=1000.0, key="eoq_H")
+
+        if st.button("📊 Hitung EOQ", key="eoq_btn_hitung"):
+            if D is None:
+                st.error("❌ Pilih arsip dan SKU yang valid terlebih dahulu.")
+            elif H == 0:
+                st.error("❌ Biaya penyimpanan tidak boleh nol.")
+            else:
+                from . import persediaan
+
+                hasil, _ = cache_hasil().ambil_atau_hitung("eoq", persediaan.hitung_eoq, D, S, H)
+                eoq, frek = float(hasil["EOQ"]), float(hasil["frekuensi"])
+                biaya_pesan, biaya_simpan = float(hasil["biaya_pesan"]), float(hasil["biaya_simpan"])
+                total_biaya = float(hasil["total_biaya"])
+
+                st.success("✅ Hasil Perhitungan:")
+                st.write(f"Jumlah EOQ optimal: *{eoq:.2f} unit*")
+                st.write(f"Frekuensi pemesanan per tahun: *{frek:.2f} kali*")
+                st.write(f"Total biaya pemesanan: *Rp {biaya_pesan:,.2f}*")
+                st.write(f"Total biaya penyimpanan: *Rp {biaya_simpan:,.2f}*")
+                st.write(f"Total biaya persediaan tahunan: *Rp {total_biaya:,.2f}*")
+                if tampilan.grafik_biaya_eoq is not None:
+                    tampilan.grafik_biaya_eoq(biaya_pesan, biaya_simpan)
+    else:
+        st.markdown("Unggah katalog CSV atau Parquet dengan kolom `D`, `S`, `H` "
+                    "serta opsional `LT` (lead time, hari) dan `safety_stock`.")
+        file_katalog = st.file_uploader("File katalog", type=["csv", "parquet"], key="eoq_file_katalog")
+
+        if st.button("📊 Hitung EOQ Katalog", key="eoq_btn_katalog"):
+            if file_katalog is None:
+                st.error("❌ Unggah file katalog terlebih dahulu.")
+            else:
+                from . import persediaan
+
+                format_file = "parquet" if file_katalog.name.endswith(".parquet") else "csv"
+                with tempfile.NamedTemporaryFile(suffix="." + format_file, delete=False) as f:
+                    path_hasil = f.name
+                try:
+                    with diagnostik.tahap("hitung katalog EOQ"):
+                        jumlah = persediaan.proses_katalog(file_katalog, path_hasil, format_file)
+                except ValueError as e:
+                    st.error(f"❌ {e}")
+                else:
+                    st.success(f"✅ EOQ dan ROP dihitung untuk {jumlah:,} item.")
+                    st.dataframe(next(persediaan.baca_katalog(path_hasil, format_file, ukuran_chunk=100)))
+                    with open(path_hasil, "rb") as f:
+                        st.download_button("⬇️ Unduh Hasil", f.read(), file_name=f"hasil_eoq.{format_file}", key="eoq_dl_katalog")
+                finally:
+                    os.remove(path_hasil)
+
+# ================== TAB 3: Antrian M/M/1 ==================
+@st.fragment
+@dicatat
+def tab_antrian(tampilan):
+    import pandas as pd
+    from . import antrian
+
+    st.header("🧮 Model Antrian M/M/1")
+
+    lambda_rate = st.number_input("Rata-rata kedatangan (λ, per jam)", min_value=0.1, value=5.0, key="antrian_lambda")
+    mu_rate = st.number_input("Rata-rata pelayanan (μ, per jam)", min_value=0.1, value=8.0, key="antrian_mu")
+
+    if st.button("📊 Hitung Model Antrian", key="antrian_btn_hitung"):
+        if lambda_rate >= mu_rate:
+            st.error(tampilan.pesan_tidak_stabil)
+        else:
+            hasil, _ = cache_hasil().ambil_atau_hitung("mm1", antrian.mm1, lambda_rate, mu_rate)
+            rho, L, Lq, W, Wq = (float(hasil[k]) for k in ("rho", "L", "Lq", "W", "Wq"))
+
+            st.success("✅ Hasil Perhitungan:")
+            st.write(f"Utilisasi sistem (ρ): *{rho:.2f}*")
+            st.write(f"Rata-rata pelanggan dalam sistem (L): *{L:.2f}*")
+            st.write(f"Rata-rata pelanggan dalam antrian (Lq): *{Lq:.2f}*")
+            st.write(f"Rata-rata waktu dalam sistem (W): *{W:.2f} jam*")
+            st.write(f"Rata-rata waktu dalam antrian (Wq): *{Wq:.2f} jam*")
+            if tampilan.grafik_antrian is not None:
+                tampilan.grafik_antrian(L, Lq, W, Wq)
+
+    # ---- Validasi rumus analitik dengan simulasi event diskrit ----
+    with st.expander("🎲 Validasi dengan Simulasi"):
+        st.markdown("Simulasi antrian FIFO satu server untuk membandingkan rumus M/M/1 dengan pola kedatangan nyata. "
+                    "Unggah sampel empiris (CSV, kolom pertama, dalam jam) atau kosongkan untuk memakai distribusi eksponensial dari λ dan μ di atas.")
+        file_datang = st.file_uploader("Sampel waktu antar-kedatangan", type="csv", key="antrian_file_datang")
+        file_layanan = st.file_uploader("Sampel waktu layanan", type="csv", key="antrian_file_layanan")
+        n_pelanggan = st.number_input("Jumlah pelanggan yang disimulasikan", 10_000, 50_000_000, 1_000_000, step=100_000,
+                                      key="antrian_n_pelanggan")
+
+        if st.button("🎲 Jalankan Simulasi", key="antrian_btn_simulasi"):
+            from . import simulasi_antrian
+
+            try:
+                datang = simulasi_antrian.baca_sampel(file_datang) if file_datang is not None else lambda_rate
+                layanan = simulasi_antrian.baca_sampel(file_layanan) if file_layanan is not None else mu_rate
+                with diagnostik.tahap("simulasi antrian"):
+                    ringkasan, statistik = simulasi_antrian.simulasi_antrian(datang, layanan, n_pelanggan=int(n_pelanggan))
+            except ValueError as e:
+                st.error(f"❌ {e}")
+            else:
+                if lambda_rate < mu_rate:
+                    analitik = antrian.mm1(lambda_rate, mu_rate)
+                    ringkasan["analitik_M/M/1"] = [float(analitik[m]) for m in ringkasan["metrik"]]
+                st.dataframe(ringkasan, hide_index=True)
+                st.caption(f"{statistik['n_pelanggan']:,} pelanggan disimulasikan dalam {statistik['durasi_detik']:.2f} detik "
+                           f"({statistik['pelanggan_per_detik']:,.0f} pelanggan/detik); selang kepercayaan 95% dari batch means.")
+
+    # ---- Model lanjutan: multi-server, buffer terbatas, M/G/1, jaringan ----
+    # Dihitung lewat cache hasil sehingga rerun tanpa perubahan input tidak menghitung ulang.
+    st.subheader("Model Antrian Lanjutan")
+    model_antrian = st.selectbox("Model", ["M/M/c", "M/M/c/K", "M/G/1", "Jaringan Jackson", "Cari Jumlah Server Termurah"],
+                                 key="antrian_model")
+
+    if model_antrian in ("M/M/c", "M/M/c/K"):
+        jumlah_server = st.number_input("Jumlah server (c)", 1, 10_000, 2, key="antrian_c")
+        if model_antrian == "M/M/c/K":
+            kapasitas_sistem = st.number_input("Kapasitas sistem (K)", 1, 100_000, 10, key="antrian_K")
+            hasil, _ = cache_hasil().ambil_atau_hitung("mmck", antrian.mmck, lambda_rate, mu_rate, jumlah_server,
+                                                       max(kapasitas_sistem, jumlah_server))
+        else:
+            hasil, _ = cache_hasil().ambil_atau_hitung("mmc", antrian.mmc, lambda_rate, mu_rate, jumlah_server)
+    elif model_antrian == "M/G/1":
+        std_layanan = st.number_input("Simpangan baku waktu layanan (jam)", min_value=0.0, value=1 / mu_rate, format="%.4f",
+                                      key="antrian_std_layanan")
+        hasil, _ = cache_hasil().ambil_atau_hitung("mg1", antrian.mg1, lambda_rate, mu_rate, std_layanan)
+    else:
+        hasil = None
+
+    if hasil is not None:
+        if not hasil["stabil"]:
+            st.error("❌ Sistem tidak stabil. Utilisasi (ρ) harus lebih kecil dari 1.")
+        else:
+            st.dataframe(pd.DataFrame({k: [float(v)] for k, v in hasil.items() if k != "stabil"}), hide_index=True)
+
+    elif model_antrian == "Jaringan Jackson":
+        st.markdown("Isi parameter tiap node dan matriks routing `P[i, j]` (probabilitas pindah dari node i ke node j).")
+        node = st.data_editor(pd.DataFrame({"gamma": [2.0, 1.0], "mu": [5.0, 4.0], "c": [1, 1]}),
+                              num_rows="dynamic", key="antrian_node")
+        node = node.dropna(how="all")  # baris baru yang belum diisi sama sekali diabaikan
+        routing = st.data_editor(pd.DataFrame(np.zeros((len(node), len(node))), columns=node.index.astype(str)),
+                                 key="antrian_routing")
+        try:
+            (per_node, total), _ = cache_hasil().ambil_atau_hitung(
+                "jaringan_jackson", antrian.jaringan_jackson, node["gamma"].to_numpy(dtype=float),
+                node["mu"].to_numpy(dtype=float), node["c"].to_numpy(dtype=float), routing.to_numpy(dtype=float))
+        except np.linalg.LinAlgError:
+            st.error("❌ Matriks routing tidak valid (pelanggan tidak pernah keluar dari jaringan).")
+        except ValueError as e:
+            st.error(f"❌ {e}")
+        else:
+            st.dataframe(per_node)
+            if total["stabil"]:
+                st.write(f"Total pelanggan dalam jaringan (L): *{total['L']:.2f}*, waktu dalam jaringan (W): *{total['W']:.2f} jam*")
+            else:
+                st.error("❌ Ada node yang tidak stabil.")
+
+    else:
+        st.markdown("Sweep laju kedatangan dan cari jumlah server M/M/c paling sedikit yang memenuhi target Wq.")
+        col1, col2 = st.columns(2)
+        with col1:
+            lam_min = st.number_input("λ minimum", min_value=0.1, value=lambda_rate, key="antrian_lam_min")
+            lam_max = st.number_input("λ maksimum", min_value=0.1, value=lambda_rate * 20, key="antrian_lam_max")
+            lam_n = st.number_input("Jumlah titik λ", 1, 100_000, 1000, key="antrian_lam_n")
+        with col2:
+            target_Wq = st.number_input("Target Wq maksimum (jam)", min_value=0.0, value=0.1, format="%.4f", key="antrian_target")
+            biaya_server = st.number_input("Biaya per server (Rp)", min_value=0.0, value=50000.0, key="antrian_biaya")
+
+        # Sweep bisa berisi 100 ribu λ, jadi hanya dihitung saat tombol ditekan.
+        if st.button("🔍 Cari Jumlah Server", key="antrian_btn_server"):
+            lam = np.linspace(lam_min, lam_max, int(lam_n))
+            hasil_sweep, _ = cache_hasil().ambil_atau_hitung("server_termurah", antrian.cari_server_termurah,
+                                                             lam, mu_rate, target_Wq, biaya_server)
+            sweep = pd.DataFrame({"lam": lam, **hasil_sweep})
+            st.dataframe(sweep)
+            st.line_chart(sweep, x="lam", y="c")
+
+# ================== TAB 4: Prediksi Downtime ==================
+@st.fragment
+@dicatat
+def tab_downtime(tampilan):
+    from . import downtime  # sklearn baru dimuat saat model dilatih
+
+    st.header("📉 Prediksi Downtime Mesin Industri")
+
+    jam_operasional = st.number_input("Jam Operasional per Minggu", 10, 100, 40, key="dt_jam")
+    umur_mesin = st.number_input("Umur Mesin (Tahun)", 1, 20, 5, key="dt_umur")
+
+    sumber_data = st.radio("Sumber data historis", ["Data sintetis", "Unggah file", "Log telemetri besar", "Arsip per mesin"], horizontal=True, key="dt_sumber")
+
+    df = model = None
+    if sumber_data == "Data sintetis":
+        seed = st.number_input("Seed data sintetis", 0, 2**31 - 1, 42, key="dt_seed")
+        with diagnostik.tahap("latih model"):
+            df, model = model_downtime(seed, f"sintetis-v{downtime.VERSI_SINTETIS}")
+    elif sumber_data == "Log telemetri besar":
+        path_log = st.text_area("Path file log di server (satu per baris, CSV/Parquet, kolom jam_operasional, umur_mesin, downtime)", key="dt_path_log")
+        daftar_log = tuple(p.strip() for p in path_log.splitlines() if p.strip())
+        if not daftar_log:
+            st.info("Masukkan path file log telemetri untuk melatih model secara bertahap.")
+        else:
+            try:
+                with diagnostik.tahap("latih model"):
+                    df, model, n_baris = model_downtime_streaming(daftar_log, downtime.versi_file(daftar_log))
+            except (OSError, ValueError) as e:
+                st.error(f"❌ {e}")
+            else:
+                st.caption(f"Model dilatih bertahap dari {n_baris:,} baris log; grafik menampilkan sampel data.")
+    elif sumber_data == "Arsip per mesin":
+        from . import arsip
+
+        path_arsip = st.text_input("Path arsip downtime di server (dibangun dengan `python -m mtk arsip downtime`)", key="dt_arsip_path")
+        mesin = st.text_input("Mesin (kosongkan untuk semua mesin)", key="dt_arsip_mesin").strip() or None
+        if not path_arsip:
+            st.info("Masukkan path arsip downtime untuk melatih model per mesin.")
+        else:
+            # Model dari ringkasan XᵀX/Xᵀy per mesin di arsip (tanpa membaca log);
+            # grafik hanya mengambil sampel baris mesin tersebut dari memory map.
+            try:
+                with diagnostik.tahap("latih model"):
+                    data_arsip = arsip.buka(path_arsip)
+                    akumulator = arsip.akumulator_downtime(data_arsip, mesin)
+                    model_arsip = akumulator.model()
+                    df_arsip = arsip.data_downtime(data_arsip, mesin, n_maks=500)
+            except KeyError as e:
+                st.error(f"❌ {e.args[0]}")
+            except (OSError, ValueError) as e:
+                st.error(f"❌ {e}")
+            else:
+                df, model = df_arsip, model_arsip
+                cakupan = f"mesin {mesin}" if mesin else f"{len(data_arsip.kunci):,} mesin"
+                st.caption(f"Model dilatih dari ringkasan {akumulator.n:,} baris arsip ({cakupan}); grafik menampilkan sampel data.")
+    else:
+        file_downtime = st.file_uploader("Data historis (CSV/Parquet, kolom jam_operasional, umur_mesin, downtime)",
+                                         type=["csv", "parquet"], key="dt_file_historis")
+        if file_downtime is None:
+            st.info("Unggah file data historis untuk melatih model.")
+        else:
+            try:
+                with diagnostik.tahap("latih model"):
+                    df, model = model_downtime(None, downtime.versi_data(file_downtime.getvalue()), file_downtime, file_downtime.name)
+            except ValueError as e:
+                st.error(f"❌ {e}")
+
+    if model is not None:
+        input_data = np.array([[jam_operasional, umur_mesin]])
+        with diagnostik.tahap("prediksi"):
+            prediksi_downtime = model.predict(input_data)[0]
+
+        st.subheader("Hasil Prediksi")
+        st.write(f"Perkiraan Downtime Mesin: *{prediksi_downtime:.2f} jam/minggu*")
+
+        st.subheader("Visualisasi Downtime")
+        from . import grafik  # PNG di-cache per input; rerun tanpa perubahan data tidak merender ulang
+
+        with diagnostik.tahap("grafik"):
+            st.image(grafik.png_sebar_downtime(df["jam_operasional"], df["downtime"], jam_operasional,
+                                               prediksi_downtime, tampilan.judul_grafik_downtime), width="stretch")
+
+
+# ================== Navigasi Tab ==================
+# Tab bersifat lazy (hanya tab aktif yang dijalankan) dan setiap tab adalah fragment,
+# sehingga interaksi di satu tab hanya menjalankan ulang tab itu sendiri.
+DAFTAR_TAB = [
+    ("🔧 Optimasi Produksi", "lp_", tab_optimasi),
+    ("📦 EOQ Persediaan", "eoq_", tab_eoq),
+    ("🧮 Model Antrian", "antrian_", tab_antrian),
+    ("📉 Prediksi Downtime", "dt_", tab_downtime),
+]
+
+
+def tampilkan_tab(tampilan=Tampilan()):
+    """Render tab aktif; tab lain hanya dipertahankan nilai inputnya."""
+    tab_aktif = st.session_state.get("tab_aktif", DAFTAR_TAB[0][0])
+    for label, prefix, _ in DAFTAR_TAB:
+        if label != tab_aktif:
+            pertahankan_input(prefix)
+
+    tabs = st.tabs([label for label, _, _ in DAFTAR_TAB], key="tab_aktif", on_change="rerun")
+    with pencatat_rerun("halaman") if st.session_state.get("diag_aktif", False) else nullcontext():
+        for tab, (_, _, tampilkan) in zip(tabs, DAFTAR_TAB):
+            if tab.open:
+                with tab:
+                    tampilkan(tampilan)
+
+
+# ================== Panel Admin ==================
+# Penghitung diperbarui setiap halaman dijalankan ulang penuh (bukan saat fragment tab saja).
+def panel_cache():
+    with st.sidebar.expander("🛠️ Admin: Cache Hasil"):
+        if st.button("🗑️ Kosongkan cache", key="admin_btn_kosongkan"):
+            cache_hasil().kosongkan()
+        stat = cache_hasil().statistik()
+        st.write(f"Hit: *{stat['hit_memori']:,}* memori, *{stat['hit_disk']:,}* disk")
+        st.write(f"Miss: *{stat['miss']:,}* (rasio hit {stat['rasio_hit']:.0%})")
+        st.write(f"Entri di memori: *{stat['entri_memori']:,}* ({stat['byte_memori'] / 2**20:.1f} MB)")
+        if stat["entri_disk"] is None:
+            st.caption("Tingkat disk nonaktif; set MTK_CACHE_DB untuk mengaktifkannya.")
+        else:
+            st.write(f"Entri di disk: *{stat['entri_disk']:,}*")
+
+
+# ================== Panel Diagnostik ==================
+# Menampilkan rerun halaman ini (sudah selesai dicatat sebelum panel dirender) dan
+# riwayat rerun, termasuk rerun fragment tab. Set MTK_DIAGNOSTIK_LOG=path.jsonl
+# agar setiap ringkasan juga ditulis sebagai log JSON Lines.
+def panel_diagnostik():
+    with st.sidebar.expander("🩺 Diagnostik"):
+        diag_aktif = st.toggle("Catat waktu per tahap", key="diag_aktif")
+        st.checkbox("Ukur memori puncak (tracemalloc, memperlambat rerun)", key="diag_memori", disabled=not diag_aktif)
+        profiler = st.selectbox("Profiler", diagnostik.profiler_tersedia(), key="diag_profiler", disabled=not diag_aktif)
+        if st.button("🔬 Profil satu rerun", key="diag_btn_profil", disabled=not diag_aktif):
+            st.session_state["diag_profil_berikutnya"] = profiler
+            st.rerun()
+
+        riwayat = st.session_state.get("diag_riwayat", [])
+        if diag_aktif and riwayat:
+            import json
+            import pandas as pd
+
+            terakhir = riwayat[-1]
+            st.write(f"Rerun terakhir (*{terakhir['nama']}*): *{terakhir['durasi_detik'] * 1000:,.1f} ms*, "
+                     f"{terakhir['di_luar_tahap_detik'] * 1000:,.1f} ms di luar tahap (Streamlit & skrip)")
+            kolom = ["tahap", "durasi_detik"] + (["memori_puncak_byte"] if terakhir["memori_puncak_byte"] is not None else [])
+            tabel = pd.DataFrame(terakhir["tahap"], columns=kolom + ["kedalaman"])
+            tabel["tahap"] = ["· " * k + t for k, t in zip(tabel["kedalaman"], tabel["tahap"])]
+            st.dataframe(tabel[kolom], hide_index=True)
+            if terakhir["memori_puncak_byte"] is not None:
+                st.write(f"Memori puncak: *{terakhir['memori_puncak_byte'] / 2**20:,.1f} MB*")
+            if terakhir["laporan_profil"]:
+                st.code(terakhir["laporan_profil"], language=None)
+            st.dataframe(pd.DataFrame(riwayat, columns=["waktu", "nama", "durasi_detik", "memori_puncak_byte"]),
+                         hide_index=True)
+            st.download_button("⬇️ Unduh riwayat (JSON)", json.dumps(riwayat, indent=1, ensure_ascii=False),
+                               file_name="diagnostik.json", mime="application/json", key="diag_dl_json")
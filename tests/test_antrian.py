@@ -0,0 +1,95 @@
+import math
+
+import numpy as np
+import pytest
+
+from mtk import antrian
+
+
+@pytest.mark.parametrize("model", [
+    lambda lam: antrian.mmc(lam, 5.0, 2),
+    lambda lam: antrian.mmck(lam, 5.0, 2, 6),
+    lambda lam: antrian.mg1(lam, 5.0, 0.1),
+])
+def test_tanpa_kedatangan_adalah_sistem_kosong(model):
+    hasil = model(0.0)
+    assert float(hasil["L"]) == 0 and float(hasil["Lq"]) == 0 and float(hasil["Wq"]) == 0
+    assert float(hasil["W"]) == pytest.approx(1 / 5.0)
+    assert all(np.isfinite(np.asarray(v, dtype=float)).all() for v in hasil.values())
+
+
+@pytest.mark.parametrize("lam, mu", [(-1.0, 5.0), (1.0, 0.0)])
+def test_laju_tidak_valid(lam, mu):
+    with pytest.raises(ValueError):
+        antrian.mmck(lam, mu, 1, 3)
+    with pytest.raises(ValueError):
+        antrian.mmc(lam, mu, 1)
+
+
+def _erlang_c_rumus(lam, mu, c):
+    a = lam / mu
+    rho = a / c
+    suku_akhir = a ** c / math.factorial(c) / (1 - rho)
+    return suku_akhir / (sum(a ** k / math.factorial(k) for k in range(c)) + suku_akhir)
+
+
+def _mmck_brute(lam, mu, c, K):
+    a = lam / mu
+    p = np.array([a ** n / math.factorial(n) if n <= c else a ** n / (math.factorial(c) * c ** (n - c))
+                  for n in range(K + 1)])
+    p /= p.sum()
+    n = np.arange(K + 1)
+    L, Lq = (p * n).sum(), (p * np.maximum(n - c, 0)).sum()
+    lam_efektif = lam * (1 - p[K])
+    return {"P_blok": p[K], "L": L, "Lq": Lq, "W": L / lam_efektif, "Wq": Lq / lam_efektif}
+
+
+CONFIG_MMC = [(1.0, 2.0, 1), (5.0, 2.0, 3), (9.5, 1.0, 10), (40.0, 3.0, 15)]
+
+
+@pytest.mark.parametrize("lam, mu, c", CONFIG_MMC)
+def test_mmc_sama_dengan_rumus_tertutup(lam, mu, c):
+    Pw = _erlang_c_rumus(lam, mu, c)
+    rho = lam / (c * mu)
+    Lq = Pw * rho / (1 - rho)
+    hasil = antrian.mmc(lam, mu, c)
+    assert float(antrian.erlang_c(lam, mu, c)) == pytest.approx(Pw)
+    assert float(hasil["Pw"]) == pytest.approx(Pw)
+    assert float(hasil["Lq"]) == pytest.approx(Lq)
+    assert float(hasil["Wq"]) == pytest.approx(Lq / lam)
+    assert float(hasil["W"]) == pytest.approx(Lq / lam + 1 / mu)
+    assert float(hasil["L"]) == pytest.approx(Lq + lam / mu)
+
+
+def test_mmc_tervektorisasi_dan_satu_server_sama_dengan_mm1():
+    lam, mu, c = (np.array(v) for v in zip(*CONFIG_MMC))
+    hasil = antrian.mmc(lam, mu, c)
+    np.testing.assert_allclose(hasil["Pw"], [_erlang_c_rumus(*k) for k in CONFIG_MMC])
+    mm1 = antrian.mm1(3.0, 4.0)
+    mmc1 = antrian.mmc(3.0, 4.0, 1)
+    for k in ("L", "Lq", "W", "Wq"):
+        assert float(mmc1[k]) == pytest.approx(float(mm1[k]))
+
+
+@pytest.mark.parametrize("lam, mu, c, K", [(3.0, 4.0, 1, 1), (3.0, 4.0, 1, 8), (12.0, 5.0, 2, 6),
+                                           (7.0, 1.0, 4, 20), (2.0, 3.0, 3, 3)])
+def test_mmck_sama_dengan_penjumlahan_langsung(lam, mu, c, K):
+    hasil = antrian.mmck(lam, mu, c, K)
+    for k, nilai in _mmck_brute(lam, mu, c, K).items():
+        assert float(hasil[k]) == pytest.approx(nilai)
+
+
+def test_mmck_kapasitas_besar_mendekati_mmc():
+    mmc = antrian.mmc(9.0, 2.0, 5)
+    mmck = antrian.mmck(9.0, 2.0, 5, 2000)
+    for k in ("L", "Lq", "W", "Wq"):
+        assert float(mmck[k]) == pytest.approx(float(mmc[k]), rel=1e-6)
+
+
+def test_server_termurah_sama_dengan_pencarian_satu_per_satu():
+    lam = np.linspace(0.5, 60.0, 40)
+    hasil = antrian.cari_server_termurah(lam, 4.0, 0.05, 1000.0)
+    for i, l in enumerate(lam):
+        c = next(c for c in range(1, 200) if float(antrian.mmc(l, 4.0, c)["Wq"]) <= 0.05)
+        assert hasil["c"][i] == c
+        assert hasil["biaya"][i] == c * 1000.0
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from mtk import arsip
+
+
+def _permintaan_duplikat():
+    # Beberapa baris per (sku, hari), tidak terurut, dengan hari kosong di tengah.
+    rng = np.random.default_rng(0)
+    baris = []
+    for sku, hari in [("A", range(10)), ("B", range(3, 9, 2)), ("C", [5])]:
+        for h in hari:
+            for _ in range(rng.integers(1, 4)):
+                baris.append({"sku": sku, "hari": h, "permintaan": float(rng.integers(0, 20))})
+    return pd.DataFrame(baris).sample(frac=1, random_state=1).reset_index(drop=True)
+
+
+def _referensi(df):
+    hasil = {}
+    for sku, grup in df.groupby("sku"):
+        harian = grup.groupby("hari")["permintaan"].sum()
+        harian = harian.reindex(range(harian.index.min(), harian.index.max() + 1), fill_value=0.0)
+        hasil[sku] = (len(harian), harian.mean(), harian.var(ddof=1) if len(harian) > 1 else 0.0)
+    return hasil
+
+
+@pytest.mark.parametrize("format_sumber", ["csv", "parquet"])
+@pytest.mark.parametrize("ukuran_chunk", [4, 1_000_000])
+def test_varian_dari_total_harian(tmp_path, format_sumber, ukuran_chunk):
+    df = _permintaan_duplikat()
+    sumber = tmp_path / f"permintaan.{format_sumber}"
+    if format_sumber == "csv":
+        df.to_csv(sumber, index=False)
+    else:
+        pytest.importorskip("pyarrow")
+        df.to_parquet(sumber, index=False)
+
+    a = arsip.bangun_permintaan([str(sumber)], tmp_path / "permintaan.arsip", ukuran_chunk=ukuran_chunk)
+    statistik = arsip.statistik_permintaan(a).set_index("sku")
+    for sku, (n_hari, rata, varian) in _referensi(df).items():
+        assert statistik.loc[sku, "n_hari"] == n_hari
+        assert statistik.loc[sku, "rata_harian"] == pytest.approx(rata)
+        assert statistik.loc[sku, "varian_harian"] == pytest.approx(varian)
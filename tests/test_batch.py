@@ -0,0 +1,38 @@
+import json
+
+import numpy as np
+import pandas as pd
+
+from mtk import arsip, batch
+
+
+def test_hasil_tak_hingga_menjadi_null():
+    hasil = batch.jalankan({"jenis": "mm1", "lam": 8, "mu": 5})
+    teks = json.dumps(hasil, allow_nan=False)
+    assert json.loads(teks)["L"] is None
+
+    hasil = batch.jalankan({"jenis": "mm1", "lam": [2, 8], "mu": 5})
+    assert hasil["L"][0] == 2 / 3 and hasil["L"][1] is None
+
+
+def test_tabel_eoq_campuran_arsip_dan_manual(tmp_path):
+    pd.DataFrame({"sku": ["A"] * 4, "hari": [0, 1, 2, 3], "permintaan": [4.0, 6.0, 5.0, 5.0]}).to_csv(
+        tmp_path / "permintaan.csv", index=False)
+    path_arsip = str(tmp_path / "permintaan.arsip")
+    arsip.bangun_permintaan([str(tmp_path / "permintaan.csv")], path_arsip)
+
+    df = pd.DataFrame({
+        "jenis": ["eoq", "eoq", "mm1"],
+        "D": [1800.0, np.nan, np.nan],
+        "S": [90000.0, 90000.0, np.nan],
+        "H": [2500.0, 2500.0, np.nan],
+        "arsip": [np.nan, path_arsip, np.nan],
+        "sku": [np.nan, "A", np.nan],
+        "lam": [np.nan, np.nan, 2.0],
+        "mu": [np.nan, np.nan, 5.0],
+    })
+    tabel, _ = batch.jalankan_tabel(df)
+    assert "error" not in tabel.columns or tabel["error"].isna().all()
+    assert tabel.loc[0, "EOQ"] == np.sqrt(2 * 1800 * 90000 / 2500)
+    assert tabel.loc[1, "D"] == 5.0 * arsip.HARI_PER_TAHUN
+    assert tabel.loc[2, "L"] == 2 / 3
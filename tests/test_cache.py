@@ -0,0 +1,49 @@
+import numpy as np
+import pandas as pd
+
+from mtk import diagnostik
+from mtk.cache import CacheHasil
+
+
+def _hitung(n):
+    return {"tabel": pd.DataFrame({"x": np.arange(n, dtype=float)}), "array": np.ones(n)}
+
+
+def test_mengubah_hasil_tidak_mengubah_hit_berikutnya():
+    cache = CacheHasil()
+    hasil, dari_cache = cache.ambil_atau_hitung("uji", _hitung, 3)
+    assert not dari_cache
+    hasil["tabel"]["y"] = 1.0
+    hasil["array"][:] = -1
+
+    hit, dari_cache = cache.ambil_atau_hitung("uji", _hitung, 3)
+    assert dari_cache
+    hit["array"][0] = 99
+    hit["tabel"].loc[0, "x"] = 99
+
+    lagi, _ = cache.ambil_atau_hitung("uji", _hitung, 3)
+    assert list(lagi["tabel"].columns) == ["x"]
+    np.testing.assert_array_equal(lagi["tabel"]["x"], [0.0, 1.0, 2.0])
+    np.testing.assert_array_equal(lagi["array"], np.ones(3))
+
+
+def test_hit_disk_juga_salinan(tmp_path):
+    path_db = str(tmp_path / "cache.sqlite")
+    cache = CacheHasil(path_db=path_db)
+    cache.ambil_atau_hitung("uji", _hitung, 2)
+
+    cache_baru = CacheHasil(path_db=path_db)
+    hasil, dari_cache = cache_baru.ambil_atau_hitung("uji", _hitung, 2)
+    assert dari_cache
+    hasil["array"][:] = 0
+    lagi, _ = cache_baru.ambil_atau_hitung("uji", _hitung, 2)
+    np.testing.assert_array_equal(lagi["array"], np.ones(2))
+    assert cache_baru.statistik()["hit_disk"] == 1
+    assert cache_baru.statistik()["hit_memori"] == 1
+
+
+def test_nama_tahap_diagnostik():
+    with diagnostik.Pencatat() as pencatat:
+        CacheHasil().ambil_atau_hitung("eoq", _hitung, 1)
+        CacheHasil(tahap="render").ambil_atau_hitung("png_batang", _hitung, 1)
+    assert [t["tahap"] for t in pencatat.ke_dict()["tahap"]] == ["hitung eoq", "render png_batang"]
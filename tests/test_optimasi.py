@@ -0,0 +1,113 @@
+import numpy as np
+import pytest
+from scipy import sparse
+
+from mtk import optimasi
+
+# Contoh dengan optimum tunggal dan tidak degenerate: x = (2, 0, 1), sumber daya 2 tidak terikat.
+KEUNTUNGAN = np.array([5.0, 4.0, 3.0])
+KONSUMSI = np.array([[2.0, 3.0, 1.0], [4.0, 1.0, 2.0], [3.0, 4.0, 2.0]])
+KAPASITAS = np.array([5.0, 11.0, 8.0])
+
+
+@pytest.fixture(params=["highspy", "linprog"])
+def pemecah(request, monkeypatch):
+    # Parametrik diuji dengan HiGHS (warm start) dan dengan fallback linprog.
+    if request.param == "highspy":
+        pytest.importorskip("highspy")
+    else:
+        monkeypatch.setattr(optimasi, "_highspy", lambda: None)
+    return request.param
+
+
+def _titik_uji(bawah, atas, nilai, langkah=0.5):
+    # Titik di dalam rentang dan tepat di luarnya (sisi tak hingga diuji dengan nilai jauh).
+    lebar = max(atas - bawah, 1.0) if np.isfinite(atas - bawah) else 1.0
+    bawah_uji = bawah if np.isfinite(bawah) else nilai - 1e3
+    atas_uji = atas if np.isfinite(atas) else nilai + 1e3
+    di_dalam = [bawah_uji + 1e-6 * lebar, nilai, atas_uji - 1e-6 * lebar]
+    di_luar = [t for t, batas in ((bawah - langkah * lebar, bawah), (atas + langkah * lebar, atas)) if np.isfinite(batas)]
+    return di_dalam, di_luar
+
+
+def test_rentang_keuntungan_sesuai_solve_ulang():
+    pytest.importorskip("highspy")
+    dasar = optimasi.analisis_sensitivitas(KEUNTUNGAN, KONSUMSI, KAPASITAS)
+    for j, (bawah, atas) in enumerate(dasar["rentang_keuntungan"]):
+        di_dalam, di_luar = _titik_uji(bawah, atas, KEUNTUNGAN[j])
+        for t in di_dalam:
+            c = KEUNTUNGAN.copy()
+            c[j] = t
+            np.testing.assert_allclose(optimasi.selesaikan(c, KONSUMSI, KAPASITAS)["x"], dasar["x"], atol=1e-7)
+        for t in di_luar:
+            c = KEUNTUNGAN.copy()
+            c[j] = t
+            assert not np.allclose(optimasi.selesaikan(c, KONSUMSI, KAPASITAS)["x"], dasar["x"], atol=1e-7)
+
+
+def test_rentang_kapasitas_sesuai_solve_ulang():
+    pytest.importorskip("highspy")
+    dasar = optimasi.analisis_sensitivitas(KEUNTUNGAN, KONSUMSI, KAPASITAS)
+    for i, (bawah, atas) in enumerate(dasar["rentang_kapasitas"]):
+        assert bawah <= KAPASITAS[i] <= atas
+        di_dalam, di_luar = _titik_uji(bawah, atas, KAPASITAS[i])
+        for t in di_dalam:
+            b = KAPASITAS.copy()
+            b[i] = t
+            hasil = optimasi.selesaikan(KEUNTUNGAN, KONSUMSI, b)
+            np.testing.assert_allclose(hasil["harga_bayangan"], dasar["harga_bayangan"], atol=1e-7)
+            assert hasil["keuntungan_total"] == pytest.approx(
+                dasar["keuntungan_total"] + dasar["harga_bayangan"][i] * (t - KAPASITAS[i]))
+        for t in di_luar:
+            b = KAPASITAS.copy()
+            b[i] = t
+            hasil = optimasi.selesaikan(KEUNTUNGAN, KONSUMSI, b)
+            assert not hasil["sukses"] or not np.allclose(hasil["harga_bayangan"], dasar["harga_bayangan"], atol=1e-7)
+
+
+def test_harga_bayangan_sama_dengan_selisih_hingga():
+    dasar = optimasi.selesaikan(KEUNTUNGAN, KONSUMSI, KAPASITAS)
+    for i in range(len(KAPASITAS)):
+        b = KAPASITAS.copy()
+        b[i] += 1e-3
+        naik = optimasi.selesaikan(KEUNTUNGAN, KONSUMSI, b)["keuntungan_total"]
+        assert (naik - dasar["keuntungan_total"]) / 1e-3 == pytest.approx(dasar["harga_bayangan"][i], abs=1e-6)
+
+
+@pytest.mark.parametrize("indeks", [0, 1, 2])
+def test_titik_patah_parametrik_sesuai_grid(pemecah, indeks):
+    titik, statistik = optimasi.parametrik_kapasitas(KEUNTUNGAN, KONSUMSI, KAPASITAS, indeks)
+    assert statistik["jumlah_titik_patah"] == len(titik) - 2
+    grid = np.linspace(titik["kapasitas"].iloc[0], titik["kapasitas"].iloc[-1], 201)
+    acuan = []
+    for t in grid:
+        b = KAPASITAS.copy()
+        b[indeks] = t
+        acuan.append(optimasi.selesaikan(KEUNTUNGAN, KONSUMSI, b)["keuntungan_total"])
+    # Interpolasi linear di antara titik patah harus tepat sama dengan solve di setiap titik grid.
+    np.testing.assert_allclose(np.interp(grid, titik["kapasitas"], titik["keuntungan_total"]), acuan, atol=1e-7)
+    # Setiap titik patah memang mengubah kemiringan.
+    kemiringan = titik["harga_bayangan"].to_numpy()
+    assert (np.abs(np.diff(kemiringan[:-1])) > 1e-9).all()
+
+
+@pytest.mark.parametrize("n_proses", [1, 2])
+def test_skenario_sesuai_solve_satu_per_satu(pemecah, n_proses):
+    model = optimasi.ModelProduksi(produk=["A", "B", "C"], sumber_daya=["R1", "R2", "R3"], keuntungan=KEUNTUNGAN,
+                                   kapasitas=KAPASITAS, A=sparse.csr_matrix(KONSUMSI))
+    # Skala kapasitas negatif membuat model tidak layak; skala nol memberi rencana kosong.
+    meta, C, B = optimasi.buat_skenario(model, [0.5, 1.0, 1.7, 3.0], [-1.0, 0.0, 0.6, 1.0, 2.5])
+    hasil, statistik = optimasi.selesaikan_skenario(model, C, B, meta, n_proses=n_proses, ukuran_blok=3)
+    assert statistik["jumlah_solve"] == len(meta) == len(hasil)
+    assert statistik["jumlah_proses"] == n_proses
+    np.testing.assert_array_equal(hasil[["skala_keuntungan", "skala_kapasitas"]], meta)
+    for i, baris in hasil.iterrows():
+        acuan = optimasi.selesaikan(C[i], KONSUMSI, B[i])
+        assert baris["optimal"] == acuan["sukses"]
+        if not acuan["sukses"]:
+            assert np.isnan(baris["keuntungan_total"])
+            continue
+        assert baris["keuntungan_total"] == pytest.approx(acuan["keuntungan_total"], abs=1e-7)
+        x = baris[model.produk].to_numpy(dtype=float)
+        assert (KONSUMSI @ x <= B[i] + 1e-7).all() and (x >= -1e-9).all()
+        assert C[i] @ x == pytest.approx(acuan["keuntungan_total"], abs=1e-7)
@@ -0,0 +1,78 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from mtk import optimasi_integer
+
+KEUNTUNGAN = [7.0, 5.0, 4.0]
+KONSUMSI = [[3.0, 2.0, 1.0], [1.0, 2.0, 3.0]]
+KAPASITAS = [11.0, 10.0]
+
+
+@pytest.fixture(params=["highspy", "scipy"])
+def pemecah(request, monkeypatch):
+    if request.param == "highspy":
+        pytest.importorskip("highspy")
+    else:
+        monkeypatch.setattr(optimasi_integer, "_highspy", lambda: None)
+    return request.param
+
+
+def _brute_force(keuntungan, konsumsi, kapasitas, biaya_setup=None, lot_minimum=None):
+    c, A, b = np.asarray(keuntungan), np.asarray(konsumsi), np.asarray(kapasitas)
+    f = np.zeros(len(c)) if biaya_setup is None else np.asarray(biaya_setup)
+    L = np.zeros(len(c)) if lot_minimum is None else np.asarray(lot_minimum)
+    terbaik = (0.0, np.zeros(len(c)))
+    for x in itertools.product(range(12), repeat=len(c)):
+        x = np.array(x, dtype=float)
+        if (A @ x > b + 1e-9).any() or ((x > 0) & (x < L)).any():
+            continue
+        nilai = c @ x - f @ (x > 0)
+        if nilai > terbaik[0] + 1e-9:
+            terbaik = (nilai, x)
+    return terbaik
+
+
+@pytest.mark.parametrize("biaya_setup, lot_minimum", [
+    (None, None),
+    ([12.0, 0.0, 3.0], None),
+    (None, [0.0, 4.0, 0.0]),
+    ([5.0, 2.0, 20.0], [2.0, 0.0, 0.0]),
+])
+def test_milp_sesuai_brute_force(pemecah, biaya_setup, lot_minimum):
+    hasil = optimasi_integer.selesaikan_milp(KEUNTUNGAN, KONSUMSI, KAPASITAS, biaya_setup, lot_minimum,
+                                             gap_relatif=0.0)
+    nilai, _ = _brute_force(KEUNTUNGAN, KONSUMSI, KAPASITAS, biaya_setup, lot_minimum)
+    assert hasil["sukses"]
+    assert hasil["keuntungan_total"] == pytest.approx(nilai)
+    # Solusi yang dikembalikan harus layak dan bernilai sama dengan keuntungannya.
+    x = hasil["x"]
+    np.testing.assert_array_equal(x, np.round(x))
+    assert (np.asarray(KONSUMSI) @ x <= np.asarray(KAPASITAS) + 1e-9).all()
+    f = np.zeros(3) if biaya_setup is None else np.asarray(biaya_setup)
+    assert np.dot(KEUNTUNGAN, x) - f @ hasil["diproduksi"] == pytest.approx(nilai)
+
+
+def test_kapasitas_nol_tidak_memproduksi_pemakainya(pemecah):
+    kapasitas = [11.0, 0.0]
+    konsumsi = [[3.0, 2.0, 1.0], [0.0, 2.0, 3.0]]
+    hasil = optimasi_integer.selesaikan_milp(KEUNTUNGAN, konsumsi, kapasitas, [1.0, 1.0, 1.0], gap_relatif=0.0)
+    nilai, _ = _brute_force(KEUNTUNGAN, konsumsi, kapasitas, [1.0, 1.0, 1.0])
+    assert hasil["keuntungan_total"] == pytest.approx(nilai)
+    assert list(hasil["x"]) == [3.0, 0.0, 0.0]
+    assert list(hasil["diproduksi"]) == [True, False, False]
+
+
+def test_semua_kapasitas_nol(pemecah):
+    hasil = optimasi_integer.selesaikan_milp(KEUNTUNGAN, KONSUMSI, [0.0, 0.0], [1.0, 1.0, 1.0])
+    assert hasil["sukses"]
+    assert hasil["keuntungan_total"] == 0.0
+    assert not np.signbit(hasil["x"]).any() and not hasil["x"].any()
+
+
+def test_solusi_tanpa_nol_negatif():
+    pencarian = optimasi_integer.PencarianMILP([30.0, 20.0], [[2.0, 1.0], [1.0, 1.0]], [100.0, 80.0])
+    hasil = pencarian._hasil_akhir(np.array([-0.0, -1e-12, 1.0, 0.0]), -20.0, 0.0, "Optimal")
+    assert not np.signbit(hasil["x"]).any()
+    assert list(hasil["diproduksi"]) == [False, False]
@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+from mtk import perencanaan
+
+
+def _rencanakan(**kwargs):
+    # Satu produk, satu sumber daya (1 jam per unit), biaya simpan 1 per periode.
+    argumen = dict(keuntungan=[10.0], konsumsi=[[1.0]], kapasitas=[[10.0], [2.0]], permintaan=[[4.0], [8.0]],
+                   H=52.0, periode_per_tahun=52)
+    return perencanaan.rencanakan(**{**argumen, **kwargs})
+
+
+def test_produksi_di_muka_bila_kapasitas_periode_berikut_kurang():
+    rencana, pemakaian, statistik = _rencanakan()
+    assert statistik["sukses"]
+    # Periode 1 membuat 10 (4 dijual, 6 disimpan), periode 2 membuat 2 dan menjual 8.
+    np.testing.assert_allclose(rencana["produksi"], [10.0, 2.0], atol=1e-7)
+    np.testing.assert_allclose(rencana["penjualan"], [4.0, 8.0], atol=1e-7)
+    np.testing.assert_allclose(rencana["persediaan_akhir"], [6.0, 0.0], atol=1e-7)
+    np.testing.assert_allclose(rencana["permintaan_tak_terpenuhi"], [0.0, 0.0], atol=1e-7)
+    assert statistik["keuntungan_total"] == pytest.approx(10.0 * 12 - 6.0)
+    # Satu jam tambahan di periode 2 langsung dijual; di periode 1 harus disimpan dulu.
+    np.testing.assert_allclose(pemakaian["terpakai"], [10.0, 2.0], atol=1e-7)
+    np.testing.assert_allclose(pemakaian["harga_bayangan"], [9.0, 10.0], atol=1e-7)
+
+
+def test_tidak_menyimpan_bila_biaya_simpan_melebihi_keuntungan():
+    rencana, _, statistik = _rencanakan(H=52.0 * 20)
+    np.testing.assert_allclose(rencana["penjualan"], [4.0, 2.0], atol=1e-7)
+    np.testing.assert_allclose(rencana["persediaan_akhir"], [0.0, 0.0], atol=1e-7)
+    np.testing.assert_allclose(rencana["permintaan_tak_terpenuhi"], [0.0, 6.0], atol=1e-7)
+    assert statistik["keuntungan_total"] == pytest.approx(60.0)
+
+
+def test_persediaan_awal_dan_stok_minimum():
+    rencana, _, statistik = _rencanakan(persediaan_awal=3.0, stok_minimum=1.0)
+    # Stok akhir minimal 1 di kedua periode: p1 = 8, s1 = 3 + 8 - 4 = 7, s2 = 7 + 2 - 8 = 1.
+    np.testing.assert_allclose(rencana["produksi"], [8.0, 2.0], atol=1e-7)
+    np.testing.assert_allclose(rencana["persediaan_akhir"], [7.0, 1.0], atol=1e-7)
+    assert statistik["keuntungan_total"] == pytest.approx(10.0 * 12 - 8.0)
+
+
+def test_model_tidak_layak():
+    rencana, pemakaian, statistik = _rencanakan(kapasitas=[0.0], stok_minimum=1.0)
+    assert not statistik["sukses"]
+    assert rencana is None and pemakaian is None
+    assert np.isnan(statistik["keuntungan_total"])
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+
+from mtk import simulasi
+
+
+def _loop_harian(permintaan_harian, EOQ, ROP, LT, safety_stock, hari):
+    # Loop per hari dari versi awal tugas_UAS.py, sebagai acuan.
+    level = [EOQ + safety_stock]
+    dipesan, diterima = [], []
+    persediaan = EOQ + safety_stock
+    dalam_perjalanan = []  # (hari tiba, jumlah)
+    for hari_ke in range(1, hari + 1):
+        persediaan -= permintaan_harian
+        sisa = []
+        for tiba, jumlah in dalam_perjalanan:
+            if hari_ke >= tiba:
+                persediaan += jumlah
+                diterima.append(hari_ke)
+            else:
+                sisa.append((tiba, jumlah))
+        dalam_perjalanan = sisa
+        if persediaan <= ROP and not any(q > 0 for _, q in dalam_perjalanan):
+            dipesan.append(hari_ke)
+            dalam_perjalanan.append((hari_ke + LT, EOQ))
+        level.append(max(0, persediaan))
+    return np.array(level), dipesan, diterima
+
+
+@pytest.mark.parametrize("LT", [7.0, 2.5, 0.4, 0.0])
+def test_sama_dengan_loop_harian(LT):
+    permintaan_harian, EOQ, safety_stock = 1800 / 365, 360.0, 5.0
+    ROP = permintaan_harian * LT + safety_stock
+    hasil = simulasi.simulasi_persediaan(permintaan_harian, EOQ, ROP, LT, safety_stock, hari=400)
+    level, dipesan, diterima = _loop_harian(permintaan_harian, EOQ, ROP, LT, safety_stock, 400)
+
+    np.testing.assert_allclose(hasil.level[:, 0], level)
+    assert hasil.hari[hasil.dipesan[:, 0]].tolist() == dipesan
+    assert hasil.hari[hasil.diterima[:, 0]].tolist() == diterima
+    assert hasil.ringkasan["jumlah_pesanan"].iloc[0] == len(dipesan)
+
+
+def test_banyak_sku_sama_dengan_per_sku():
+    d = np.array([3.0, 10.0, 0.5, 7.0])
+    Q = np.array([40.0, 55.0, 9.0, 30.0])
+    LT = np.array([0.0, 3.0, 1.5, 12.0])
+    ss = np.array([0.0, 4.0, 1.0, 0.0])
+    ROP = d * LT + ss
+    hasil = simulasi.simulasi_persediaan(d, Q, ROP, LT, ss, hari=200)
+    for j in range(len(d)):
+        level, dipesan, diterima = _loop_harian(d[j], Q[j], ROP[j], LT[j], ss[j], 200)
+        np.testing.assert_allclose(hasil.level[:, j], level)
+        assert hasil.hari[hasil.dipesan[:, j]].tolist() == dipesan
+        assert hasil.hari[hasil.diterima[:, j]].tolist() == diterima
+        assert hasil.ringkasan["hari_kehabisan"].iloc[j] == int((level[1:] <= 0).sum())
+        assert hasil.ringkasan["rata_rata_persediaan"].iloc[j] == pytest.approx(level.mean())
+
+
+def test_tanpa_jejak_ringkasan_sama():
+    args = (np.array([3.0, 10.0]), np.array([40.0, 55.0]), np.array([9.0, 34.0]), np.array([3.0, 3.0]), 4.0)
+    dengan = simulasi.simulasi_persediaan(*args, hari=120)
+    tanpa = simulasi.simulasi_persediaan(*args, hari=120, simpan_jejak=False)
+    assert tanpa.level is None
+    assert dengan.ringkasan.equals(tanpa.ringkasan)
+
+
+def test_monte_carlo_tanpa_variasi_sama_dengan_deterministik():
+    # cv = 0 dan simpangan lead time 0: setiap replikasi sama dengan loop harian.
+    D, EOQ, LT, hari = 1800.0, 360.0, 7.0, 300
+    d = D / simulasi.HARI_PER_TAHUN
+    daftar_ss = np.array([0.0, 10.0, 40.0])
+    hasil, _ = simulasi.simulasi_monte_carlo(D, EOQ, LT, daftar_ss, cv_permintaan=0.0, std_lead_time=0.0,
+                                            replikasi=20, hari=hari, n_proses=1)
+    for baris, ss in zip(hasil.itertuples(), daftar_ss):
+        level, dipesan, diterima = _loop_harian(d, EOQ, d * LT + ss, LT, ss, hari)
+        assert baris.ROP == pytest.approx(d * LT + ss)
+        assert baris.fill_rate == pytest.approx(np.minimum(d, level[:-1]).sum() / (d * hari))
+        assert baris.rata_rata_persediaan == pytest.approx(level[1:].mean())
+    assert hasil["fill_rate"].is_monotonic_increasing
+
+
+def test_monte_carlo_tidak_bergantung_jumlah_proses():
+    args = (1800.0, 360.0, 7.0, [0.0, 20.0])
+    satu, _ = simulasi.simulasi_monte_carlo(*args, replikasi=300, hari=120, n_proses=1, ukuran_blok=100)
+    dua, statistik = simulasi.simulasi_monte_carlo(*args, replikasi=300, hari=120, n_proses=2, ukuran_blok=100)
+    assert statistik["jumlah_proses"] == 2
+    np.testing.assert_allclose(satu.to_numpy(), dua.to_numpy())
@@ -0,0 +1,35 @@
+import numpy as np
+import pytest
+
+from mtk import antrian, simulasi_antrian
+
+
+def test_satu_server_sama_dengan_penjadwalan_event():
+    rng = np.random.default_rng(3)
+    datang = 5.0 + np.cumsum(rng.exponential(1 / 4, 2000))
+    layanan = rng.exponential(1 / 5, 2000)
+    mulai, selesai = simulasi_antrian._batch_satu_server(datang, layanan, 7.5)
+    mulai_heap, selesai_heap = simulasi_antrian._batch_multi_server(datang, layanan, [7.5])
+    np.testing.assert_allclose(mulai, mulai_heap)
+    np.testing.assert_allclose(selesai, selesai_heap)
+
+
+@pytest.mark.parametrize("n_server", [1, 2])
+def test_mendekati_analitik(n_server):
+    lam, mu = 3.0, 2.0 if n_server == 2 else 4.0
+    ringkasan, _ = simulasi_antrian.simulasi_antrian(lam, mu, n_server=n_server, n_pelanggan=200_000, seed=1)
+    analitik = antrian.mmc(lam, mu, n_server)
+    for baris in ringkasan.itertuples():
+        assert baris.simulasi == pytest.approx(float(analitik[baris.metrik]), rel=0.1)
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"n_pelanggan": 10, "n_batch": 20},
+    {"n_pelanggan": 1000, "pemanasan": 1.0},
+    {"n_pelanggan": 1000, "pemanasan": -0.1},
+    {"n_pelanggan": 1000, "n_batch": 1},
+    {"n_pelanggan": 1000, "n_server": 0},
+])
+def test_parameter_tidak_valid(kwargs):
+    with pytest.raises(ValueError):
+        simulasi_antrian.simulasi_antrian(1.0, 2.0, **kwargs)
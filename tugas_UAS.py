@@ -1,10 +1,25 @@
 import streamlit as st
 import numpy as np
-import matplotlib.pyplot as plt
-import io
+import os
+import tempfile
+
+from mtk import diagnostik, ui
+
+# Modul perhitungan dan grafik (beserta pandas/matplotlib) diimpor di dalam bagian
+# yang memakainya, sehingga judul, studi kasus dan input sudah tampil sebelum
+# pustaka berat selesai dimuat.
 
 st.set_page_config(page_title="Simulasi EOQ & ROP", layout="centered")
 
+# Diagnostik opt-in (panel di sidebar): satu pencatat per rerun. Pencatat yang
+# tertinggal dari rerun yang berhenti karena error ditutup dulu. Bila dimatikan,
+# setiap diagnostik.tahap(...) hanya mengembalikan context manager kosong.
+diagnostik.selesai()
+if st.session_state.get("diag_aktif", False):
+    diagnostik.Pencatat("tugas_UAS", ukur_memori=st.session_state.get("diag_memori", False),
+                        profiler=st.session_state.pop("diag_profil_berikutnya", None),
+                        path_log=os.environ.get("MTK_DIAGNOSTIK_LOG")).mulai()
+
 st.title("📦 Simulasi EOQ (Economic Order Quantity) & ROP (Reorder Point)")
 
 # Studi kasus
@@ -35,7 +50,28 @@ $$
 """)
 
 # Input variabel
-D = st.number_input("Permintaan Tahunan (D)", value=1800.0, min_value=1.0, help="Jumlah total unit yang diminta dalam setahun.")
+# D dan variasi permintaan bisa diambil dari arsip historis (lihat mtk.arsip): lookup
+# satu SKU hanya membaca ringkasan per SKU dari memory map, bukan data hariannya.
+statistik_arsip = None
+with st.expander("📂 Ambil permintaan dari arsip data historis (opsional)"):
+    path_arsip = st.text_input("Path arsip permintaan di server (dibangun dengan `python -m mtk arsip permintaan`)")
+    sku = st.text_input("SKU").strip()
+    if path_arsip and sku:
+        from mtk import arsip
+
+        try:
+            with diagnostik.tahap("baca arsip"):
+                statistik_arsip = arsip.statistik_permintaan(arsip.buka(path_arsip), sku)
+        except KeyError as e:
+            st.error(f"❌ {e.args[0]}")
+        except (OSError, ValueError) as e:
+            st.error(f"❌ {e}")
+        else:
+            st.caption(f"SKU {sku}: {statistik_arsip['n_hari']:,} hari data, rata-rata {statistik_arsip['rata_harian']:.2f} unit/hari, "
+                       f"simpangan baku {statistik_arsip['std_harian']:.2f} unit/hari. D dan koefisien variasi di bawah diisi dari arsip.")
+
+D = st.number_input("Permintaan Tahunan (D)", value=max(round(statistik_arsip["D"], 2), 1.0) if statistik_arsip else 1800.0, min_value=1.0,
+                    help="Jumlah total unit yang diminta dalam setahun.")
 S = st.number_input("Biaya Pemesanan per Order (S)", value=90000.0, min_value=1.0, help="Biaya yang dikeluarkan setiap kali melakukan pemesanan.")
 H = st.number_input("Biaya Penyimpanan per Unit per Tahun (H)", value=2500.0, min_value=1.0, help="Biaya untuk menyimpan satu unit barang selama satu tahun.")
 LT = st.number_input("Waktu Tunggu Pengiriman (Lead Time) dalam Hari", value=7.0, min_value=0.0, help="Jumlah hari yang dibutuhkan dari pemesanan hingga barang diterima.")
@@ -43,8 +79,12 @@ safety_stock = st.number_input("Stok Pengaman (Safety Stock)", value=0.0, min_va
 
 
 if D > 0 and S > 0 and H > 0:
-    # Perhitungan EOQ
-    EOQ = np.sqrt((2 * D * S) / H)
+    from mtk import persediaan
+
+    # Perhitungan EOQ dan ROP
+    with diagnostik.tahap("hitung EOQ"):
+        hasil_eoq = persediaan.hitung_eoq(D, S, H, LT, safety_stock)
+    EOQ = float(hasil_eoq["EOQ"])
 
     st.success(f"📊 Jumlah pemesanan optimal (EOQ): {EOQ:.2f} unit")
 
@@ -61,8 +101,8 @@ if D > 0 and S > 0 and H > 0:
     """ % (D, S, H, D, S, H, 2*D*S, H, EOQ))
 
     # Perhitungan ROP
-    permintaan_harian = D / 365 # Asumsi 365 hari dalam setahun
-    ROP = (permintaan_harian * LT) + safety_stock
+    permintaan_harian = D / persediaan.HARI_PER_TAHUN # Asumsi 365 hari dalam setahun
+    ROP = float(hasil_eoq["ROP"])
 
     st.success(f"📈 Titik Pemesanan Ulang (ROP): {ROP:.2f} unit")
 
@@ -82,107 +122,45 @@ if D > 0 and S > 0 and H > 0:
 
 
     # Grafik total biaya
-    # Pastikan Q memiliki nilai yang cukup untuk membuat grafik terlihat
-    Q_min = max(1, int(EOQ * 0.5)) # Mulai dari 50% EOQ
-    Q_max = int(EOQ * 2) # Sampai 200% EOQ
-    Q = np.arange(Q_min, Q_max + 1) # Tambahkan 1 agar Q_max termasuk
-
-    # Hindari pembagian dengan nol jika Q mengandung 0
-    Q_filtered = Q[Q > 0]
-
-    if len(Q_filtered) > 0:
-        TC = (D / Q_filtered) * S + (Q_filtered / 2) * H
-
-        fig, ax = plt.subplots(figsize=(8, 5)) # Ukuran grafik yang sedikit lebih besar
-        ax.plot(Q_filtered, TC, label="Total Biaya", color='blue')
-        ax.axvline(EOQ, color='red', linestyle='--', label=f"EOQ ≈ {EOQ:.0f}")
-        ax.set_xlabel("Jumlah Pemesanan (Q)")
-        ax.set_ylabel("Total Biaya (Rp)")
-        ax.set_title("Grafik Total Biaya vs Jumlah Pemesanan")
-        ax.legend()
-        ax.grid(True, linestyle='--', alpha=0.7) # Tambahkan grid
-
-        buf = io.BytesIO()
-        fig.savefig(buf, format="png", bbox_inches="tight")
-        st.image(buf, width=600) # Ukuran gambar yang sedikit lebih besar
-
-        st.markdown("""
-        ### 📝 Penjelasan:
-        - **Grafik Total Biaya:**
-            - Titik minimum pada grafik menunjukkan jumlah pemesanan optimal (EOQ), di mana total biaya persediaan (biaya pemesanan + biaya penyimpanan) adalah yang terendah.
-            - Di kiri EOQ: Terlalu sering memesan, menyebabkan biaya pemesanan tinggi.
-            - Di kanan EOQ: Jumlah persediaan yang disimpan besar, menyebabkan biaya penyimpanan tinggi.
-        """)
-    else:
-        st.warning("Rentang jumlah pemesanan (Q) tidak valid untuk grafik. Sesuaikan nilai input.")
+    # Jumlah titik kurva tetap (log-spaced di sekitar EOQ) dan PNG di-cache per (D, S, H),
+    # sehingga waktu pembuatan grafik tidak bergantung pada besarnya permintaan.
+    from mtk import grafik
+
+    with diagnostik.tahap("grafik biaya"):
+        st.image(grafik.png_kurva_biaya(D, S, H), width=600) # Ukuran gambar yang sedikit lebih besar
+
+    st.markdown("""
+    ### 📝 Penjelasan:
+    - **Grafik Total Biaya:**
+        - Titik minimum pada grafik menunjukkan jumlah pemesanan optimal (EOQ), di mana total biaya persediaan (biaya pemesanan + biaya penyimpanan) adalah yang terendah.
+        - Di kiri EOQ: Terlalu sering memesan, menyebabkan biaya pemesanan tinggi.
+        - Di kanan EOQ: Jumlah persediaan yang disimpan besar, menyebabkan biaya penyimpanan tinggi.
+    """)
 
     # --- Grafik Simulasi Tingkat Persediaan (ROP) ---
     st.markdown("### 📈 Simulasi Tingkat Persediaan")
 
     # Simulation parameters
-    sim_days = 90 # Simulate for 90 days
-    inventory_level = [EOQ + safety_stock] # Start with initial inventory (EOQ + safety stock)
-    days = [0]
-    orders_placed = []
-    orders_received = []
-    current_inventory = EOQ + safety_stock
-    order_in_transit = [] # Stores (arrival_day, quantity)
-
-    for day in range(1, sim_days + 1):
-        current_inventory -= permintaan_harian
-        
-        # Check for incoming orders
-        newly_received_orders = []
-        for i, (arrival_day, quantity) in enumerate(order_in_transit):
-            if day >= arrival_day:
-                current_inventory += quantity
-                newly_received_orders.append(i)
-                orders_received.append(day)
-        
-        # Remove received orders from in_transit list (iterate backwards to avoid index issues)
-        for i in sorted(newly_received_orders, reverse=True):
-            order_in_transit.pop(i)
-
-        # Check if ROP is hit and place an order
-        # Place an order if current inventory is at or below ROP AND no order is currently in transit
-        # This prevents multiple orders being placed for the same cycle if inventory stays low
-        if current_inventory <= ROP and not any(q > 0 for _, q in order_in_transit):
-            orders_placed.append(day)
-            order_arrival_day = day + LT
-            order_in_transit.append((order_arrival_day, EOQ))
-            
-        inventory_level.append(max(0, current_inventory)) # Inventory cannot go below zero
-        days.append(day)
-
-    fig_rop, ax_rop = plt.subplots(figsize=(10, 6))
-    ax_rop.plot(days, inventory_level, label="Tingkat Persediaan", color='green')
-    ax_rop.axhline(ROP, color='purple', linestyle=':', label=f"ROP = {ROP:.0f}")
-    ax_rop.axhline(0, color='black', linestyle='-', linewidth=0.8) # Zero inventory line
-
-    # Mark order placements and receipts
-    # Use a set to avoid duplicate labels in legend if multiple lines are plotted
-    labels_placed = set()
-    labels_received = set()
-
-    for op_day in orders_placed:
-        label = "Pemesanan Ditempatkan"
-        ax_rop.axvline(op_day, color='blue', linestyle='--', alpha=0.6, label=label if label not in labels_placed else "")
-        labels_placed.add(label)
-
-    for or_day in orders_received:
-        label = "Pemesanan Diterima"
-        ax_rop.axvline(or_day, color='orange', linestyle='--', alpha=0.6, label=label if label not in labels_received else "")
-        labels_received.add(label)
-
-    ax_rop.set_xlabel("Hari")
-    ax_rop.set_ylabel("Tingkat Persediaan (Unit)")
-    ax_rop.set_title("Simulasi Tingkat Persediaan dengan EOQ dan ROP")
-    ax_rop.legend()
-    ax_rop.grid(True, linestyle='--', alpha=0.7)
-
-    buf_rop = io.BytesIO()
-    fig_rop.savefig(buf_rop, format="png", bbox_inches="tight")
-    st.image(buf_rop, width=700)
+    sim_days = st.number_input("Lama Simulasi (hari)", value=90, min_value=1, max_value=5 * 365, help="Jumlah hari yang disimulasikan.")
+    from mtk import simulasi
+
+    with diagnostik.tahap("simulasi"):
+        hasil_sim = simulasi.simulasi_persediaan(permintaan_harian, EOQ, ROP, LT, safety_stock, hari=int(sim_days))
+
+    days = hasil_sim.hari
+    inventory_level = hasil_sim.level[:, 0]
+    orders_placed = days[hasil_sim.dipesan[:, 0]]
+    orders_received = days[hasil_sim.diterima[:, 0]]
+
+    # Mode interaktif digambar di browser (Vega-Lite): server hanya mengirim data dan
+    # zoom/geser tidak memicu rerun. Mode PNG dirender di server dan di-cache per input.
+    jenis_grafik = st.radio("Tampilan grafik", ["Interaktif (browser)", "Gambar PNG"], horizontal=True)
+    with diagnostik.tahap("grafik"):
+        if jenis_grafik == "Gambar PNG":
+            st.image(grafik.png_jejak_persediaan(days, inventory_level, orders_placed, orders_received, ROP), width=700)
+        else:
+            st.vega_lite_chart(*grafik.vega_jejak_persediaan(days, inventory_level, orders_placed, orders_received, ROP),
+                               width="stretch")
 
     st.markdown("""
     - **Grafik Simulasi Tingkat Persediaan:**
@@ -192,5 +170,71 @@ if D > 0 and S > 0 and H > 0:
         - Garis vertikal oranye putus-putus menunjukkan hari di mana pesanan yang ditempatkan sebelumnya diterima.
     """)
 
+    # --- Simulasi Monte Carlo (permintaan & lead time acak) ---
+    st.markdown("### 🎲 Simulasi Monte Carlo: Pemilihan Stok Pengaman")
+    st.markdown("Permintaan harian dan lead time dibuat acak sehingga pengaruh stok pengaman terhadap risiko kehabisan stok terlihat. "
+                "Setiap kandidat stok pengaman diuji dengan ribuan replikasi.")
+
+    col1, col2 = st.columns(2)
+    with col1:
+        cv_arsip = statistik_arsip["std_harian"] / statistik_arsip["rata_harian"] if statistik_arsip and statistik_arsip["rata_harian"] > 0 else None
+        cv_permintaan = st.number_input("Koefisien Variasi Permintaan Harian", value=round(cv_arsip, 3) if cv_arsip is not None else 0.3,
+                                        min_value=0.0, help="Simpangan baku permintaan harian dibagi rata-ratanya.")
+        std_lead_time = st.number_input("Simpangan Baku Lead Time (hari)", value=1.0, min_value=0.0)
+        replikasi = st.number_input("Jumlah Replikasi", value=2000, min_value=100, step=100)
+    with col2:
+        ss_min = st.number_input("Stok Pengaman Minimum", value=0.0, min_value=0.0)
+        ss_max = st.number_input("Stok Pengaman Maksimum", value=float(max(1, round(permintaan_harian * LT))), min_value=0.0)
+        ss_n = st.number_input("Jumlah Kandidat", value=11, min_value=1, max_value=200)
+
+    if st.button("🎲 Jalankan Simulasi Monte Carlo"):
+        with diagnostik.tahap("simulasi monte carlo"):
+            hasil_mc, statistik_mc = simulasi.simulasi_monte_carlo(
+                D, EOQ, LT, np.linspace(ss_min, ss_max, int(ss_n)), cv_permintaan=cv_permintaan,
+                std_lead_time=std_lead_time, replikasi=int(replikasi), hari=int(sim_days))
+
+        st.success(f"✅ {int(replikasi):,} replikasi x {int(ss_n)} kandidat selesai dalam {statistik_mc['durasi_detik']:.2f} detik "
+                   f"({statistik_mc['jumlah_proses']} proses).")
+        st.dataframe(hasil_mc.style.format({"fill_rate": "{:.2%}", "prob_kehabisan": "{:.2%}"}))
+        st.line_chart(hasil_mc, x="safety_stock", y=["fill_rate", "prob_kehabisan"])
+
 else:
     st.warning("Masukkan nilai D, S, dan H yang valid (semua harus > 0).")
+
+# --- Mode Katalog: EOQ & ROP untuk banyak item sekaligus ---
+st.markdown("### 📂 Mode Katalog (Banyak Item)")
+st.markdown("Unggah katalog CSV atau Parquet dengan kolom `D`, `S`, `H` serta opsional `LT` (hari) dan `safety_stock`. "
+            "File diproses per bagian sehingga katalog besar tetap hemat memori.")
+file_katalog = st.file_uploader("File katalog", type=["csv", "parquet"])
+
+# Katalog hanya diproses saat tombol ditekan; rerun lain (mengubah D/S/H, simulasi)
+# tidak membaca ulang file yang bisa berisi jutaan baris.
+if st.button("📊 Hitung EOQ Katalog"):
+    if file_katalog is None:
+        st.error("❌ Unggah file katalog terlebih dahulu.")
+    else:
+        from mtk import persediaan
+
+        format_file = "parquet" if file_katalog.name.endswith(".parquet") else "csv"
+        with tempfile.NamedTemporaryFile(suffix="." + format_file, delete=False) as f:
+            path_hasil = f.name
+        try:
+            with diagnostik.tahap("hitung katalog EOQ"):
+                jumlah = persediaan.proses_katalog(file_katalog, path_hasil, format_file)
+        except ValueError as e:
+            st.error(f"❌ {e}")
+        else:
+            st.success(f"✅ EOQ dan ROP dihitung untuk {jumlah:,} item.")
+            st.dataframe(next(persediaan.baca_katalog(path_hasil, format_file, ukuran_chunk=100)))
+            with open(path_hasil, "rb") as f:
+                st.download_button("⬇️ Unduh Hasil", f.read(), file_name=f"hasil_eoq.{format_file}")
+        finally:
+            os.remove(path_hasil)
+
+pencatat = diagnostik.selesai()
+if pencatat is not None:
+    ui.simpan_riwayat(pencatat)
+
+# Panel diagnostik yang sama dengan aplikasi lain (lihat mtk.ui). Set
+# MTK_DIAGNOSTIK_LOG=path.jsonl agar setiap ringkasan juga ditulis sebagai log JSON Lines.
+ui.panel_diagnostik()